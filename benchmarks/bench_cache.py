@@ -0,0 +1,89 @@
+"""
+Benchmark: ContentBlockManager with no cache, LRUCache and SQLiteCache.
+
+Parses synthetic products once, then applies the content blocks to all of
+them: without a cache (recompute), and with each cache backend on a cold
+pass (every block misses and is stored) followed by a warm pass (every
+block hits), which is a nightly re-run over an unchanged catalog. For
+SQLite a third pass re-runs the catalog with 5% of the products repriced,
+so only their price block is recomputed. Each pass keeps the fastest of
+--rounds runs. The SQLite file lives in a temporary directory and is
+reopened for each pass, as a new process would; SQLite timings include
+close(), which commits buffered writes.
+
+Usage:
+    python benchmarks/bench_cache.py [--products 500] [--rounds 3]
+"""
+import sys
+import os
+import argparse
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.agents.parser_agent import ParserAgent
+from src.logic_blocks.manager import ContentBlockManager
+from src.utils.cache import LRUCache, SQLiteCache
+from synthetic import generate_products
+
+def apply_all(manager, products):
+    """Seconds to apply every block to every product"""
+    start = time.perf_counter()
+    for product in products:
+        manager.apply_blocks(product)
+    return time.perf_counter() - start
+
+def sqlite_pass(path, products):
+    """Seconds for one pass on a freshly opened SQLiteCache, including close(); and its stats"""
+    start = time.perf_counter()
+    cache = SQLiteCache(path)
+    manager = ContentBlockManager(cache=cache)
+    for product in products:
+        manager.apply_blocks(product)
+    stats = manager.cache_stats()
+    cache.close()
+    return time.perf_counter() - start, stats
+
+def run(count, rounds):
+    parser = ParserAgent()
+    rows = list(generate_products(count))
+    products = [parser.process(row) for row in rows]
+    nightly = [
+        parser.process(dict(row, Price=row["Price"] + "0")) if index % 20 == 0 else product
+        for index, (row, product) in enumerate(zip(rows, products))
+    ]
+    timings = {}
+
+    timings["no cache"] = min(apply_all(ContentBlockManager(), products) for _ in range(rounds))
+
+    cold, warm = [], []
+    for _ in range(rounds):
+        manager = ContentBlockManager(cache=LRUCache(max_entries=count * 10))
+        cold.append(apply_all(manager, products))
+        warm.append(apply_all(manager, products))
+    timings["LRUCache cold"], timings["LRUCache warm"] = min(cold), min(warm)
+
+    cold, warm, changed = [], [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        for index in range(rounds):
+            path = os.path.join(tmp, f"blocks-{index}.sqlite")
+            cold.append(sqlite_pass(path, products)[0])
+            elapsed, stats = sqlite_pass(path, products)
+            assert stats["misses"] == 0
+            warm.append(elapsed)
+            changed.append(sqlite_pass(path, nightly)[0])
+    timings["SQLiteCache cold"], timings["SQLiteCache warm"] = min(cold), min(warm)
+    timings["SQLiteCache 5% chg"] = min(changed)
+
+    print(f"Products: {count:,} (best of {rounds})")
+    for name, elapsed in timings.items():
+        print(f"{name:<18} {elapsed / count * 1e6:>8.1f} µs/product   "
+              f"{timings['no cache'] / elapsed:>5.2f}x vs recompute")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--products", type=int, default=500)
+    arg_parser.add_argument("--rounds", type=int, default=3, help="Runs per pass; the fastest is kept")
+    args = arg_parser.parse_args()
+    run(args.products, args.rounds)
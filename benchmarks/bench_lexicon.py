@@ -0,0 +1,77 @@
+"""
+Benchmark: lexicon start-up and lookup cost, JSON vs binary index.
+
+Generates a synthetic ingredient lexicon, then measures the time to make it
+usable (parse JSON / open the index with and without mmap) and the lookup
+rate for normalized terms and aliases.
+
+Usage:
+    python benchmarks/bench_lexicon.py [--entries 50000] [--lookups 100000]
+"""
+import sys
+import os
+import argparse
+import json
+import random
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.logic_blocks.lexicon import Lexicon, LexiconIndex, build_index
+
+def make_entries(count):
+    return {
+        f"Ingredient {i}": {
+            "aliases": [f"INCI Name {i}", f"ingredient-{i}"],
+            "benefit": f"Benefit text for ingredient {i}",
+            "purpose": "Key active ingredient",
+            "key_feature": "Essential component"
+        }
+        for i in range(count)
+    }
+
+def time_lookups(lexicon, terms):
+    start = time.perf_counter()
+    for term in terms:
+        lexicon.get(term)
+    return len(terms) / (time.perf_counter() - start)
+
+def run(entries, lookups):
+    rng = random.Random(0)
+    terms = [
+        rng.choice([f"ingredient {i}", f"  INCI  name {i}", f"Ingredient-{i}", f"missing {i}"])
+        for i in (rng.randrange(entries) for _ in range(lookups))
+    ]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "ingredients.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(make_entries(entries), f)
+        
+        start = time.perf_counter()
+        index_path = build_index(json_path)
+        build_time = time.perf_counter() - start
+        
+        print(f"Entries: {entries:,}   JSON {os.path.getsize(json_path) / 1e6:.1f} MB   "
+              f"index {os.path.getsize(index_path) / 1e6:.1f} MB (built in {build_time:.2f}s)")
+        
+        loaders = (
+            ("json", lambda: Lexicon.from_json(json_path)),
+            ("index", lambda: LexiconIndex(index_path, use_mmap=False)),
+            ("index+mmap", lambda: LexiconIndex(index_path, use_mmap=True)),
+        )
+        for label, load in loaders:
+            start = time.perf_counter()
+            lexicon = load()
+            load_time = time.perf_counter() - start
+            rate = time_lookups(lexicon, terms)
+            print(f"{label:<11} load {load_time * 1000:>8.2f} ms   {rate:>10,.0f} lookups/s")
+            if isinstance(lexicon, LexiconIndex):
+                lexicon.close()
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--entries", type=int, default=50000)
+    arg_parser.add_argument("--lookups", type=int, default=100000)
+    args = arg_parser.parse_args()
+    run(args.entries, args.lookups)
@@ -0,0 +1,73 @@
+"""
+Benchmark: per-row ParserAgent.validate vs the columnar ParserAgent.process_batch.
+
+Rows come from the synthetic catalog generator, so list cells (skin types,
+ingredients, benefits) repeat the way they do in a real feed. Each round
+times both paths, alternating which goes first; results are dropped and
+collected between runs so neither path pays for the other's live objects.
+The fastest of the rounds is reported for each path.
+
+With --no-gc both paths run with the cyclic garbage collector disabled, as a
+caller parsing a big feed in one go might do.
+
+Usage:
+    python benchmarks/bench_parser.py [--rows 100000] [--rounds 5] [--no-gc]
+"""
+import sys
+import os
+import argparse
+import gc
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.agents.parser_agent import ParserAgent
+from synthetic import generate_products
+
+def timed(function, disable_gc):
+    """Seconds for one call; the result is freed before returning"""
+    gc.collect()
+    if disable_gc:
+        gc.disable()
+    try:
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    del result
+    gc.collect()
+    return elapsed
+
+def run(count, rounds=5, disable_gc=False):
+    rows = list(generate_products(count))
+    parser = ParserAgent()
+
+    # Same output before timing anything
+    sample = rows[:1000]
+    assert [p.model_dump(exclude={"timestamp"}) for p in parser.process_batch(sample)] == \
+           [parser.validate(row).model_dump(exclude={"timestamp"}) for row in sample]
+
+    paths = {
+        "per-row": lambda: [parser.validate(row) for row in rows],
+        "columnar": lambda: parser.process_batch(rows)
+    }
+    best = {name: float("inf") for name in paths}
+
+    for round_index in range(rounds):
+        order = list(paths) if round_index % 2 == 0 else list(reversed(list(paths)))
+        for name in order:
+            best[name] = min(best[name], timed(paths[name], disable_gc))
+
+    print(f"Rows:      {count:,} (best of {rounds}, gc {'off' if disable_gc else 'on'})")
+    print(f"Per-row:   {best['per-row']:.3f}s ({count / best['per-row']:,.0f} rows/s)")
+    print(f"Columnar:  {best['columnar']:.3f}s ({count / best['columnar']:,.0f} rows/s)")
+    print(f"Speedup:   {best['per-row'] / best['columnar']:.2f}x")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--rows", type=int, default=100_000)
+    arg_parser.add_argument("--rounds", type=int, default=5, help="Timed runs per path; the fastest is kept")
+    arg_parser.add_argument("--no-gc", action="store_true", help="Disable cyclic GC while timing")
+    args = arg_parser.parse_args()
+    run(args.rows, args.rounds, args.no_gc)
@@ -0,0 +1,130 @@
+"""
+Benchmark: end-to-end pipeline and per-stage timings at several catalog sizes.
+
+For each size the full DAG runs over synthetic products three ways:
+    1. untraced, for end-to-end throughput
+    2. traced, for per-stage latency (parser, question generator, every
+       logic block, every template render) via the orchestrator's tracer
+    3. under tracemalloc, for peak memory (skip with --no-memory)
+
+Results are written as JSON so two commits can be compared:
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sizes 1 1000 100000] [--output results.json]
+    python benchmarks/bench_pipeline.py --sizes 1000 --compare baseline.json
+"""
+import sys
+import os
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import generate_products
+from src.orchestration.workflow import build_content_workflow
+from src.utils.tracing import Tracer, HistogramExporter
+
+def run_untraced(size, seed):
+    orchestrator = build_content_workflow()
+    start = time.perf_counter()
+    for _ in orchestrator.execute_many(generate_products(size, seed), stop_on_error=True):
+        pass
+    return time.perf_counter() - start
+
+def run_traced(size, seed):
+    histogram = HistogramExporter(percentiles=(50, 90, 99))
+    orchestrator = build_content_workflow(tracer=Tracer(histogram))
+    for _ in orchestrator.execute_many(generate_products(size, seed), stop_on_error=True):
+        pass
+    return histogram.summary()
+
+def run_memory(size, seed):
+    orchestrator = build_content_workflow()
+    tracemalloc.start()
+    for _ in orchestrator.execute_many(generate_products(size, seed), stop_on_error=True):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def git_commit(cwd=None):
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(sizes, seed, measure_memory):
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed
+        },
+        "results": {}
+    }
+
+    for size in sizes:
+        elapsed = run_untraced(size, seed)
+        result = {
+            "products": size,
+            "total_s": elapsed,
+            "products_per_s": size / elapsed,
+            "stages": run_traced(size, seed)
+        }
+        if measure_memory:
+            result["peak_mb"] = run_memory(size, seed) / 1e6
+        report["results"][str(size)] = result
+
+        memory = f"   peak {result['peak_mb']:.1f} MB" if measure_memory else ""
+        print(f"\n{size:,} products: {elapsed:.2f}s, {result['products_per_s']:,.0f} products/s{memory}")
+        print(f"   {'stage':<36} {'p50 ms':>9} {'p99 ms':>9} {'total ms':>10}")
+        for category in ("workflow", "node", "block", "template"):
+            for name, stats in result["stages"].get(category, {}).items():
+                print(f"   {category + '/' + name:<36} {stats['p50_ms']:>9.3f} "
+                      f"{stats['p99_ms']:>9.3f} {stats['total_ms']:>10.1f}")
+
+    return report
+
+def compare(report, baseline):
+    """Print the relative change of each stage's p50 against a previous report"""
+    print(f"\nComparison with {baseline['meta'].get('commit') or 'baseline'} (p50, negative = faster)")
+    for size, result in report["results"].items():
+        previous = baseline["results"].get(size)
+        if previous is None:
+            continue
+        change = result["products_per_s"] / previous["products_per_s"] - 1
+        print(f"   {int(size):,} products: throughput {change:+.1%}")
+        for category, stages in result["stages"].items():
+            for name, stats in stages.items():
+                old = previous["stages"].get(category, {}).get(name)
+                if old and old["p50_ms"]:
+                    delta = stats["p50_ms"] / old["p50_ms"] - 1
+                    print(f"      {category + '/' + name:<36} {delta:+.1%}")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000, 100000])
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    arg_parser.add_argument("--output", default="bench_pipeline.json",
+                            help="Where to write the machine-readable results")
+    arg_parser.add_argument("--compare", metavar="BASELINE", help="Results file from an earlier run")
+    args = arg_parser.parse_args()
+
+    report = run(args.sizes, args.seed, not args.no_memory)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
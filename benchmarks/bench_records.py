@@ -0,0 +1,65 @@
+"""
+Benchmark: pydantic models vs slots-backed records on the agent hot path.
+
+Measures per-product allocation (tracemalloc) and throughput for parsing,
+question generation and the question -> dict conversion templates consume.
+
+Usage:
+    python benchmarks/bench_records.py [--products 2000]
+"""
+import sys
+import os
+import argparse
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.parser_agent import ParserAgent
+from src.agents.question_generator_agent import QuestionGeneratorAgent
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+def run_pipeline(rows, compact):
+    parser = ParserAgent(compact=compact)
+    question_gen = QuestionGeneratorAgent(compact=compact)
+    kept = []
+    for row in rows:
+        product = parser.process(row)
+        questions = question_gen.process(product)
+        kept.append((product, questions, [q.model_dump() for q in questions]))
+    return kept
+
+def measure(rows, compact):
+    start = time.perf_counter()
+    run_pipeline(rows, compact)
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    kept = run_pipeline(rows, compact)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed, current, peak
+
+def run(count):
+    rows = [dict(RAW_DATA, **{"Product Name": f"GlowBoost Variant {i}"}) for i in range(count)]
+    
+    print(f"Products: {count:,}")
+    for label, compact in (("pydantic", False), ("records", True)):
+        elapsed, current, peak = measure(rows, compact)
+        print(f"{label:<9} {count / elapsed:>9,.0f} products/s   "
+              f"{current / count:>8,.0f} B retained/product   peak {peak / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--products", type=int, default=2000)
+    run(arg_parser.parse_args().products)
@@ -0,0 +1,56 @@
+"""
+Benchmark: JSON serializer backends on real workflow output.
+
+Runs the workflow once, then encodes its results (three pages plus
+metadata) repeatedly with every installed backend in compact and pretty
+mode.
+
+Usage:
+    python benchmarks/bench_serializers.py [--iterations 2000]
+"""
+import sys
+import os
+import argparse
+import contextlib
+import io
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.orchestration.workflow import build_content_workflow
+from src.utils.serializers import available_serializers, get_serializer
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+def run(iterations):
+    # Agents print per node; keep that out of the output
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = build_content_workflow().execute({"initial_data": RAW_DATA})
+    
+    print(f"Encoding one product's results {iterations:,} times")
+    for name, available in available_serializers().items():
+        if not available:
+            print(f"{name:<8} not installed")
+            continue
+        serializer = get_serializer(name)
+        for pretty in (False, True):
+            size = len(serializer.dumps(results, pretty=pretty))
+            start = time.perf_counter()
+            for _ in range(iterations):
+                serializer.dumps(results, pretty=pretty)
+            elapsed = time.perf_counter() - start
+            mode = "pretty" if pretty else "compact"
+            print(f"{name:<8} {mode:<8} {elapsed / iterations * 1e6:>8.1f} µs/product   {size:,} bytes")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--iterations", type=int, default=2000)
+    run(arg_parser.parse_args().iterations)
@@ -0,0 +1,86 @@
+"""
+Benchmark: request latency of the long-lived content service.
+
+Starts the service in this process on a free localhost port, then over one
+keep-alive connection sends synthetic products one per request and in
+batches. Reports client-side latency percentiles per request and per
+product next to the server's own /metrics. Compare with the cold start
+of one CLI job in bench_startup.py.
+
+Usage:
+    python benchmarks/bench_service.py [--requests 500] [--batch-size 50] [--serializer auto]
+"""
+import sys
+import os
+import argparse
+import json
+import threading
+import time
+from http.client import HTTPConnection
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import generate_products
+from src.service.server import make_server
+
+def percentile(sorted_values, percentile):
+    # Nearest-rank, as HistogramExporter
+    rank = max(1, -(-percentile * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+def post(conn, payload):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    start = time.perf_counter()
+    conn.request("POST", "/generate", body=body, headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    response.read()
+    elapsed = time.perf_counter() - start
+    if response.status != 200:
+        raise RuntimeError(f"POST /generate returned {response.status}")
+    return elapsed
+
+def report(label, latencies, products_per_request):
+    latencies = sorted(latencies)
+    total = sum(latencies)
+    print(f"{label}: {len(latencies)} requests, {len(latencies) * products_per_request / total:,.0f} products/s")
+    print(f"   per request  p50 {percentile(latencies, 50) * 1e3:8.3f} ms"
+          f"   p90 {percentile(latencies, 90) * 1e3:8.3f} ms   p99 {percentile(latencies, 99) * 1e3:8.3f} ms")
+    print(f"   per product  p50 {percentile(latencies, 50) * 1e3 / products_per_request:8.3f} ms")
+
+def run(requests, batch_size, serializer):
+    server = make_server(("127.0.0.1", 0), serializer=serializer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    conn = HTTPConnection(*server.server_address)
+
+    try:
+        products = list(generate_products(max(requests, batch_size)))
+        # Warm-up: first requests pay lazy imports and cache fills
+        for product in products[:20]:
+            post(conn, product)
+        server.service.reset_metrics()
+
+        report("Single product", [post(conn, products[i]) for i in range(requests)], 1)
+
+        batches = max(1, requests // batch_size)
+        report(f"Batches of {batch_size}",
+               [post(conn, products[:batch_size]) for _ in range(batches)], batch_size)
+
+        conn.request("GET", "/metrics")
+        metrics = json.loads(conn.getresponse().read())
+        print("\nServer /metrics latency (ms)")
+        for route, stats in metrics["latency"].items():
+            print(f"   {route:<26} count {stats['count']:>6}   p50 {stats['p50_ms']:8.3f}"
+                  f"   p90 {stats['p90_ms']:8.3f}   p99 {stats['p99_ms']:8.3f}")
+    finally:
+        conn.close()
+        server.shutdown()
+        server.server_close()
+        server.service.close()
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--requests", type=int, default=500)
+    arg_parser.add_argument("--batch-size", type=int, default=50)
+    arg_parser.add_argument("--serializer", default="auto")
+    args = arg_parser.parse_args()
+    run(args.requests, args.batch_size, args.serializer)
@@ -0,0 +1,173 @@
+"""
+Benchmark: cold start of the CLI, for short-lived per-job invocations.
+
+Every measurement runs in a fresh interpreter under ``python -X importtime``:
+    1. the bare interpreter (``-c pass``), the floor no change can go below
+    2. ``import main``, the cost of loading the CLI module itself
+    3. the default job (``main.py -q``)
+    4. a feed job (``main.py --feed``) over a small synthetic feed
+
+Each is repeated and the fastest wall time is kept. Import time is the sum
+of the top-level ``-X importtime`` entries; the slowest imports of the
+default job are listed, and heavy dependencies that were loaded are flagged.
+Jobs run in a temporary directory, so the repo's output/ is not touched.
+
+--tree measures another checkout's main.py with this script, so gains can
+be stated against an older tree (a tree whose main.py has no --feed option
+skips the feed job):
+
+    git worktree add /tmp/baseline <commit>
+    python benchmarks/bench_startup.py --tree /tmp/baseline --output baseline.json
+    python benchmarks/bench_startup.py --compare baseline.json
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5] [--top 15] [--output startup.json]
+    python benchmarks/bench_startup.py --tree CHECKOUT [--output baseline.json]
+    python benchmarks/bench_startup.py --compare baseline.json
+"""
+import sys
+import os
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import generate_products
+from bench_pipeline import git_commit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies a plain job should not need to load
+HEAVY_MODULES = ("pydantic", "asyncio", "multiprocessing", "sqlite3")
+
+def parse_importtime(stderr):
+    """
+    Parse ``-X importtime`` output.
+
+    Returns:
+        (total_us, modules): summed cumulative time of top-level imports, and
+        {module: (self_us, cumulative_us)} for every module imported
+    """
+    total_us = 0
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # One space after the bar for top-level imports, two more per nesting level
+        if len(name) - len(name.lstrip()) == 1:
+            total_us += int(cumulative_us)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return total_us, modules
+
+def measure(args, cwd, repeat):
+    """Run ``python -X importtime <args>`` repeat times; keep the fastest run"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            cwd=cwd, capture_output=True, text=True, check=True
+        )
+        wall = time.perf_counter() - start
+        if best is None or wall < best[0]:
+            best = (wall, completed.stderr)
+
+    wall, stderr = best
+    import_us, modules = parse_importtime(stderr)
+    return {
+        "wall_ms": wall * 1e3,
+        "import_ms": import_us / 1e3,
+        "modules": modules
+    }
+
+def write_feed(path, products):
+    with open(path, "w", encoding="utf-8") as f:
+        for product in generate_products(products):
+            f.write(json.dumps(product, ensure_ascii=False) + "\n")
+
+def run(repeat, top, feed_products, tree=ROOT):
+    main = os.path.join(tree, "main.py")
+    with open(main, encoding="utf-8") as f:
+        supports_feed = "--feed" in f.read()
+
+    report = {
+        "meta": {
+            "commit": git_commit(tree),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat
+        },
+        "results": {}
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        feed_path = os.path.join(workdir, "feed.jsonl")
+        write_feed(feed_path, feed_products)
+
+        cases = {
+            "interpreter": ["-c", "pass"],
+            "import main": ["-c", "import main"],
+            "default job": [main, "-q"]
+        }
+        if supports_feed:
+            cases[f"feed job ({feed_products} products)"] = [
+                main, "--feed", feed_path, "--output-dir", os.path.join(workdir, "catalog")
+            ]
+        measured = {}
+        for name, args in cases.items():
+            # `import main` resolves against the measured tree, not the job directory
+            measured[name] = measure(args, tree if name == "import main" else workdir, repeat)
+
+    print(f"{'case':<28} {'wall ms':>9} {'imports ms':>11}   heavy modules loaded")
+    for name, result in measured.items():
+        loaded = [module for module in HEAVY_MODULES if module in result["modules"]]
+        print(f"{name:<28} {result['wall_ms']:>9.1f} {result['import_ms']:>11.1f}   {', '.join(loaded) or '-'}")
+        report["results"][name] = {
+            "wall_ms": result["wall_ms"],
+            "import_ms": result["import_ms"],
+            "heavy_modules": loaded
+        }
+
+    slowest = sorted(measured["default job"]["modules"].items(), key=lambda item: item[1][0], reverse=True)
+    print(f"\nSlowest imports of the default job (self time)")
+    print(f"   {'module':<44} {'self ms':>9} {'cumulative ms':>14}")
+    for module, (self_us, cumulative_us) in slowest[:top]:
+        print(f"   {module:<44} {self_us / 1e3:>9.2f} {cumulative_us / 1e3:>14.2f}")
+
+    return report
+
+def compare(report, baseline):
+    """Print the relative change of each case's wall time against a previous report"""
+    print(f"\nComparison with {baseline['meta'].get('commit') or 'baseline'} (wall time, negative = faster)")
+    for name, result in report["results"].items():
+        previous = baseline["results"].get(name)
+        if previous:
+            print(f"   {name:<28} {previous['wall_ms']:>7.1f} ms -> {result['wall_ms']:>7.1f} ms"
+                  f"   {result['wall_ms'] / previous['wall_ms'] - 1:+.1%}")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Runs per case; the fastest is kept")
+    arg_parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    arg_parser.add_argument("--feed-products", type=int, default=20)
+    arg_parser.add_argument("--output", default="bench_startup.json",
+                            help="Where to write the machine-readable results")
+    arg_parser.add_argument("--compare", metavar="BASELINE", help="Results file from an earlier run")
+    arg_parser.add_argument("--tree", default=ROOT, help="Checkout whose main.py is measured (default: this one)")
+    args = arg_parser.parse_args()
+
+    report = run(args.repeat, args.top, args.feed_products, os.path.abspath(args.tree))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
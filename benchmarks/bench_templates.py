@@ -0,0 +1,76 @@
+"""
+Benchmark: render cost of each page template.
+
+Prepares one product's template inputs (parser, question generator and
+content blocks), then renders every template repeatedly. Each round times
+all templates; the fastest round is reported per template. Output is
+discarded, so the numbers are comparable across trees that print while
+rendering.
+
+Usage:
+    python benchmarks/bench_templates.py [--renders 20000] [--rounds 5]
+"""
+import sys
+import os
+import argparse
+import contextlib
+import io
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.parser_agent import ParserAgent
+from src.agents.question_generator_agent import QuestionGeneratorAgent
+from src.logic_blocks.manager import ContentBlockManager
+from src.templates.manager import TemplateManager
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+def template_data():
+    product = ParserAgent().process(RAW_DATA)
+    product_info = {
+        "name": product.name,
+        "concentration": product.concentration,
+        "skin_type": product.skin_type,
+        "price": product.price
+    }
+    return {
+        "product_info": product_info,
+        "questions": [q.model_dump() for q in QuestionGeneratorAgent().process(product)],
+        "content_blocks": ContentBlockManager().apply_blocks(product),
+        "product_a": dict(product_info)
+    }
+
+def run(renders, rounds):
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = template_data()
+        templates = TemplateManager().templates
+
+    best = {name: float("inf") for name in templates}
+    for _ in range(rounds):
+        for name, template in templates.items():
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                for _ in range(renders):
+                    template.render(data)
+                elapsed = time.perf_counter() - start
+            best[name] = min(best[name], elapsed)
+
+    print(f"Renders: {renders:,} per template (best of {rounds})")
+    for name, elapsed in best.items():
+        print(f"{name:<16} {elapsed / renders * 1e6:>7.2f} µs/render")
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--renders", type=int, default=20000)
+    arg_parser.add_argument("--rounds", type=int, default=5, help="Timed rounds; the fastest is kept")
+    args = arg_parser.parse_args()
+    run(args.renders, args.rounds)
@@ -0,0 +1,65 @@
+"""
+Synthetic product generator for benchmarks.
+
+Produces realistic variants of the GlowBoost sample record: names,
+concentrations, skin types, ingredients, benefits, usage, side effects and
+prices are drawn from small vocabularies so the logic blocks hit both their
+known and fallback branches. Generation is deterministic for a given seed.
+"""
+import random
+from typing import Any, Dict, Iterator
+
+BRANDS = ["GlowBoost", "HydraGlow", "DermaPure", "LumiSkin", "VelvetLab", "PureAura"]
+FORMATS = ["Serum", "Essence", "Cream", "Gel", "Toner", "Ampoule"]
+ACTIVES = [
+    ("Vitamin C", ["5%", "10%", "15%", "20%"]),
+    ("Niacinamide", ["2%", "5%", "10%"]),
+    ("Hyaluronic Acid", ["1%", "2%"]),
+    ("Retinol", ["0.1%", "0.3%", "0.5%"]),
+    ("Salicylic Acid", ["0.5%", "1%", "2%"])
+]
+SUPPORTING = ["Hyaluronic Acid", "Vitamin E", "Ceramides", "Panthenol", "Squalane", "Green Tea Extract"]
+SKIN_TYPES = ["Oily", "Combination", "Dry", "Normal", "Sensitive"]
+BENEFITS = [
+    "Brightening", "Fades dark spots", "Hydration", "Reduces fine lines",
+    "Controls oil", "Soothes redness", "Evens skin tone"
+]
+USAGE = [
+    "Apply 2–3 drops in the morning before sunscreen",
+    "Apply 3–4 drops at night after cleansing",
+    "Use a pea-sized amount every evening",
+    "Apply to damp skin morning and night, follow with moisturizer"
+]
+SIDE_EFFECTS = [
+    "Mild tingling for sensitive skin",
+    "May cause dryness in the first week",
+    "Possible redness; patch test before use",
+    "None reported"
+]
+
+def generate_product(index: int, rng: random.Random) -> Dict[str, Any]:
+    """One raw product dict with the parser's human-readable keys"""
+    active, strengths = rng.choice(ACTIVES)
+    extras = rng.sample([name for name in SUPPORTING if name != active], rng.randint(1, 3))
+    return {
+        "Product Name": f"{rng.choice(BRANDS)} {active} {rng.choice(FORMATS)} {index}",
+        "Concentration": f"{rng.choice(strengths)} {active}",
+        "Skin Type": ", ".join(rng.sample(SKIN_TYPES, rng.randint(1, 3))),
+        "Key Ingredients": ", ".join([active, *extras]),
+        "Benefits": ", ".join(rng.sample(BENEFITS, rng.randint(1, 3))),
+        "How to Use": rng.choice(USAGE),
+        "Side Effects": rng.choice(SIDE_EFFECTS),
+        "Price": f"₹{rng.randrange(299, 2999, 50)}"
+    }
+
+def generate_products(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily generate ``count`` synthetic products.
+
+    Args:
+        count: Number of products
+        seed: Random seed; the same seed always yields the same catalog
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        yield generate_product(index, rng)
@@ -6,13 +6,18 @@ Main entry point for the workflow.
 import json
 import os
 from datetime import datetime
-from src.agents.parser_agent import ParserAgent
-from src.agents.question_generator_agent import QuestionGeneratorAgent
-from src.logic_blocks.manager import ContentBlockManager
-from src.templates.manager import TemplateManager
-from src.orchestration.dag import DAGOrchestrator
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from src.orchestration.workflow import build_content_workflow
+from src.utils.output import BundleSink, FileSink, PageStreamWriter, FSYNC_POLICIES, PAGE_LAYOUTS
+from src.utils.serializers import SERIALIZERS, get_serializer
+from src.utils.tracing import Tracer, HistogramExporter, JSONLinesExporter, ChromeTraceExporter
+from src.utils.logging_config import configure_logging
 
-def run_complete_workflow():
+DEFAULT_STATE_PATH = os.path.join("output", ".cache", "workflow_state.sqlite")
+
+def run_complete_workflow(incremental: bool = False, state_path: str = DEFAULT_STATE_PATH,
+                          serializer: str = "auto", fsync: str = "batch",
+                          tracer: Optional[Tracer] = None):
     """
     Run the complete multi-agent workflow:
     1. Parse product data
@@ -20,6 +25,14 @@ def run_complete_workflow():
     3. Apply content logic blocks
     4. Render templates
     5. Output JSON files
+    
+    Args:
+        incremental: Reuse node outputs whose inputs are unchanged since the
+            previous run and leave the matching page files untouched
+        state_path: SQLite file holding node fingerprints/outputs between runs
+        serializer: JSON backend for the output files ("auto", "orjson", "msgspec", "stdlib")
+        fsync: When output files are flushed to disk: "file", "batch" (once at the end) or "none"
+        tracer: Optional Tracer receiving node/block/template timings
     """
     print("\n" + "="*60)
     print("KASPARRO - MULTI-AGENT CONTENT GENERATION SYSTEM")
@@ -41,64 +54,47 @@ def run_complete_workflow():
     for key, value in raw_product_data.items():
         print(f"   • {key}: {value}")
     
-    # 2. Create all agents and components
-    print("\n🔧 Initializing agents and components...")
-    
-    parser = ParserAgent()
-    question_gen = QuestionGeneratorAgent()
-    content_manager = ContentBlockManager()
-    template_manager = TemplateManager()
-    
-    # 3. Build DAG workflow
-    print("\n🏗️  Building workflow DAG...")
-    orchestrator = DAGOrchestrator()
-
-    # Create template agents
-    from src.agents.template_agents import FAQTemplateAgent, ProductTemplateAgent, ComparisonTemplateAgent
-
-    # Add nodes with dependencies
-    orchestrator.add_node("parser", parser)
-    orchestrator.add_node("question_generator", question_gen, ["parser"])
-    orchestrator.add_node("content_blocks", content_manager, ["parser"])
-    orchestrator.add_node("faq_template", FAQTemplateAgent(), ["question_generator", "content_blocks"])
-    orchestrator.add_node("product_template", ProductTemplateAgent(), ["content_blocks"])
-    orchestrator.add_node("comparison_template", ComparisonTemplateAgent(), ["content_blocks"])
+    # 2-3. Create all agents and build DAG workflow
+    print("\n🏗️  Initializing agents and building workflow DAG...")
+    result_store = None
+    if incremental:
+        from src.utils.cache import SQLiteCache
+        result_store = SQLiteCache(state_path)
+    orchestrator = build_content_workflow(result_store=result_store, tracer=tracer)
     
     # 4. Execute workflow
     print("\n⚡ Executing workflow...")
     results = orchestrator.execute({"initial_data": raw_product_data})
+    if result_store is not None:
+        result_store.close()
     
     # 5. Generate JSON outputs
     print("\n💾 Generating JSON outputs...")
     output_dir = "output"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Save FAQ page
-    if "faq" in results:
-        faq_file = os.path.join(output_dir, "faq.json")
-        with open(faq_file, "w", encoding="utf-8") as f:
-            json.dump(results["faq"], f, indent=2, ensure_ascii=False)
-        print(f"   ✅ FAQ page saved: {faq_file}")
-    
-    # Save Product page
-    if "product_page" in results:
-        product_file = os.path.join(output_dir, "product_page.json")
-        with open(product_file, "w", encoding="utf-8") as f:
-            json.dump(results["product_page"], f, indent=2, ensure_ascii=False)
-        print(f"   ✅ Product page saved: {product_file}")
-    
-    # Save Comparison page
-    if "comparison_page" in results:
-        comparison_file = os.path.join(output_dir, "comparison_page.json")
-        with open(comparison_file, "w", encoding="utf-8") as f:
-            json.dump(results["comparison_page"], f, indent=2, ensure_ascii=False)
-        print(f"   ✅ Comparison page saved: {comparison_file}")
-    
-    # Save workflow report
-    report_file = os.path.join(output_dir, "workflow_report.json")
-    with open(report_file, "w", encoding="utf-8") as f:
-        json.dump(results.get("metadata", {}), f, indent=2)
-    print(f"   📊 Workflow report saved: {report_file}")
+    # Files are replaced atomically, so a crash never leaves a half-written page
+    sink = FileSink(output_dir, fsync=fsync, serializer=get_serializer(serializer))
+    
+    # Save pages; in incremental mode pages whose inputs did not change keep their file
+    unchanged_pages = set(results.get("metadata", {}).get("unchanged_pages", []))
+    page_files = [
+        ("faq", "FAQ page"),
+        ("product_page", "Product page"),
+        ("comparison_page", "Comparison page")
+    ]
+    with sink:
+        for page, label in page_files:
+            if page not in results:
+                continue
+            page_file = sink.path_for(page)
+            if page in unchanged_pages and os.path.exists(page_file):
+                print(f"   ♻️  {label} unchanged: {page_file}")
+                continue
+            sink.write(page, results[page])
+            print(f"   ✅ {label} saved: {page_file}")
+        
+        # Save workflow report
+        report_file = sink.write("workflow_report", results.get("metadata", {}))
+        print(f"   📊 Workflow report saved: {report_file}")
     
     # 6. Display summary
     print("\n" + "="*60)
@@ -133,6 +129,105 @@ def run_complete_workflow():
     
     return results
 
+def run_batch_workflow(raw_products: Iterable[Dict[str, Any]], **orchestrator_options: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Run the workflow over many products in one process.
+    
+    Agents, the DAG and its execution order are built once for the whole
+    batch; results are streamed back per product in input order.
+    
+    Args:
+        raw_products: Iterable of raw product dicts (same keys as the sample input)
+            or already-validated ProductData, e.g. FeedIngestAgent().iter_products(path)
+        **orchestrator_options: Passed to DAGOrchestrator (e.g. parallel=True)
+        
+    Yields:
+        Workflow results (faq, product_page, comparison_page, metadata) per product
+    """
+    orchestrator = build_content_workflow(**orchestrator_options)
+    try:
+        yield from orchestrator.execute_many(raw_products)
+    finally:
+        orchestrator.shutdown()
+
+def run_catalog_workflow(raw_products: Iterable[Any], output_dir: str = os.path.join("output", "catalog"),
+                         layout: str = "jsonl", shard_size: int = 10_000,
+                         serializer: str = "auto", fsync: str = "batch",
+                         compression: Optional[str] = None, **orchestrator_options: Any) -> Dict[str, Any]:
+    """
+    Run the workflow over a whole catalog and stream pages straight to disk.
+    
+    Each page is written as a JSON line the moment its template node
+    completes and is then dropped, so memory is bounded by the products in
+    flight rather than the catalog size. Per-product workflow metadata is
+    streamed to workflow_report.jsonl the same way.
+    
+    Args:
+        raw_products: Iterable of raw product dicts, ProductData or ProductRecord,
+            e.g. FeedIngestAgent().iter_products(path)
+        output_dir: Directory for the page streams
+        layout: "jsonl" (one file per page type), "sharded" (a directory per
+            page type with shard_size lines per file) or "bundle" (like
+            sharded, but each file is buffered and written atomically)
+        shard_size: Lines per file in the sharded and bundle layouts
+        serializer: JSON backend ("auto", "orjson", "msgspec", "stdlib")
+        fsync: Bundle layout only: "file", "batch" (once at the end) or "none"
+        compression: Bundle layout only: None, "gzip" or "zstd"
+        **orchestrator_options: Passed to build_content_workflow (e.g.
+            parallel=True, template_fragments=True)
+        
+    Returns:
+        Summary with product/failure counts and documents written per page
+    """
+    summary = {"products": 0, "failed": 0, "output_dir": output_dir}
+    page_serializer = get_serializer(serializer)
+    # Splicing pre-encoded static parts beats re-encoding them with the
+    # stdlib encoder; orjson/msgspec encode them faster than Python splices
+    orchestrator_options.setdefault("template_fragments", page_serializer.name == "stdlib")
+    
+    if layout == "bundle":
+        writer = BundleSink(output_dir, bundle_size=shard_size, fsync=fsync,
+                            compression=compression, serializer=page_serializer)
+    else:
+        writer = PageStreamWriter(output_dir, layout=layout, shard_size=shard_size,
+                                  serializer=page_serializer)
+    
+    with writer:
+        for result in run_batch_workflow(raw_products, page_sink=writer, **orchestrator_options):
+            summary["products"] += 1
+            if "error" in result:
+                summary["failed"] += 1
+            writer.write("workflow_report", result.get("metadata", {}))
+        summary["pages"] = dict(writer.counts)
+    
+    return summary
+
+def build_tracer(trace_path: Optional[str]) -> Tuple[Tracer, HistogramExporter]:
+    """
+    Tracer with an in-memory histogram, plus a file exporter when a path is given.
+    
+    Args:
+        trace_path: ``*.jsonl`` for one span per line, anything else for a
+            Chrome trace-event file (chrome://tracing, Perfetto)
+    """
+    histogram = HistogramExporter()
+    exporters = [histogram]
+    if trace_path:
+        if trace_path.endswith(".jsonl"):
+            exporters.append(JSONLinesExporter(trace_path))
+        else:
+            exporters.append(ChromeTraceExporter(trace_path))
+    return Tracer(*exporters), histogram
+
+def print_timing_summary(histogram: HistogramExporter):
+    """Print per-stage latency percentiles collected during a run"""
+    print("\n⏱️  Timing summary (ms)")
+    print(f"   {'stage':<36} {'count':>7} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+    for category, stages in histogram.summary().items():
+        for name, stats in stages.items():
+            print(f"   {category + '/' + name:<36} {stats['count']:>7} {stats['p50_ms']:>9.3f} "
+                  f"{stats['p90_ms']:>9.3f} {stats['p99_ms']:>9.3f} {stats['max_ms']:>9.3f}")
+
 def validate_outputs():
     """Validate that generated outputs meet assignment requirements"""
     print("\n🔍 Validating outputs against requirements...")
@@ -167,9 +262,78 @@ def validate_outputs():
     return requirements_met
 
 if __name__ == "__main__":
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="Kasparro multi-agent content generation")
+    arg_parser.add_argument("--incremental", action="store_true",
+                            help="Only rebuild pages whose inputs changed since the previous run")
+    arg_parser.add_argument("--state", default=DEFAULT_STATE_PATH,
+                            help="Fingerprint store used by --incremental")
+    arg_parser.add_argument("--feed",
+                            help="Run a JSONL/CSV product feed and stream pages to --output-dir")
+    arg_parser.add_argument("--output-dir", default=os.path.join("output", "catalog"),
+                            help="Page stream directory used by --feed")
+    arg_parser.add_argument("--layout", choices=(*PAGE_LAYOUTS, "bundle"), default="jsonl",
+                            help="One JSONL file per page type, sharded per-page directories, "
+                                 "or atomically written bundles")
+    arg_parser.add_argument("--shard-size", type=int, default=10_000,
+                            help="Lines per file for --layout sharded/bundle")
+    arg_parser.add_argument("--fsync", choices=FSYNC_POLICIES, default="batch",
+                            help="Flush output to disk per file, once per batch, or never")
+    arg_parser.add_argument("--compression", choices=("gzip", "zstd"),
+                            help="Compress bundles (--layout bundle)")
+    arg_parser.add_argument("--serializer", choices=("auto", *SERIALIZERS), default="auto",
+                            help="JSON encoder backend (auto picks the fastest installed)")
+    arg_parser.add_argument("--serve", metavar="ADDRESS",
+                            help="Run as a long-lived HTTP service on host:port, :port or unix:/path.sock "
+                                 "(POST /generate, GET /metrics, GET /health)")
+    arg_parser.add_argument("--trace", metavar="PATH",
+                            help="Write node/block/template timings (Chrome trace JSON, or *.jsonl) "
+                                 "and print percentiles")
+    verbosity = arg_parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-q", "--quiet", action="store_const", const="quiet", dest="verbosity",
+                           help="Only warnings and errors (default for --feed and --serve)")
+    verbosity.add_argument("-v", "--verbose", action="store_const", const="verbose", dest="verbosity",
+                           help="Log every agent, block and template step")
+    args = arg_parser.parse_args()
+    # Catalog runs stay silent per product unless asked otherwise
+    configure_logging(args.verbosity or ("quiet" if args.feed or args.serve else "normal"))
+    
+    if args.serve:
+        from src.service.server import make_server, parse_address, serve
+        server = make_server(parse_address(args.serve), serializer=args.serializer)
+        print(f"🌐 Content service listening on {server.url} (Ctrl+C to stop)")
+        serve(server)
+        raise SystemExit(0)
+    
+    tracer, histogram = build_tracer(args.trace) if args.trace else (None, None)
+    
+    if args.feed:
+        from src.agents.feed_ingest_agent import FeedIngestAgent
+        from src.agents.parser_agent import ParserAgent
+        # Compact records pass straight through the workflow's parser node
+        ingest = FeedIngestAgent(ParserAgent(compact=True))
+        summary = run_catalog_workflow(
+            ingest.iter_products(args.feed), output_dir=args.output_dir,
+            layout=args.layout, shard_size=args.shard_size, serializer=args.serializer,
+            fsync=args.fsync, compression=args.compression, tracer=tracer
+        )
+        print(f"\n📦 Catalog run: {summary['products']} products "
+              f"({summary['failed']} failed, {ingest.stats['rows_rejected']} rejected rows)")
+        for page, count in summary["pages"].items():
+            print(f"   • {page}: {count} documents")
+        print(f"📁 Page streams saved to: {os.path.abspath(args.output_dir)}")
+        if tracer is not None:
+            tracer.close()
+            print_timing_summary(histogram)
+        raise SystemExit(0)
+    
     try:
         # Run the workflow
-        results = run_complete_workflow()
+        results = run_complete_workflow(incremental=args.incremental, state_path=args.state,
+                                        serializer=args.serializer, fsync=args.fsync, tracer=tracer)
+        if tracer is not None:
+            tracer.close()
+            print_timing_summary(histogram)
         
         # Validate outputs
         validate_outputs()
@@ -0,0 +1,5 @@
+import logging
+
+# Library modules log instead of printing; applications opt in with
+# src.utils.logging_config.configure_logging()
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -1,11 +1,22 @@
-from .parser_agent import ParserAgent
-from .question_generator_agent import QuestionGeneratorAgent
-from .template_agents import FAQTemplateAgent, ProductTemplateAgent, ComparisonTemplateAgent
-
-__all__ = [
-    "ParserAgent", 
-    "QuestionGeneratorAgent",
-    "FAQTemplateAgent",
-    "ProductTemplateAgent", 
-    "ComparisonTemplateAgent"
-]
\ No newline at end of file
+from typing import TYPE_CHECKING
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .parser_agent import ParserAgent
+    from .question_generator_agent import QuestionGeneratorAgent
+    from .template_agents import FAQTemplateAgent, ProductTemplateAgent, ComparisonTemplateAgent
+    from .feed_ingest_agent import FeedIngestAgent
+
+# Public name -> submodule defining it, imported on first attribute access
+_EXPORTS = {
+    "ParserAgent": ".parser_agent",
+    "QuestionGeneratorAgent": ".question_generator_agent",
+    "FAQTemplateAgent": ".template_agents",
+    "ProductTemplateAgent": ".template_agents",
+    "ComparisonTemplateAgent": ".template_agents",
+    "FeedIngestAgent": ".feed_ingest_agent"
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,151 @@
+import csv
+import json
+import os
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional, Tuple, TextIO, Union
+from ..models.records import ProductRecord
+from .parser_agent import ParserAgent
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
+
+FEED_FORMATS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv"
+}
+
+
+class FeedIngestAgent:
+    """
+    Streams product feeds (JSONL or CSV) into validated ProductData records
+    (ProductRecord when given a compact parser).
+
+    Rows are read and validated one at a time, so memory stays flat regardless
+    of feed size. Rows that fail to decode or validate are written to a
+    side-channel JSONL error file instead of stopping the feed.
+    """
+
+    def __init__(self, parser: Optional[ParserAgent] = None):
+        self.agent_name = "FeedIngestAgent"
+        self.description = "Streams and validates product feeds from JSONL/CSV files"
+        self.parser = parser or ParserAgent()
+        self.stats = {"rows_read": 0, "rows_valid": 0, "rows_rejected": 0}
+
+    def process(self, feed_path: str) -> Iterator[Union["ProductData", ProductRecord]]:
+        """Alias for iter_products for DAG compatibility"""
+        return self.iter_products(feed_path)
+
+    def iter_products(self, feed_path: str, error_path: Optional[str] = None,
+                      feed_format: Optional[str] = None) -> Iterator[Union["ProductData", ProductRecord]]:
+        """
+        Lazily yield validated products from a feed file.
+
+        Args:
+            feed_path: Path to a .jsonl/.ndjson or .csv feed
+            error_path: Where to write rejected rows (default: <feed_path>.errors.jsonl)
+            feed_format: "jsonl" or "csv"; detected from the extension if omitted
+
+        Yields:
+            The parser's product (ProductData or ProductRecord) for every valid row, in feed order
+        """
+        if error_path is None:
+            error_path = f"{feed_path}.errors.jsonl"
+
+        self.stats = {"rows_read": 0, "rows_valid": 0, "rows_rejected": 0}
+        error_file: Optional[TextIO] = None
+
+        # The error file is only created on the first reject; drop the one a
+        # previous run left so it never reports rows that no longer fail
+        if os.path.exists(error_path):
+            os.unlink(error_path)
+
+        try:
+            for line_number, row, decode_error in self.iter_raw_rows(feed_path, feed_format):
+                self.stats["rows_read"] += 1
+
+                if decode_error is None:
+                    try:
+                        product = self.parser.parse(row)
+                    except ValueError as e:
+                        # pydantic's ValidationError is a ValueError; importing it
+                        # only here keeps pydantic unimported while rows are well typed
+                        from pydantic import ValidationError
+                        if not isinstance(e, ValidationError):
+                            raise
+                        decode_error = {
+                            "error": "validation_failed",
+                            "details": e.errors(include_url=False)
+                        }
+                    else:
+                        self.stats["rows_valid"] += 1
+                        yield product
+                        continue
+
+                # Open the error file only once the first reject shows up
+                if error_file is None:
+                    error_file = open(error_path, "w", encoding="utf-8")
+                self.stats["rows_rejected"] += 1
+                error_file.write(json.dumps(
+                    {"line": line_number, "row": row, **decode_error},
+                    ensure_ascii=False, default=str
+                ) + "\n")
+        finally:
+            if error_file is not None:
+                error_file.close()
+
+    def iter_raw_rows(self, feed_path: str,
+                      feed_format: Optional[str] = None) -> Iterator[Tuple[int, Any, Optional[Dict[str, Any]]]]:
+        """
+        Lazily yield raw rows from a feed file.
+
+        Yields:
+            (line_number, row, error) tuples; error is None when the row
+            decoded into a dict, otherwise a dict describing the problem
+        """
+        feed_format = feed_format or self._detect_format(feed_path)
+
+        if feed_format == "jsonl":
+            yield from self._iter_jsonl(feed_path)
+        elif feed_format == "csv":
+            yield from self._iter_csv(feed_path)
+        else:
+            raise ValueError(f"Unsupported feed format '{feed_format}'")
+
+    def _detect_format(self, feed_path: str) -> str:
+        extension = os.path.splitext(feed_path)[1].lower()
+        if extension not in FEED_FORMATS:
+            raise ValueError(f"Cannot detect feed format for '{feed_path}', pass feed_format explicitly")
+        return FEED_FORMATS[extension]
+
+    def _iter_jsonl(self, feed_path: str):
+        with open(feed_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, line, {"error": "invalid_json", "details": str(e)}
+                    continue
+                if not isinstance(row, dict):
+                    yield line_number, row, {"error": "invalid_row", "details": "Expected a JSON object"}
+                    continue
+                yield line_number, row, None
+
+    def _iter_csv(self, feed_path: str):
+        with open(feed_path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                # Short rows leave trailing columns as None; drop them so the
+                # model reports them as missing instead of wrong-typed
+                row = {key: value for key, value in row.items() if key is not None and value is not None}
+                yield reader.line_num, row, None
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "agent": self.agent_name,
+            "status": "ready",
+            "description": self.description,
+            "stats": dict(self.stats)
+        }
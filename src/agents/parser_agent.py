@@ -1,39 +1,194 @@
-from typing import Dict, Any
-from ..models.product import ProductData
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Sequence, Iterable, Union
+from ..models.records import ProductRecord
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
+
+logger = logging.getLogger(__name__)
+
+# Raw feed column -> ProductData field
+FIELD_MAPPING = {
+    "Product Name": "name",
+    "Concentration": "concentration", 
+    "Skin Type": "skin_type",
+    "Key Ingredients": "key_ingredients",
+    "Benefits": "benefits",
+    "How to Use": "how_to_use",
+    "Side Effects": "side_effects",
+    "Price": "price"
+}
+
+# Raw columns holding comma-separated lists
+LIST_FIELDS = ("Skin Type", "Key Ingredients", "Benefits")
+
+# Marks a cell whose key was absent from the raw row
+_MISSING = object()
+
+def _split_column(values: Sequence[Any]) -> List[Any]:
+    """Split and trim the comma-separated strings of a list column, once per distinct value"""
+    split: Dict[str, tuple] = {}
+    result = []
+    for value in values:
+        if isinstance(value, str):
+            items = split.get(value)
+            if items is None:
+                # Tuples, so rows sharing a value cannot alias one mutable list;
+                # validation builds a fresh list per row
+                items = split[value] = tuple(map(str.strip, value.split(",")))
+            value = items
+        result.append(value)
+    return result
+
+@lru_cache(maxsize=None)
+def _product_list_adapter():
+    """Validator for a whole batch of cleaned rows (built on first bulk parse)"""
+    from pydantic import TypeAdapter
+    from ..models.product import ProductData
+    return TypeAdapter(List[ProductData])
+
+def _is_well_typed(cleaned: Dict[str, Any]) -> bool:
+    """True if a cleaned row has every field with exactly the type ProductData requires"""
+    if len(cleaned) != len(FIELD_MAPPING):
+        return False
+    for raw_field, model_field in FIELD_MAPPING.items():
+        value = cleaned[model_field]
+        if raw_field in LIST_FIELDS:
+            if value.__class__ is not list or not all(item.__class__ is str for item in value):
+                return False
+        elif value.__class__ is not str:
+            return False
+    return True
 
 class ParserAgent:
-    def __init__(self):
+    # Bump when parsing output changes for the same input
+    version = "1"
+    
+    def __init__(self, compact: bool = False):
+        """
+        Args:
+            compact: Return slots-backed ProductRecord instead of ProductData.
+                Input is still fully validated; only the returned object differs,
+                and rows that are already well typed never import pydantic.
+        """
         self.agent_name = "ParserAgent"
         self.description = "Parses and validates raw product data"
+        self.compact = compact
+        self.version = f"{type(self).version}+compact" if compact else type(self).version
         
-    def process(self, raw_data: Dict[str, Any]) -> ProductData:
-        print(f"🔧 [{self.agent_name}] Processing raw data...")
+    def process(self, raw_data: Dict[str, Any]) -> Union["ProductData", ProductRecord]:
+        logger.debug("🔧 [%s] Processing raw data...", self.agent_name)
         
-        cleaned_data = self._clean_raw_data(raw_data)
-        product = ProductData(**cleaned_data)
+        if isinstance(raw_data, ProductRecord):
+            product = raw_data
+        elif isinstance(raw_data, dict):
+            product = self.parse(raw_data)
+        else:
+            # Products validated upstream (e.g. by FeedIngestAgent) pass through
+            from ..models.product import ProductData
+            product = raw_data if isinstance(raw_data, ProductData) else self.validate(raw_data)
+            if self.compact:
+                product = ProductRecord.from_model(product)
         
-        print(f"✅ [{self.agent_name}] Successfully parsed product: {product.name}")
+        logger.debug("✅ [%s] Successfully parsed product: %s", self.agent_name, product.name)
         return product
     
-    def _clean_raw_data(self, raw: Dict[str, Any]) -> Dict[str, Any]:
-        cleaned = {}
+    def parse(self, raw_data: Dict[str, Any]) -> Union["ProductData", ProductRecord]:
+        """
+        Clean and validate one raw record into this agent's output type.
+        
+        In compact mode a row whose fields already have the exact types
+        ProductData requires becomes a ProductRecord directly; any other row
+        goes through ProductData(...), so bad input raises the same
+        pydantic.ValidationError as validate().
+        """
+        if not self.compact:
+            return self.validate(raw_data)
         
-        field_mapping = {
-            "Product Name": "name",
-            "Concentration": "concentration", 
-            "Skin Type": "skin_type",
-            "Key Ingredients": "key_ingredients",
-            "Benefits": "benefits",
-            "How to Use": "how_to_use",
-            "Side Effects": "side_effects",
-            "Price": "price"
+        cleaned = self._clean_raw_data(raw_data)
+        if _is_well_typed(cleaned):
+            return ProductRecord(**cleaned)
+        return ProductRecord.from_model(self.validate(raw_data))
+    
+    def validate(self, raw_data: Dict[str, Any]) -> "ProductData":
+        """Clean and validate one raw record; raises pydantic.ValidationError on bad input"""
+        from ..models.product import ProductData
+        return ProductData(**self._clean_raw_data(raw_data))
+    
+    def process_batch(self, rows: Iterable[Dict[str, Any]]) -> List["ProductData"]:
+        """
+        Parse many raw records at once through the columnar path.
+        
+        Args:
+            rows: Raw product dicts (same keys as process())
+            
+        Returns:
+            ProductData per row, in input order
+        """
+        rows = list(rows)
+        columns = {
+            raw_field: [row.get(raw_field, _MISSING) for row in rows]
+            for raw_field in FIELD_MAPPING
         }
+        return self.process_columns(columns, len(rows))
+    
+    def process_columns(self, columns: Dict[str, Sequence[Any]], num_rows: int = None) -> List["ProductData"]:
+        """
+        Parse a batch given as column arrays keyed by raw field name.
+        
+        Field mapping, comma splitting and trimming run once per column, and
+        each distinct list cell is split only once (feeds repeat skin types,
+        ingredient and benefit lists heavily). The whole batch is then
+        validated in a single pydantic call, so bad input still raises
+        ValidationError, with the row index in each error location.
+        
+        Args:
+            columns: {"Product Name": [...], "Skin Type": [...], ...}
+            num_rows: Row count; required only if no columns are given
+            
+        Returns:
+            ProductData per row, in input order
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Column lengths differ: {sorted(lengths)}")
+        if num_rows is None:
+            num_rows = lengths.pop() if lengths else 0
+        
+        # Map and split whole columns
+        fields: Dict[str, Sequence[Any]] = {}
+        has_missing = False
+        
+        for raw_field, model_field in FIELD_MAPPING.items():
+            values = columns.get(raw_field)
+            if values is None:
+                values = [_MISSING] * num_rows
+            
+            if raw_field in LIST_FIELDS:
+                values = _split_column(values)
+            
+            fields[model_field] = values
+            has_missing = has_missing or _MISSING in values
+        
+        field_names = list(fields)
+        rows = [dict(zip(field_names, row_values)) for row_values in zip(*fields.values())]
+        if has_missing:
+            rows = [
+                {name: value for name, value in row.items() if value is not _MISSING}
+                for row in rows
+            ]
+        
+        return _product_list_adapter().validate_python(rows)
+    
+    def _clean_raw_data(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        cleaned = {}
         
-        for raw_field, model_field in field_mapping.items():
+        for raw_field, model_field in FIELD_MAPPING.items():
             if raw_field in raw:
                 value = raw[raw_field]
                 
-                if raw_field in ["Skin Type", "Key Ingredients", "Benefits"]:
+                if raw_field in LIST_FIELDS:
                     if isinstance(value, str):
                         cleaned[model_field] = [item.strip() for item in value.split(",")]
                     else:
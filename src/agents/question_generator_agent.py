@@ -1,8 +1,37 @@
-from typing import List
-from ..models.product import ProductData, FAQItem
+import hashlib
+import json
+import logging
+from string import Formatter
+from typing import TYPE_CHECKING, List, Iterable, Optional
+from ..models.records import FAQRecord
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData, FAQItem
+
+logger = logging.getLogger(__name__)
+
+# Questions used from each category's template list
+QUESTIONS_PER_CATEGORY = 3
+
+# Product fields each question category draws its answer from
+SOURCE_FIELDS = {
+    "Informational": ["name", "concentration", "key_ingredients", "skin_type"],
+    "Safety": ["side_effects", "skin_type"],
+    "Usage": ["how_to_use"],
+    "Purchase": ["price"],
+    "Comparison": ["name", "benefits", "price", "key_ingredients"]
+}
 
 class QuestionGeneratorAgent:
-    def __init__(self):
+    # Bump when the generated questions change for the same templates
+    version = "1"
+    
+    def __init__(self, compact: bool = False):
+        """
+        Args:
+            compact: Emit slots-backed FAQRecord instead of pydantic FAQItem
+        """
+        self.compact = compact
         self.agent_name = "QuestionGeneratorAgent"
         self.description = "Generates user questions from product data"
         
@@ -43,46 +72,95 @@ class QuestionGeneratorAgent:
                 "Why should I choose {name} over similar products?"
             ]
         }
+        
+        self.compile()
     
-    def process(self, product: ProductData) -> List[FAQItem]:
-        print(f"🔧 [{self.agent_name}] Generating questions...")
+    def compile(self):
+        """
+        Precompute the render plan from question_templates.
         
-        questions = []
+        Each question becomes (id, category, prefix, field, suffix, source_fields)
+        so rendering is plain string concatenation. Templates with anything
+        other than a single bare placeholder keep a format string instead.
+        Call again after modifying question_templates.
+        """
+        plan = []
+        used_fields = set()
         question_id = 1
         
         for category, templates in self.question_templates.items():
-            for template in templates[:3]:
-                formatted_question = template.format(
-                    name=product.name,
-                    concentration=product.concentration,
-                    skin_types=", ".join(product.skin_type)
-                )
-                
-                source_fields = self._get_source_fields(category, product)
+            source_fields = tuple(SOURCE_FIELDS.get(category, []))
+            for template in templates[:QUESTIONS_PER_CATEGORY]:
+                segments = list(Formatter().parse(template))
+                fields = [field for _, field, _, _ in segments if field is not None]
+                used_fields.update(fields)
                 
-                faq_item = FAQItem(
-                    id=question_id,
-                    category=category,
-                    question=formatted_question,
-                    answer="",
-                    source_data=source_fields
+                simple = (
+                    len(fields) == 1 and len(segments) <= 2
+                    and not segments[0][2] and not segments[0][3]
                 )
-                
-                questions.append(faq_item)
+                if simple:
+                    prefix, field = segments[0][0], segments[0][1]
+                    suffix = segments[1][0] if len(segments) == 2 else ""
+                    plan.append((question_id, category, prefix, field, suffix, source_fields, None))
+                else:
+                    plan.append((question_id, category, None, None, None, source_fields, template))
                 question_id += 1
         
-        print(f"✅ [{self.agent_name}] Generated {len(questions)} questions")
+        self._render_plan = plan
+        self._needs_skin_types = "skin_types" in used_fields
+        
+        # Stored questions are reused only while templates and output type match
+        digest = hashlib.sha256(json.dumps(
+            [self.question_templates, QUESTIONS_PER_CATEGORY, SOURCE_FIELDS], ensure_ascii=False
+        ).encode("utf-8")).hexdigest()
+        self.version = f"{type(self).version}+{digest[:12]}{'+compact' if self.compact else ''}"
+    
+    def process(self, product: "ProductData") -> List["FAQItem"]:
+        logger.debug("🔧 [%s] Generating questions...", self.agent_name)
+        
+        questions = self._render(product, self._item_class())
+        
+        logger.debug("✅ [%s] Generated %d questions", self.agent_name, len(questions))
         return questions
     
-    def _get_source_fields(self, category: str, product: ProductData) -> List[str]:
-        field_mapping = {
-            "Informational": ["name", "concentration", "key_ingredients", "skin_type"],
-            "Safety": ["side_effects", "skin_type"],
-            "Usage": ["how_to_use"],
-            "Purchase": ["price"],
-            "Comparison": ["name", "benefits", "price", "key_ingredients"]
+    def process_many(self, products: Iterable["ProductData"]) -> List[List["FAQItem"]]:
+        """
+        Generate questions for a batch of products.
+        
+        Returns:
+            One list of questions per product, in input order
+        """
+        item_class = self._item_class()
+        return [self._render(product, item_class) for product in products]
+    
+    def _item_class(self) -> type:
+        if self.compact:
+            return FAQRecord
+        from ..models.product import FAQItem
+        return FAQItem
+    
+    def _render(self, product: "ProductData", item_class: type) -> List["FAQItem"]:
+        """Fill the precompiled render plan for one product"""
+        values = {
+            "name": product.name,
+            "concentration": product.concentration,
+            "skin_types": ", ".join(product.skin_type) if self._needs_skin_types else ""
         }
-        return field_mapping.get(category, [])
+        
+        questions = []
+        for question_id, category, prefix, field, suffix, source_fields, template in self._render_plan:
+            questions.append(item_class(
+                id=question_id,
+                category=category,
+                question=prefix + values[field] + suffix if template is None else template.format_map(values),
+                answer="",
+                source_data=list(source_fields)
+            ))
+        return questions
+    
+    def _get_source_fields(self, category: str, product: Optional["ProductData"] = None) -> List[str]:
+        return list(SOURCE_FIELDS.get(category, []))
     
     def get_status(self) -> dict:
         return {
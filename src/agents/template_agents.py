@@ -1,25 +1,42 @@
-from src.templates.manager import TemplateManager
+from typing import Any, Dict, Iterable, List, Optional
+from src.templates.manager import TemplateManager, get_template_manager
 
-class FAQTemplateAgent:
-    def __init__(self):
-        self.agent_name = "FAQTemplateAgent"
-    
-    def process(self, data):
-        manager = TemplateManager()
-        return manager.render_template("faq", data)
+class TemplateAgent:
+    """
+    Renders one page type. Agents share a long-lived TemplateManager (the
+    process-wide one by default) instead of building templates per call.
+    """
 
-class ProductTemplateAgent:
-    def __init__(self):
-        self.agent_name = "ProductTemplateAgent"
-    
-    def process(self, data):
-        manager = TemplateManager()
-        return manager.render_template("product_page", data)
+    template_name = ""
+
+    def __init__(self, manager: Optional[TemplateManager] = None, fragments: bool = False):
+        """
+        Args:
+            manager: TemplateManager to render with (default: the shared one)
+            fragments: Use templates that emit pre-encoded static Fragments
+                (pages must then be written through a Serializer)
+        """
+        self.agent_name = type(self).__name__
+        self.manager = manager or get_template_manager(fragments)
+
+    @property
+    def version(self) -> str:
+        """Identity for reusing stored outputs: the template rendered and its mode"""
+        template = self.manager.templates[self.template_name]
+        return f"{type(template).__qualname__}:{template.version}:fragments={template.fragments}"
 
-class ComparisonTemplateAgent:
-    def __init__(self):
-        self.agent_name = "ComparisonTemplateAgent"
-    
     def process(self, data):
-        manager = TemplateManager()
-        return manager.render_template("comparison_page", data)
\ No newline at end of file
+        return self.manager.render_template(self.template_name, data)
+
+    def process_many(self, data_list: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Render this agent's page for many products in one call"""
+        return self.manager.render_many(self.template_name, data_list)
+
+class FAQTemplateAgent(TemplateAgent):
+    template_name = "faq"
+
+class ProductTemplateAgent(TemplateAgent):
+    template_name = "product_page"
+
+class ComparisonTemplateAgent(TemplateAgent):
+    template_name = "comparison_page"
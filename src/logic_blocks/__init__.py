@@ -1,17 +1,31 @@
-from .base import ContentLogicBlock
-from .benefits_block import BenefitsGeneratorBlock
-from .usage_block import UsageExtractorBlock
-from .ingredient_block import IngredientAnalyzerBlock
-from .safety_block import SafetyWarningBlock
-from .price_block import PriceFormatterBlock
-from .manager import ContentBlockManager
+from typing import TYPE_CHECKING
+from ..utils.lazy import lazy_exports
 
-__all__ = [
-    "ContentLogicBlock",
-    "BenefitsGeneratorBlock",
-    "UsageExtractorBlock", 
-    "IngredientAnalyzerBlock",
-    "SafetyWarningBlock",
-    "PriceFormatterBlock",
-    "ContentBlockManager"
-]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .base import ContentLogicBlock
+    from .benefits_block import BenefitsGeneratorBlock
+    from .usage_block import UsageExtractorBlock
+    from .ingredient_block import IngredientAnalyzerBlock
+    from .safety_block import SafetyWarningBlock
+    from .price_block import PriceFormatterBlock
+    from .manager import ContentBlockManager
+    from .lexicon import Lexicon, LexiconIndex, load_lexicon, build_index
+
+# Public name -> submodule defining it, imported on first attribute access
+_EXPORTS = {
+    "ContentLogicBlock": ".base",
+    "BenefitsGeneratorBlock": ".benefits_block",
+    "UsageExtractorBlock": ".usage_block",
+    "IngredientAnalyzerBlock": ".ingredient_block",
+    "SafetyWarningBlock": ".safety_block",
+    "PriceFormatterBlock": ".price_block",
+    "ContentBlockManager": ".manager",
+    "Lexicon": ".lexicon",
+    "LexiconIndex": ".lexicon",
+    "load_lexicon": ".lexicon",
+    "build_index": ".lexicon"
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
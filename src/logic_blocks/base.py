@@ -1,12 +1,41 @@
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-from ..models.product import ProductData
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Tuple
+from ..models.records import ProductRecord
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
+
+# Content fields shared by ProductData and ProductRecord (read without importing pydantic)
+PRODUCT_FIELDS = tuple(field for field in ProductRecord.__slots__ if field != "timestamp")
+
+def product_cache_key(blocks: Iterable["ContentLogicBlock"], product: "ProductData") -> str:
+    """
+    Stable hash of a set of blocks (names and versions) and every product field.
+    
+    Product fields are str or list of str, so they are joined with the ASCII
+    record/unit separators instead of JSON-encoded: this key is computed for
+    every product on every cached run, and json.dumps would cost more than
+    the blocks it saves.
+    """
+    parts = ["\x1f".join(f"{block.name}={block.version}" for block in blocks)]
+    for field in PRODUCT_FIELDS:
+        value = getattr(product, field)
+        parts.append(value if value.__class__ is str else "\x1f".join(value))
+    return hashlib.blake2b("\x1e".join(parts).encode("utf-8"), digest_size=16).hexdigest()
 
 class ContentLogicBlock(ABC):
     """Base class for all content logic blocks"""
     
+    # Bump when apply() output changes so cached results are invalidated
+    version: str = "1"
+    
+    # Product fields apply() reads; an empty tuple means "all fields"
+    source_fields: Tuple[str, ...] = ()
+    
     @abstractmethod
-    def apply(self, product: ProductData) -> Dict[str, Any]:
+    def apply(self, product: "ProductData") -> Dict[str, Any]:
         """Transform product data into content"""
         pass
     
@@ -16,6 +45,15 @@ class ContentLogicBlock(ABC):
         """Unique name for the block"""
         pass
     
+    def cache_key(self, product: "ProductData") -> str:
+        """Stable hash of the block identity and the product fields it reads"""
+        fields = self.source_fields or PRODUCT_FIELDS
+        payload = json.dumps(
+            [self.name, self.version, [getattr(product, field) for field in fields]],
+            ensure_ascii=False, separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
     def get_info(self) -> Dict[str, Any]:
         """Get block information"""
         return {
@@ -1,6 +1,10 @@
-from typing import Dict, Any
+import os
+from typing import TYPE_CHECKING, Dict, Any, Union
 from .base import ContentLogicBlock
-from ..models.product import ProductData
+from .lexicon import DATA_DIR, Lexicon, LexiconIndex, load_lexicon
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
 
 class BenefitsGeneratorBlock(ContentLogicBlock):
     """
@@ -8,22 +12,32 @@ class BenefitsGeneratorBlock(ContentLogicBlock):
     Example: "Brightening" → "Enhances skin radiance and glow"
     """
     
+    source_fields = ("benefits",)
+    
+    version = "2"
+    
+    DEFAULT_LEXICON = os.path.join(DATA_DIR, "benefits.json")
+    
+    def __init__(self, lexicon: Union[str, Lexicon, LexiconIndex, None] = None):
+        """
+        Args:
+            lexicon: Benefit lexicon or a path to one (default: bundled benefits.json)
+        """
+        if lexicon is None or isinstance(lexicon, str):
+            lexicon = load_lexicon(lexicon or self.DEFAULT_LEXICON)
+        self.lexicon = lexicon
+        self.version = f"{type(self).version}+{lexicon.digest[:12]}"
+    
     @property
     def name(self):
         return "generate-benefits-block"
     
-    def apply(self, product: ProductData) -> Dict[str, Any]:
+    def apply(self, product: "ProductData") -> Dict[str, Any]:
         enhanced_benefits = []
         
         for benefit in product.benefits:
-            if benefit == "Brightening":
-                enhanced_benefits.append("Enhances skin radiance and glow")
-                enhanced_benefits.append("Reduces dullness for luminous skin")
-            elif benefit == "Fades dark spots":
-                enhanced_benefits.append("Reduces appearance of hyperpigmentation")
-                enhanced_benefits.append("Helps fade dark spots over time")
-            else:
-                enhanced_benefits.append(benefit)
+            entry = self.lexicon.get(benefit)
+            enhanced_benefits.extend(entry["statements"] if entry else (benefit,))
         
         return {
             "primary_benefits": enhanced_benefits[:2],
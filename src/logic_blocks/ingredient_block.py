@@ -1,35 +1,44 @@
-from typing import Dict, Any
+import os
+from typing import TYPE_CHECKING, Dict, Any, Union
 from .base import ContentLogicBlock
-from ..models.product import ProductData
+from .lexicon import DATA_DIR, Lexicon, LexiconIndex, load_lexicon
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
 
 class IngredientAnalyzerBlock(ContentLogicBlock):
     """
     Analyzes and explains key ingredients.
     """
     
-    INGREDIENT_DESCRIPTIONS = {
-        "Vitamin C": {
-            "benefit": "Powerful antioxidant that brightens skin",
-            "purpose": "Fights free radicals, boosts collagen",
-            "key_feature": "10% concentration for optimal efficacy"
-        },
-        "Hyaluronic Acid": {
-            "benefit": "Intense hydration without heaviness",
-            "purpose": "Locks in moisture, plumps skin",
-            "key_feature": "Holds 1000x its weight in water"
-        }
-    }
+    source_fields = ("key_ingredients", "concentration")
+    
+    version = "2"
+    
+    DEFAULT_LEXICON = os.path.join(DATA_DIR, "ingredients.json")
+    
+    def __init__(self, lexicon: Union[str, Lexicon, LexiconIndex, None] = None):
+        """
+        Args:
+            lexicon: Ingredient lexicon or a path to one (default: bundled ingredients.json)
+        """
+        if lexicon is None or isinstance(lexicon, str):
+            lexicon = load_lexicon(lexicon or self.DEFAULT_LEXICON)
+        self.lexicon = lexicon
+        # Results depend on the lexicon contents, so cached entries must too
+        self.version = f"{type(self).version}+{lexicon.digest[:12]}"
     
     @property
     def name(self):
         return "analyze-ingredients-block"
     
-    def apply(self, product: ProductData) -> Dict[str, Any]:
+    def apply(self, product: "ProductData") -> Dict[str, Any]:
         ingredient_details = []
         
         for ingredient in product.key_ingredients:
-            if ingredient in self.INGREDIENT_DESCRIPTIONS:
-                details = self.INGREDIENT_DESCRIPTIONS[ingredient].copy()
+            description = self.lexicon.get(ingredient)
+            if description is not None:
+                details = dict(description)
                 details["name"] = ingredient
                 ingredient_details.append(details)
             else:
@@ -0,0 +1,273 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Binary index layout (little-endian):
+#   header:  magic, key count, entry count, digest (32 bytes)
+#   hashes:  key count × u64 term hash, sorted
+#   keys:    key count × (key offset, key length, entry id), in hash order
+#   entries: entry count × (offset, length) of the entry's JSON
+#   blob:    key strings and entry JSON, UTF-8
+_MAGIC = b"LEXIDX01"
+_HEADER = struct.Struct("<8sII32s")
+_KEY = struct.Struct("<III")
+_ENTRY = struct.Struct("<II")
+
+def normalize_term(term: str) -> str:
+    """Lookup form of a term: case-folded with whitespace collapsed"""
+    return " ".join(term.casefold().split())
+
+def _term_hash(key: str) -> int:
+    # Built-in hash() is salted per process, so it cannot be stored in a file
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+class Lexicon:
+    """
+    In-memory term dictionary loaded from JSON.
+
+    The JSON maps canonical names to entry dicts. An optional ``aliases``
+    list in each entry adds synonyms. Lookups are normalized, so
+    "vitamin  c", "VITAMIN C" and an alias such as "Ascorbic Acid" all
+    resolve to the same entry.
+
+    Example file:
+        {"Vitamin C": {"aliases": ["Ascorbic Acid"], "benefit": "..."}}
+    """
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]], digest: Optional[str] = None):
+        """
+        Args:
+            entries: Canonical name → entry dict (may contain "aliases")
+            digest: Content hash of the source; computed from entries if omitted
+        """
+        self._names: List[str] = []
+        self._entries: List[Dict[str, Any]] = []
+        self._index: Dict[str, int] = {}
+
+        for name, entry in entries.items():
+            entry_id = len(self._entries)
+            self._names.append(name)
+            self._entries.append({k: v for k, v in entry.items() if k != "aliases"})
+            for term in [name, *entry.get("aliases", ())]:
+                key = normalize_term(term)
+                if not key:
+                    continue
+                existing = self._index.setdefault(key, entry_id)
+                if existing != entry_id:
+                    raise ValueError(
+                        f"Term '{term}' maps to both '{self._names[existing]}' and '{name}'"
+                    )
+
+        if digest is None:
+            payload = json.dumps(entries, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+            digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        self.digest = digest
+
+    @classmethod
+    def from_json(cls, path: str) -> "Lexicon":
+        """Load a lexicon from a JSON file"""
+        with open(path, "rb") as f:
+            raw = f.read()
+        return cls(json.loads(raw), digest=hashlib.sha256(raw).hexdigest())
+
+    def lookup(self, term: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return (canonical name, entry) for a term or alias, or None"""
+        entry_id = self._index.get(normalize_term(term))
+        if entry_id is None:
+            return None
+        return self._names[entry_id], self._entries[entry_id]
+
+    def get(self, term: str, default: Any = None) -> Any:
+        """Return the entry dict for a term or alias"""
+        found = self.lookup(term)
+        return default if found is None else found[1]
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Return the canonical name for a term or alias"""
+        found = self.lookup(term)
+        return None if found is None else found[0]
+
+    def save_index(self, path: str):
+        """
+        Write a binary index that LexiconIndex can open without parsing JSON.
+
+        Args:
+            path: Output file path (written atomically)
+        """
+        blob = bytearray()
+        entry_table = []
+        for name, entry in zip(self._names, self._entries):
+            data = json.dumps([name, entry], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            entry_table.append((len(blob), len(data)))
+            blob += data
+
+        key_table = []
+        for key, entry_id in self._index.items():
+            data = key.encode("utf-8")
+            key_table.append((_term_hash(key), len(blob), len(data), entry_id))
+            blob += data
+        key_table.sort()
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(key_table), len(entry_table), bytes.fromhex(self.digest)))
+            f.write(struct.pack(f"<{len(key_table)}Q", *(row[0] for row in key_table)))
+            for row in key_table:
+                f.write(_KEY.pack(*row[1:]))
+            for row in entry_table:
+                f.write(_ENTRY.pack(*row))
+            f.write(blob)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, term: str) -> bool:
+        return normalize_term(term) in self._index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class LexiconIndex:
+    """
+    Read-only lexicon backed by a binary index built with Lexicon.save_index().
+
+    Opening is O(1): the file is memory-mapped (or read in one call) and
+    lookups binary-search the sorted hash table in place, decoding only the
+    entries that are actually requested. Worker processes that map the same
+    file share its pages through the OS page cache.
+    """
+
+    def __init__(self, path: str, use_mmap: bool = True):
+        """
+        Args:
+            path: Index file path
+            use_mmap: Memory-map the file instead of reading it into memory
+        """
+        self.path = path
+        self._mmap = None
+        self._hashes = None
+        with open(path, "rb") as f:
+            if use_mmap:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._buffer = self._mmap
+            else:
+                self._buffer = f.read()
+
+        magic, self._key_count, self._entry_count, digest = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a lexicon index")
+        self.digest = digest.hex()
+
+        # Zero-copy view of the sorted hashes, so bisect runs in C
+        # (the view uses native byte order, so indexes assume a little-endian host)
+        hashes_end = _HEADER.size + self._key_count * 8
+        self._hashes = memoryview(self._buffer)[_HEADER.size:hashes_end].cast("Q")
+        self._keys_offset = hashes_end
+        self._entries_offset = self._keys_offset + self._key_count * _KEY.size
+        self._blob_offset = self._entries_offset + self._entry_count * _ENTRY.size
+        self._decoded: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+
+    def lookup(self, term: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return (canonical name, entry) for a term or alias, or None"""
+        key = normalize_term(term)
+        entry_id = self._find(key)
+        if entry_id is None:
+            return None
+
+        found = self._decoded.get(entry_id)
+        if found is None:
+            offset, length = _ENTRY.unpack_from(self._buffer, self._entries_offset + entry_id * _ENTRY.size)
+            start = self._blob_offset + offset
+            name, entry = json.loads(bytes(self._buffer[start:start + length]))
+            found = self._decoded[entry_id] = (name, entry)
+        return found
+
+    def get(self, term: str, default: Any = None) -> Any:
+        """Return the entry dict for a term or alias"""
+        found = self.lookup(term)
+        return default if found is None else found[1]
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Return the canonical name for a term or alias"""
+        found = self.lookup(term)
+        return None if found is None else found[0]
+
+    def close(self):
+        """Release the memory map"""
+        if self._hashes is not None:
+            self._hashes.release()
+            self._hashes = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def _find(self, key: str) -> Optional[int]:
+        """Binary search the hash table, then confirm the key bytes"""
+        target = _term_hash(key)
+        encoded = key.encode("utf-8")
+        position = bisect_left(self._hashes, target)
+        # Walk the (rare) run of equal hashes
+        while position < self._key_count and self._hashes[position] == target:
+            offset, length, entry_id = _KEY.unpack_from(self._buffer, self._keys_offset + position * _KEY.size)
+            position += 1
+            start = self._blob_offset + offset
+            if self._buffer[start:start + length] == encoded:
+                return entry_id
+        return None
+
+    def __contains__(self, term: str) -> bool:
+        return self._find(normalize_term(term)) is not None
+
+    def __len__(self) -> int:
+        return self._entry_count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+@lru_cache(maxsize=None)
+def load_lexicon(path: str, use_mmap: bool = True) -> Union[Lexicon, LexiconIndex]:
+    """
+    Load a lexicon once per process.
+
+    A ``.idx`` path opens the binary index; anything else is parsed as JSON.
+    When a JSON file has an up-to-date ``<path>.idx`` next to it, the index
+    is used instead.
+
+    Args:
+        path: Lexicon JSON or index file
+        use_mmap: Memory-map index files
+
+    Returns:
+        Lexicon or LexiconIndex (same lookup API)
+    """
+    if path.endswith(".idx"):
+        return LexiconIndex(path, use_mmap=use_mmap)
+
+    index_path = f"{path}.idx"
+    if os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(path):
+        return LexiconIndex(index_path, use_mmap=use_mmap)
+    return Lexicon.from_json(path)
+
+def build_index(json_path: str, index_path: Optional[str] = None) -> str:
+    """
+    Build the binary index for a lexicon JSON file.
+
+    Args:
+        json_path: Source JSON
+        index_path: Output path (default: ``<json_path>.idx``)
+
+    Returns:
+        Path of the written index
+    """
+    index_path = index_path or f"{json_path}.idx"
+    Lexicon.from_json(json_path).save_index(index_path)
+    return index_path
@@ -1,11 +1,19 @@
-from typing import Dict, Any, List
-from .base import ContentLogicBlock
+import logging
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
+from .base import ContentLogicBlock, product_cache_key
 from .benefits_block import BenefitsGeneratorBlock
 from .usage_block import UsageExtractorBlock
 from .ingredient_block import IngredientAnalyzerBlock
 from .safety_block import SafetyWarningBlock
 from .price_block import PriceFormatterBlock
-from ..models.product import ProductData
+from .lexicon import Lexicon, LexiconIndex
+from ..utils.cache import ResultCache, MISSING
+from ..utils.tracing import get_tracer
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
+
+logger = logging.getLogger(__name__)
 
 class ContentBlockManager:
     """
@@ -13,8 +21,28 @@ class ContentBlockManager:
     Can apply multiple blocks to product data.
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ResultCache] = None,
+                 ingredient_lexicon: Union[str, Lexicon, LexiconIndex, None] = None,
+                 benefit_lexicon: Union[str, Lexicon, LexiconIndex, None] = None):
+        """
+        Args:
+            cache: Optional result cache (e.g. LRUCache, SQLiteCache). Results
+                are stored per product (all applied blocks, one lookup) and per
+                block (keyed by block name, block version and the product fields
+                the block reads), so unchanged products skip recomputation and
+                changed ones only re-run the blocks reading a changed field.
+            ingredient_lexicon: Lexicon (or path to JSON / .idx) for ingredient descriptions
+            benefit_lexicon: Lexicon (or path to JSON / .idx) for benefit statements
+        """
+        self.ingredient_lexicon = ingredient_lexicon
+        self.benefit_lexicon = benefit_lexicon
         self.blocks = self._register_blocks()
+        self.cache = cache
+
+    @property
+    def version(self) -> str:
+        """Identity for reusing stored outputs: changes with any block's version (incl. lexicon digests)"""
+        return ",".join(f"{name}={block.version}" for name, block in self.blocks.items())
 
     # Add this method to ContentBlockManager class:
     def process(self, product):
@@ -24,38 +52,72 @@ class ContentBlockManager:
     def _register_blocks(self) -> Dict[str, ContentLogicBlock]:
         """Register all available blocks"""
         return {
-            "benefits": BenefitsGeneratorBlock(),
+            "benefits": BenefitsGeneratorBlock(self.benefit_lexicon),
             "usage": UsageExtractorBlock(),
-            "ingredients": IngredientAnalyzerBlock(),
+            "ingredients": IngredientAnalyzerBlock(self.ingredient_lexicon),
             "safety": SafetyWarningBlock(),
             "price": PriceFormatterBlock()
         }
     
-    def apply_blocks(self, product: ProductData, block_names: List[str] = None) -> Dict[str, Any]:
+    def apply_blocks(self, product: "ProductData", block_names: List[str] = None) -> Dict[str, Any]:
         """
         Apply specified blocks to product data.
         If no blocks specified, apply all.
         """
-        print("🔧 [ContentBlockManager] Applying logic blocks...")
+        logger.debug("🔧 [ContentBlockManager] Applying logic blocks...")
         
         results = {}
         
         if block_names is None:
             block_names = list(self.blocks.keys())
+        blocks = [self.blocks[name] for name in block_names if name in self.blocks]
         
+        # An unchanged product is one lookup for all its blocks; otherwise the
+        # per-block entries still spare the blocks whose fields did not change
+        product_key = None
+        if self.cache is not None:
+            product_key = product_cache_key(blocks, product)
+            cached = self.cache.get(product_key)
+            if cached is not MISSING:
+                logger.debug("✅ [ContentBlockManager] Reused %d cached blocks", len(cached))
+                return dict(cached)
+        
+        failed = False
         for block_name in block_names:
             if block_name in self.blocks:
                 block = self.blocks[block_name]
                 try:
-                    results[block_name] = block.apply(product)
-                    print(f"   ✅ Applied: {block.name}")
+                    results[block_name] = self._apply_block(block, product)
+                    logger.debug("   ✅ Applied: %s", block.name)
                 except Exception as e:
-                    print(f"   ❌ Failed: {block.name} - {e}")
+                    logger.error("   ❌ Failed: %s - %s", block.name, e)
                     results[block_name] = {"error": str(e)}
+                    failed = True
+        
+        if product_key is not None and not failed:
+            self.cache.set(product_key, dict(results))
         
-        print(f"✅ [ContentBlockManager] Applied {len(results)} blocks")
+        logger.debug("✅ [ContentBlockManager] Applied %d blocks", len(results))
         return results
     
+    def _apply_block(self, block: ContentLogicBlock, product: "ProductData") -> Dict[str, Any]:
+        """Apply one block, going through the cache when configured"""
+        with get_tracer().span(block.name, "block") as span:
+            if self.cache is None:
+                return block.apply(product)
+            
+            key = block.cache_key(product)
+            result = self.cache.get(key)
+            span["cached"] = result is not MISSING
+            if result is MISSING:
+                result = block.apply(product)
+                self.cache.set(key, result)
+            return result
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the configured cache"""
+        return self.cache.stats() if self.cache is not None else {}
+    
     def get_available_blocks(self) -> List[Dict[str, str]]:
         """List all available blocks"""
         return [
@@ -1,17 +1,21 @@
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 from .base import ContentLogicBlock
-from ..models.product import ProductData
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
 
 class PriceFormatterBlock(ContentLogicBlock):
     """
     Formats price information and value analysis.
     """
     
+    source_fields = ("price",)
+    
     @property
     def name(self):
         return "format-price-block"
     
-    def apply(self, product: ProductData) -> Dict[str, Any]:
+    def apply(self, product: "ProductData") -> Dict[str, Any]:
         price_text = product.price
         
         # Extract numeric value
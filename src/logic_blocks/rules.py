@@ -0,0 +1,116 @@
+import re
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+class KeywordRuleSet:
+    """
+    Keyword → output rules compiled into a single regex automaton.
+
+    Keywords are merged into a trie and emitted as one nested regex, so a
+    text is scanned once and the cost per position depends on keyword
+    length, not on how many rules exist. Matching is case-insensitive
+    substring matching, the same as ``keyword in text.lower()``.
+
+    Rules are compiled as they are added, and the compiled state is swapped
+    in as a whole, so a rule set can be shared by threads without locking.
+
+    Example:
+        rules = KeywordRuleSet([("drops", "Take 2-3 drops"), ("morning", "Use in the morning")])
+        rules.apply("Apply 2 drops in the morning")  # ["Take 2-3 drops", "Use in the morning"]
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, Any]] = ()):
+        self._rules: Tuple[Tuple[str, Any], ...] = tuple(
+            (self._normalize(keyword), output) for keyword, output in rules
+        )
+        # (rules, pattern, prefixes, rule index), replaced together
+        self._compiled = self._compile(self._rules)
+
+    def add(self, keyword: str, output: Any):
+        """Add a rule; outputs are returned in the order rules were added"""
+        self._rules += ((self._normalize(keyword), output),)
+        self._compiled = self._compile(self._rules)
+
+    def matches(self, text: str) -> Set[str]:
+        """Return every keyword that occurs in text"""
+        return self._matches(self._compiled, text)
+
+    def apply(self, text: str) -> List[Any]:
+        """Return outputs of all matching rules, in rule order"""
+        compiled = self._compiled
+        rules, _, _, rule_index = compiled
+        found = self._matches(compiled, text)
+        positions = sorted(position for keyword in found for position in rule_index[keyword])
+        return [rules[position][1] for position in positions]
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    @staticmethod
+    def _normalize(keyword: str) -> str:
+        keyword = keyword.lower()
+        if not keyword:
+            raise ValueError("Keyword must not be empty")
+        return keyword
+
+    @staticmethod
+    def _matches(compiled: Tuple[Any, ...], text: str) -> Set[str]:
+        _, pattern, prefixes, _ = compiled
+        found = set()
+        if pattern is None:
+            return found
+
+        for match in pattern.finditer(text.lower()):
+            keyword = match.group(1)
+            if keyword not in found:
+                found.add(keyword)
+                # The scan reports the longest keyword at each position;
+                # shorter keywords that are its prefixes matched there too
+                found.update(prefixes.get(keyword, ()))
+        return found
+
+    def _compile(self, rules: Tuple[Tuple[str, Any], ...]) -> Tuple[Any, ...]:
+        """Build (rules, pattern, prefixes, rule index) for a tuple of rules"""
+        if not rules:
+            return rules, None, {}, {}
+
+        keywords = sorted({keyword for keyword, _ in rules})
+
+        trie: Dict[str, Any] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        # Keywords that end part-way along each keyword's trie path
+        prefixes: Dict[str, List[str]] = {}
+        for keyword in keywords:
+            node, keyword_prefixes = trie, []
+            for length, char in enumerate(keyword[:-1], 1):
+                node = node[char]
+                if "" in node:
+                    keyword_prefixes.append(keyword[:length])
+            prefixes[keyword] = keyword_prefixes
+
+        rule_index: Dict[str, List[int]] = {}
+        for position, (keyword, _) in enumerate(rules):
+            rule_index.setdefault(keyword, []).append(position)
+
+        # Lookahead so overlapping keywords starting at different positions are all seen
+        pattern = re.compile(f"(?=({self._trie_to_regex(trie)}))", re.DOTALL)
+        return rules, pattern, prefixes, rule_index
+
+    def _trie_to_regex(self, node: Dict[str, Any]) -> str:
+        branches = [
+            re.escape(char) + self._trie_to_regex(child)
+            for char, child in sorted(node.items())
+            if char != ""
+        ]
+        if not branches:
+            return ""
+
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # A keyword ends here: the longer continuations are optional (greedy)
+        if "" in node:
+            return f"(?:{body})?"
+        return body
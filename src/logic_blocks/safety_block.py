@@ -1,37 +1,48 @@
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 from .base import ContentLogicBlock
-from ..models.product import ProductData
+from .rules import KeywordRuleSet
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
 
 class SafetyWarningBlock(ContentLogicBlock):
     """
     Formats safety information and warnings.
     """
     
+    source_fields = ("side_effects", "skin_type")
+    
+    # Keyword in side effects → (warning, recommendation)
+    SIDE_EFFECT_RULES = KeywordRuleSet([
+        ("tingling", ("Mild tingling may occur initially", "Start with patch test")),
+        ("sensitive", ("Extra caution for sensitive skin", "Use every other day at first"))
+    ])
+    
+    # Exact skin type → recommendation
+    SKIN_TYPE_RECOMMENDATIONS = {
+        "Oily": "Suitable for oily skin - non-comedogenic",
+        "Combination": "Balances both oily and dry areas"
+    }
+    
     @property
     def name(self):
         return "safety-warning-block"
     
-    def apply(self, product: ProductData) -> Dict[str, Any]:
+    def apply(self, product: "ProductData") -> Dict[str, Any]:
         side_effects = product.side_effects
         skin_types = product.skin_type
         
         warnings = []
         recommendations = []
         
-        if "tingling" in side_effects.lower():
-            warnings.append("Mild tingling may occur initially")
-            recommendations.append("Start with patch test")
-        
-        if "sensitive" in side_effects.lower():
-            warnings.append("Extra caution for sensitive skin")
-            recommendations.append("Use every other day at first")
-        
-        # Add based on skin type
-        if "Oily" in skin_types:
-            recommendations.append("Suitable for oily skin - non-comedogenic")
+        for warning, recommendation in self.SIDE_EFFECT_RULES.apply(side_effects):
+            warnings.append(warning)
+            recommendations.append(recommendation)
         
-        if "Combination" in skin_types:
-            recommendations.append("Balances both oily and dry areas")
+        # Add based on skin type, in table order
+        for skin_type, recommendation in self.SKIN_TYPE_RECOMMENDATIONS.items():
+            if skin_type in skin_types:
+                recommendations.append(recommendation)
         
         return {
             "side_effects": side_effects,
@@ -1,29 +1,33 @@
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
 from .base import ContentLogicBlock
-from ..models.product import ProductData
+from .rules import KeywordRuleSet
+
+if TYPE_CHECKING:
+    from ..models.product import ProductData
 
 class UsageExtractorBlock(ContentLogicBlock):
     """
     Formats usage instructions into structured steps.
     """
     
+    source_fields = ("how_to_use",)
+    
+    # Keyword in usage text → step
+    STEP_RULES = KeywordRuleSet([
+        ("drops", "Take 2-3 drops of serum"),
+        ("morning", "Use in the morning routine"),
+        ("sunscreen", "Apply before sunscreen for protection")
+    ])
+    
     @property
     def name(self):
         return "extract-usage-block"
     
-    def apply(self, product: ProductData) -> Dict[str, Any]:
+    def apply(self, product: "ProductData") -> Dict[str, Any]:
         usage_text = product.how_to_use
         
         # Extract steps from usage text
-        steps = []
-        if "drops" in usage_text.lower():
-            steps.append("Take 2-3 drops of serum")
-        
-        if "morning" in usage_text.lower():
-            steps.append("Use in the morning routine")
-        
-        if "sunscreen" in usage_text.lower():
-            steps.append("Apply before sunscreen for protection")
+        steps = self.STEP_RULES.apply(usage_text)
         
         # Add default steps if none found
         if not steps:
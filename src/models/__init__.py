@@ -1,3 +1,20 @@
-from .product import ProductData, FAQItem, ProductPage, ComparisonProduct
+from typing import TYPE_CHECKING
+from ..utils.lazy import lazy_exports
 
-__all__ = ["ProductData", "FAQItem", "ProductPage", "ComparisonProduct"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .product import ProductData, FAQItem, ProductPage, ComparisonProduct
+    from .records import ProductRecord, FAQRecord
+
+# Public name -> submodule defining it, imported on first attribute access
+_EXPORTS = {
+    "ProductData": ".product",
+    "FAQItem": ".product",
+    "ProductPage": ".product",
+    "ComparisonProduct": ".product",
+    "ProductRecord": ".records",
+    "FAQRecord": ".records"
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,116 @@
+from typing import TYPE_CHECKING, List, Dict, Any
+from datetime import datetime
+
+if TYPE_CHECKING:
+    from .product import ProductData, FAQItem
+
+# The records are built without pydantic; .product (and with it pydantic)
+# is only imported when converting to or from the models
+
+class ProductRecord:
+    """
+    Compact, slots-backed product passed between agents, blocks and templates.
+
+    Carries the same fields as ProductData but without pydantic overhead.
+    Validation happens once at the boundary (ParserAgent); use to_model()
+    to get a validated ProductData back out.
+
+    Records compare equal by field values and, like the (non-frozen)
+    pydantic models, are mutable and therefore unhashable: key caches and
+    sets by a fingerprint of the fields instead.
+    """
+
+    __slots__ = ("name", "concentration", "skin_type", "key_ingredients", "benefits",
+                 "how_to_use", "side_effects", "price", "timestamp")
+
+    def __init__(self, name: str, concentration: str, skin_type: List[str],
+                 key_ingredients: List[str], benefits: List[str], how_to_use: str,
+                 side_effects: str, price: str, timestamp: datetime = None):
+        self.name = name
+        self.concentration = concentration
+        self.skin_type = skin_type
+        self.key_ingredients = key_ingredients
+        self.benefits = benefits
+        self.how_to_use = how_to_use
+        self.side_effects = side_effects
+        self.price = price
+        self.timestamp = timestamp or datetime.now()
+
+    @classmethod
+    def from_model(cls, product: "ProductData") -> "ProductRecord":
+        """Convert a validated ProductData (fields are shared, not copied)"""
+        return cls(product.name, product.concentration, product.skin_type,
+                   product.key_ingredients, product.benefits, product.how_to_use,
+                   product.side_effects, product.price, product.timestamp)
+
+    def to_model(self) -> "ProductData":
+        """Convert back to a validated ProductData"""
+        from .product import ProductData
+        return ProductData(**self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    # Same call shape as pydantic models so existing consumers keep working
+    model_dump = to_dict
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ProductRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    # Mutable and compared by value, so deliberately unhashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ProductRecord(name={self.name!r}, price={self.price!r})"
+
+class FAQRecord:
+    """
+    Compact, slots-backed FAQ entry produced by QuestionGeneratorAgent.
+
+    Mirrors FAQItem; to_dict() is a plain dict build, replacing the
+    model_dump() round-trip when templates consume questions. Compared by
+    value and unhashable, like ProductRecord.
+    """
+
+    __slots__ = ("id", "category", "question", "answer", "source_data")
+
+    def __init__(self, id: int, category: str, question: str, answer: str, source_data: List[str]):
+        self.id = id
+        self.category = category
+        self.question = question
+        self.answer = answer
+        self.source_data = source_data
+
+    @classmethod
+    def from_model(cls, item: "FAQItem") -> "FAQRecord":
+        return cls(item.id, item.category, item.question, item.answer, item.source_data)
+
+    def to_model(self) -> "FAQItem":
+        """Convert to a validated FAQItem"""
+        from .product import FAQItem
+        return FAQItem(**self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "category": self.category,
+            "question": self.question,
+            "answer": self.answer,
+            "source_data": self.source_data
+        }
+
+    # Same call shape as pydantic models so existing consumers keep working
+    model_dump = to_dict
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, FAQRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    # Mutable and compared by value, so deliberately unhashable
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"FAQRecord(id={self.id!r}, category={self.category!r}, question={self.question!r})"
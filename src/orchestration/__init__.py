@@ -1,4 +1,30 @@
-from .models import DAGNode, NodeStatus, WorkflowContext
-from .dag import DAGOrchestrator
+from typing import TYPE_CHECKING
+from ..utils.lazy import lazy_exports
 
-__all__ = ["DAGNode", "NodeStatus", "WorkflowContext", "DAGOrchestrator"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .models import DAGNode, NodeStatus, WorkflowContext
+    from .inputs import InputBinding, ContextKey, ReadOnly, Projection, InputMapping
+    from .dag import DAGOrchestrator
+    from .async_dag import AsyncDAGOrchestrator
+    from .sharding import ShardedCatalogRunner
+    from .workflow import build_content_workflow
+
+# Public name -> submodule defining it, imported on first attribute access
+_EXPORTS = {
+    "DAGNode": ".models",
+    "NodeStatus": ".models",
+    "WorkflowContext": ".models",
+    "InputBinding": ".inputs",
+    "ContextKey": ".inputs",
+    "ReadOnly": ".inputs",
+    "Projection": ".inputs",
+    "InputMapping": ".inputs",
+    "DAGOrchestrator": ".dag",
+    "AsyncDAGOrchestrator": ".async_dag",
+    "ShardedCatalogRunner": ".sharding",
+    "build_content_workflow": ".workflow"
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,224 @@
+import asyncio
+import contextvars
+import inspect
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable, AsyncIterator
+from .dag import DAGOrchestrator, AgentRun, _run_agent, _plain
+from .inputs import InputBinding
+from .models import DAGNode, NodeStatus, WorkflowContext
+
+class AsyncDAGOrchestrator(DAGOrchestrator):
+    """
+    asyncio-native DAG orchestrator.
+
+    Agents may expose ``async def process``; synchronous agents are run in
+    the orchestrator's worker pool via ``loop.run_in_executor`` so they never
+    block the event loop. Ready nodes are scheduled concurrently, each node
+    can have a timeout, and when a node fails or the caller cancels, every
+    other running node is cancelled.
+
+    Note: cancelling a synchronous agent only abandons its result; the worker
+    thread finishes the call in the background.
+    """
+
+    def __init__(self, node_timeout: Optional[float] = None, **orchestrator_options: Any):
+        """
+        Args:
+            node_timeout: Default per-node timeout in seconds (None = no limit)
+            **orchestrator_options: Passed to DAGOrchestrator (max_workers and
+                executor configure the pool used for synchronous agents)
+        """
+        super().__init__(**orchestrator_options)
+        self.node_timeout = node_timeout
+        self.node_timeouts: Dict[str, Optional[float]] = {}
+
+    def add_node(self, name: str, agent: Any, dependencies: List[str] = None,
+                 inputs: Optional[InputBinding] = None, timeout: Optional[float] = None):
+        """
+        Add a node/agent to the DAG.
+
+        Args:
+            name: Unique node name
+            agent: Agent instance with a sync or async process() method
+            dependencies: List of node names that must complete before this node
+            inputs: How the node's input is built from the context
+            timeout: Timeout in seconds for this node, overriding node_timeout
+        """
+        super().add_node(name, agent, dependencies, inputs)
+        if timeout is not None:
+            self.node_timeouts[name] = timeout
+
+    async def execute_async(self, initial_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the complete DAG workflow on the running event loop.
+
+        Args:
+            initial_data: Initial input data
+
+        Returns:
+            Final context with all outputs
+        """
+        self.context = WorkflowContext(initial_data)
+        for node in self.nodes.values():
+            node.reset()
+
+        if self._order_dirty:
+            self.build_execution_order()
+
+        # Node tasks created below copy the context, and with it the tracer
+        with self.tracer.activate(), self.tracer.span("workflow", "workflow"):
+            await self._run_nodes()
+
+        return self._generate_final_outputs()
+
+    async def _run_nodes(self):
+        """Schedule every node as soon as its dependencies complete"""
+        pending = list(self.execution_order)
+        running: Dict[asyncio.Task, DAGNode] = {}
+        error: Optional[BaseException] = None
+
+        try:
+            while pending or running:
+                if error is None:
+                    for node_name in list(pending):
+                        node = self.nodes[node_name]
+                        dep_statuses = [self.nodes[dep].status for dep in node.dependencies]
+
+                        if any(status in (NodeStatus.FAILED, NodeStatus.SKIPPED, NodeStatus.CANCELLED)
+                               for status in dep_statuses):
+                            pending.remove(node_name)
+                            self._skip_node(node)
+                        elif all(status == NodeStatus.COMPLETED for status in dep_statuses):
+                            pending.remove(node_name)
+                            try:
+                                input_data = self._start_node(node)
+                                if not self._reuse_stored_output(node, input_data):
+                                    running[asyncio.create_task(self._run_node(node, input_data))] = node
+                            except Exception as e:
+                                self._fail_node(node, e)
+                                error = error or e
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = running.pop(task)
+                    if task.cancelled():
+                        self._cancel_node(node)
+                        continue
+                    try:
+                        self._complete_node(node, task.result())
+                    except Exception as e:
+                        self._fail_node(node, e)
+                        error = error or e
+
+                # Fail fast: stop the rest of the workflow
+                if error is not None:
+                    await self._cancel_running(running)
+        except asyncio.CancelledError:
+            await self._cancel_running(running)
+            raise
+
+        if error is not None:
+            raise error
+
+    async def execute_many_async(self, raw_products: Iterable[Dict[str, Any]],
+                                 concurrency: int = 16,
+                                 stop_on_error: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run one workflow per product concurrently on the event loop.
+
+        At most ``concurrency`` workflows are in flight; each uses a fork of
+        this orchestrator so node state is never shared. Results are yielded
+        in input order.
+
+        Args:
+            raw_products: Iterable of raw product dicts
+            concurrency: Maximum number of workflows in flight
+            stop_on_error: Re-raise the first failure instead of yielding an error result
+
+        Yields:
+            Final outputs for each product, in input order
+        """
+        # Create the shared pool before forking so every fork uses it
+        self._get_executor()
+        in_flight: deque = deque()
+        products = iter(enumerate(raw_products))
+
+        def launch() -> bool:
+            for index, raw_product in products:
+                workflow = self.fork()
+                task = asyncio.ensure_future(workflow.execute_async({"initial_data": raw_product}))
+                in_flight.append((index, workflow, task))
+                return True
+            return False
+
+        try:
+            while len(in_flight) < concurrency and launch():
+                pass
+
+            while in_flight:
+                index, workflow, task = in_flight.popleft()
+                try:
+                    result = await task
+                except Exception as e:
+                    if stop_on_error:
+                        raise
+                    result = workflow._error_result(index, e)
+                launch()
+                yield result
+        finally:
+            for _, _, task in in_flight:
+                task.cancel()
+
+    async def _run_node(self, node: DAGNode, input_data: Any) -> AgentRun:
+        """Run one agent, awaiting async agents and off-loading sync ones"""
+        timeout = self.node_timeouts.get(node.name, self.node_timeout)
+
+        if inspect.iscoroutinefunction(node.agent.process):
+            call = self._run_async_agent(node.agent, input_data)
+        else:
+            # Timed inside the worker, like parallel mode, so queue wait is excluded
+            loop = asyncio.get_running_loop()
+            if self.executor_type == "thread":
+                # run_in_executor does not carry the context over; copy it so spans reach the tracer
+                call = loop.run_in_executor(
+                    self._get_executor(), contextvars.copy_context().run, _run_agent, node.agent, input_data
+                )
+            else:
+                call = loop.run_in_executor(self._get_executor(), _run_agent, node.agent, _plain(input_data))
+
+        try:
+            return await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Node '{node.name}' timed out after {timeout}s") from None
+
+    async def _run_async_agent(self, agent: Any, input_data: Any) -> AgentRun:
+        started_at = datetime.now()
+        start_ns = time.perf_counter_ns()
+        output = await agent.process(input_data)
+        # Wall time including awaits; the span shares the event loop thread
+        return AgentRun(output, started_at, start_ns, time.perf_counter_ns() - start_ns, threading.get_ident())
+
+    async def _cancel_running(self, running: Dict[asyncio.Task, DAGNode]):
+        """Cancel in-flight node tasks and record how each one ended"""
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        for task, node in running.items():
+            if task.cancelled():
+                self._cancel_node(node)
+            elif task.exception() is not None:
+                self._fail_node(node, task.exception())
+            else:
+                self._complete_node(node, task.result())
+        running.clear()
+
+    def _cancel_node(self, node: DAGNode):
+        node.status = NodeStatus.CANCELLED
+        node.completed_at = datetime.now()
+        self.context.log_execution(node.name, "cancelled", "Cancelled before completion")
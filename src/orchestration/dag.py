@@ -1,19 +1,112 @@
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import contextvars
+import copy
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, NamedTuple, Iterable, Iterator
+from datetime import datetime, timedelta
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
 from .models import DAGNode, NodeStatus, WorkflowContext
+from .fingerprint import fingerprint
+from .inputs import InputBinding, default_inputs
+from ..utils.cache import ResultCache, MISSING
+from ..utils.tracing import Tracer, NULL_TRACER
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_TYPES = ("thread", "process")
+
+# Template node -> key of the page it produces in the final outputs
+PAGE_OUTPUTS = {
+    "faq_template": "faq",
+    "product_template": "product_page",
+    "comparison_template": "comparison_page"
+}
+
+
+class AgentRun(NamedTuple):
+    """An agent's output and the timing of the call that produced it"""
+    output: Any
+    started_at: datetime
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+
+
+def _run_agent(agent: Any, input_data: Any) -> AgentRun:
+    """Run an agent (possibly inside a pool worker) and time the call itself, not the queue wait"""
+    started_at = datetime.now()
+    start_ns = time.perf_counter_ns()
+    output = agent.process(input_data)
+    return AgentRun(output, started_at, start_ns, time.perf_counter_ns() - start_ns, threading.get_ident())
+
+
+def _plain(value: Any) -> Any:
+    """Copy read-only views into plain containers so they can be pickled to a worker process"""
+    if type(value) is MappingProxyType:
+        return {key: _plain(item) for key, item in value.items()}
+    if type(value) is tuple:
+        return tuple(_plain(item) for item in value)
+    return value
+
 
 class DAGOrchestrator:
     """
     Manages DAG (Directed Acyclic Graph) workflow execution.
     Executes agents in proper order based on dependencies.
+
+    With ``parallel=True`` every node is submitted to a worker pool as soon as
+    all of its dependencies have completed, so independent branches
+    (e.g. question_generator and content_blocks) overlap. Context updates and
+    execution logging always happen on the calling thread.
+    
+    With a ``result_store`` the DAG is evaluated incrementally: each node's
+    input is fingerprinted, and a node whose fingerprint was seen in a
+    previous run reuses the stored output instead of running its agent.
+    
+    With a ``page_sink`` each page is handed to the sink as soon as its
+    template node completes and is not kept in the context, so batch runs
+    hold only the products in flight rather than every rendered page.
+    
+    With a ``tracer`` every node, logic block and template is timed with
+    perf_counter_ns and reported to the tracer's exporters.
     """
     
-    def __init__(self):
+    def __init__(self, parallel: bool = False, max_workers: Optional[int] = None,
+                 executor: str = "thread", result_store: Optional[ResultCache] = None,
+                 page_sink: Optional[Any] = None, tracer: Optional[Tracer] = None):
+        """
+        Args:
+            parallel: Run ready nodes concurrently instead of one at a time
+            max_workers: Pool size for parallel mode (None = executor default)
+            executor: "thread" or "process". Process pools require picklable
+                agents, inputs and outputs; agent state mutated inside a worker
+                is not reflected back in this process.
+            result_store: Cache of node outputs keyed by input fingerprint.
+                Use a SQLiteCache to keep fingerprints between runs.
+            page_sink: Object with ``write(page, document)`` (e.g. PageStreamWriter)
+                that receives pages instead of the final outputs
+            tracer: Tracer receiving node/block/template spans
+                (see src/utils/tracing.py)
+        """
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTOR_TYPES}")
+        
         self.nodes: Dict[str, DAGNode] = {}
         self.context = WorkflowContext()
         self.execution_order: List[str] = []
+        self._order_dirty = True
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.executor_type = executor
+        self.result_store = result_store
+        self.page_sink = page_sink
+        self.tracer = tracer or NULL_TRACER
+        self._executor: Optional[Executor] = None
     
-    def add_node(self, name: str, agent: Any, dependencies: List[str] = None):
+    def add_node(self, name: str, agent: Any, dependencies: List[str] = None,
+                 inputs: Optional[InputBinding] = None):
         """
         Add a node/agent to the DAG.
         
@@ -21,16 +114,20 @@ class DAGOrchestrator:
             name: Unique node name
             agent: Agent instance
             dependencies: List of node names that must complete before this node
+            inputs: How the node's input is built from the context (see
+                orchestration.inputs); defaults to the binding conventional
+                for the node name
         """
         if name in self.nodes:
             raise ValueError(f"Node '{name}' already exists")
         
-        self.nodes[name] = DAGNode(name, agent, dependencies or [])
-        print(f"📌 Added node: {name} (dependencies: {dependencies or []})")
+        self.nodes[name] = DAGNode(name, agent, dependencies or [], inputs or default_inputs(name))
+        self._order_dirty = True
+        logger.debug("📌 Added node: %s (dependencies: %s)", name, dependencies or [])
     
     def build_execution_order(self):
         """Calculate execution order using topological sort"""
-        print("🧮 Building execution order...")
+        logger.debug("🧮 Building execution order...")
         
         # Reset
         self.execution_order = []
@@ -50,6 +147,9 @@ class DAGOrchestrator:
                     if dep not in self.nodes:
                         raise Exception(f"Dependency '{dep}' not found for node '{node_name}'")
                     visit(dep)
+                node.ancestors = frozenset(node.dependencies).union(
+                    *(self.nodes[dep].ancestors for dep in node.dependencies)
+                )
                 
                 temp_visited.remove(node_name)
                 visited.add(node_name)
@@ -60,7 +160,8 @@ class DAGOrchestrator:
             if node_name not in visited:
                 visit(node_name)
         
-        print(f"✅ Execution order: {' → '.join(self.execution_order)}")
+        self._order_dirty = False
+        logger.info("✅ Execution order: %s", " → ".join(self.execution_order))
     
     def execute(self, initial_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -72,32 +173,35 @@ class DAGOrchestrator:
         Returns:
             Final context with all outputs
         """
-        print("\n" + "="*50)
-        print("🚀 STARTING DAG WORKFLOW EXECUTION")
-        print("="*50)
+        logger.info("\n%s\n🚀 STARTING DAG WORKFLOW EXECUTION\n%s", "=" * 50, "=" * 50)
         
         # Set initial data
         self.context = WorkflowContext(initial_data)
+        for node in self.nodes.values():
+            node.reset()
         
-        # Build execution order
-        self.build_execution_order()
+        # Build execution order (once, unless nodes were added since)
+        if self._order_dirty:
+            self.build_execution_order()
         
-        # Execute nodes in order
-        for node_name in self.execution_order:
-            node = self.nodes[node_name]
-            
-            # Check if dependencies are satisfied
-            if not self._check_dependencies(node):
-                node.status = NodeStatus.SKIPPED
-                self.context.log_execution(node_name, "skipped", "Dependencies not met")
-                continue
-            
-            # Execute node
-            self._execute_node(node)
+        # Blocks and templates find the tracer through get_tracer()
+        with self.tracer.activate(), self.tracer.span("workflow", "workflow"):
+            if self.parallel:
+                self._execute_parallel()
+            else:
+                # Execute nodes in order
+                for node_name in self.execution_order:
+                    node = self.nodes[node_name]
+                    
+                    # Check if dependencies are satisfied
+                    if not self._check_dependencies(node):
+                        self._skip_node(node)
+                        continue
+                    
+                    # Execute node
+                    self._execute_node(node)
         
-        print("\n" + "="*50)
-        print("🎉 DAG WORKFLOW COMPLETED SUCCESSFULLY")
-        print("="*50)
+        logger.info("\n%s\n🎉 DAG WORKFLOW COMPLETED SUCCESSFULLY\n%s", "=" * 50, "=" * 50)
         
         # Generate final outputs
         return self._generate_final_outputs()
@@ -107,118 +211,274 @@ class DAGOrchestrator:
         for dep_name in node.dependencies:
             dep_node = self.nodes[dep_name]
             if dep_node.status != NodeStatus.COMPLETED:
-                print(f"   ⏸️  Node '{node.name}' waiting for '{dep_name}'")
+                logger.debug("   ⏸️  Node '%s' waiting for '%s'", node.name, dep_name)
                 return False
         return True
     
-    def _execute_node(self, node: DAGNode):
-        """Execute a single node/agent"""
-        print(f"\n🔧 Executing: {node.name}")
+    def execute_many(self, raw_products: Iterable[Dict[str, Any]],
+                     stop_on_error: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the workflow once per product, reusing this DAG and its agents.
         
-        node.status = NodeStatus.RUNNING
-        node.started_at = datetime.now()
-        self.context.log_execution(node.name, "running")
+        Results are yielded as soon as each product finishes so callers can
+        stream them instead of holding the whole batch in memory.
         
-        try:
-            # Prepare input data for agent
-            input_data = self._prepare_node_input(node)
-            
-            # All agents should have a process method now
-            output = node.agent.process(input_data)
-            
-            node.output = output
+        Args:
+            raw_products: Iterable of raw product dicts (the parser's input)
+            stop_on_error: Re-raise the first failure instead of yielding an
+                error result and moving on to the next product
             
-            # Store output in context
-            self.context.set(node.name, output)
+        Yields:
+            Final outputs for each product, in input order
+        """
+        for index, raw_product in enumerate(raw_products):
+            try:
+                yield self.execute({"initial_data": raw_product})
+            except Exception as e:
+                if stop_on_error:
+                    raise
+                yield self._error_result(index, e)
+    
+    def _error_result(self, index: int, error: BaseException) -> Dict[str, Any]:
+        """Result yielded for a product whose workflow failed in a batch run"""
+        return {
+            "error": str(error) or type(error).__name__,
+            "metadata": {
+                "workflow_completed": False,
+                "batch_index": index,
+                "total_nodes": len(self.nodes),
+                "successful_nodes": len([n for n in self.nodes.values() if n.status == NodeStatus.COMPLETED]),
+                "execution_summary": self.context.get_summary()
+            }
+        }
+    
+    def fork(self) -> "DAGOrchestrator":
+        """
+        Create an orchestrator sharing this one's agents, configuration and
+        worker pool but with its own node state and context, so several
+        workflows can run at the same time. Only shut down the original.
+        """
+        clone = copy.copy(self)
+        clone.nodes = {name: copy.copy(node) for name, node in self.nodes.items()}
+        for node in clone.nodes.values():
+            node.reset()
+        clone.context = WorkflowContext()
+        clone.execution_order = list(self.execution_order)
+        return clone
+    
+    def _execute_parallel(self):
+        """Run every node as soon as its dependencies complete, using the worker pool"""
+        executor = self._get_executor()
+        pending = list(self.execution_order)
+        running: Dict[Future, DAGNode] = {}
+        error: Optional[Exception] = None
+        
+        while pending or running:
+            # Submit every node whose dependencies are settled
+            if error is None:
+                for node_name in list(pending):
+                    node = self.nodes[node_name]
+                    dep_statuses = [self.nodes[dep].status for dep in node.dependencies]
+                    
+                    if any(status in (NodeStatus.FAILED, NodeStatus.SKIPPED) for status in dep_statuses):
+                        pending.remove(node_name)
+                        self._skip_node(node)
+                    elif all(status == NodeStatus.COMPLETED for status in dep_statuses):
+                        pending.remove(node_name)
+                        try:
+                            input_data = self._start_node(node)
+                            if not self._reuse_stored_output(node, input_data):
+                                running[self._submit(executor, node, input_data)] = node
+                        except Exception as e:
+                            self._fail_node(node, e)
+                            error = error or e
             
-            node.status = NodeStatus.COMPLETED
-            node.completed_at = datetime.now()
+            if not running:
+                break
             
-            duration = (node.completed_at - node.started_at).total_seconds()
-            print(f"   ✅ {node.name} completed in {duration:.2f}s")
-            self.context.log_execution(node.name, "completed", f"Duration: {duration:.2f}s")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                try:
+                    self._complete_node(node, future.result())
+                except Exception as e:
+                    self._fail_node(node, e)
+                    error = error or e
+        
+        if error is not None:
+            raise error
+    
+    def _submit(self, executor: Executor, node: DAGNode, input_data: Any) -> Future:
+        """Submit a node to the pool; thread workers inherit the active tracer"""
+        if self.executor_type == "thread":
+            return executor.submit(contextvars.copy_context().run, _run_agent, node.agent, input_data)
+        return executor.submit(_run_agent, node.agent, _plain(input_data))
+    
+    def _get_executor(self) -> Executor:
+        """Lazily create the worker pool; it is reused across execute() calls"""
+        if self._executor is None:
+            if self.executor_type == "process":
+                # Imported here: it loads multiprocessing, which thread mode never needs
+                from concurrent.futures import ProcessPoolExecutor
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="dag-node"
+                )
+        return self._executor
+    
+    def shutdown(self):
+        """Release the worker pool used by parallel mode"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+    
+    def _execute_node(self, node: DAGNode):
+        """Execute a single node/agent"""
+        try:
+            input_data = self._start_node(node)
+            if self._reuse_stored_output(node, input_data):
+                return
             
+            # All agents should have a process method now
+            run = _run_agent(node.agent, input_data)
         except Exception as e:
-            node.status = NodeStatus.FAILED
-            node.error = str(e)
-            node.completed_at = datetime.now()
-            
-            print(f"   ❌ {node.name} failed: {e}")
-            self.context.log_execution(node.name, "failed", str(e))
+            self._fail_node(node, e)
             raise
+        
+        self._complete_node(node, run)
     
-    def _prepare_node_input(self, node: DAGNode) -> Any:
-        """Prepare input data for node based on dependencies"""
-        # For parser, use initial data
-        if node.name == "parser":
-            return self.context.get("initial_data")
-        
-        # For question_generator, need ProductData object
-        if node.name == "question_generator":
-            if self.context.has("parser"):
-                return self.context.get("parser")  # Return ProductData directly
-            else:
-                raise Exception("Parser output not available for question_generator")
+    def _start_node(self, node: DAGNode) -> Any:
+        """Mark a node as running and prepare its input"""
+        logger.info("🔧 Executing: %s", node.name)
         
-        # For content_blocks, need ProductData object
-        if node.name == "content_blocks":
-            if self.context.has("parser"):
-                return self.context.get("parser")  # Return ProductData directly
-            else:
-                raise Exception("Parser output not available for content_blocks")
-        
-        # For template nodes, prepare structured data
-        if "template" in node.name:
-            return self._prepare_template_data(node)
-        
-        # Default: return context data
-        return self.context.data
-    
-    def _prepare_template_data(self, node: DAGNode) -> Dict[str, Any]:
-        """Prepare data for template nodes"""
-        data = {}
-        
-        # Get product info from parser
-        if self.context.has("parser"):
-            product = self.context.get("parser")  # ProductData object
-            data["product_info"] = {
-                "name": product.name,
-                "concentration": product.concentration,
-                "skin_type": product.skin_type,
-                "price": product.price
-            }
-            data["product_a"] = data["product_info"].copy()
+        node.status = NodeStatus.RUNNING
+        node.started_at = datetime.now()
+        self.context.log_execution(node.name, "running")
         
-        # Add questions if available
-        if self.context.has("question_generator"):
-            questions = self.context.get("question_generator")  # List[FAQItem]
-            data["questions"] = [q.model_dump() for q in questions]
+        # Prepare input data for agent
+        return self._prepare_node_input(node)
+    
+    def _reuse_stored_output(self, node: DAGNode, input_data: Any) -> bool:
+        """
+        Complete the node from the result store if its input fingerprint is known.
         
-        # Add content blocks if available
-        if self.context.has("content_blocks"):
-            data["content_blocks"] = self.context.get("content_blocks")
+        Returns:
+            True if the stored output was reused and the agent must not run
+        """
+        if self.result_store is None:
+            return False
         
-        return data
+        try:
+            node.fingerprint = fingerprint(
+                node.name, type(node.agent).__qualname__, getattr(node.agent, "version", None), input_data
+            )
+        except TypeError:
+            # Input has no stable representation; always run this node
+            return False
+        
+        output = self.result_store.get(node.fingerprint)
+        if output is MISSING:
+            return False
+        
+        node.reused = True
+        self._store_output(node, output)
+        node.status = NodeStatus.COMPLETED
+        node.completed_at = datetime.now()
+        logger.info("   ♻️  %s inputs unchanged, reusing previous output", node.name)
+        self.context.log_execution(node.name, "reused", "Inputs unchanged since previous run")
+        return True
+    
+    def _complete_node(self, node: DAGNode, run: AgentRun):
+        """Record a node's output and timing and mark it completed"""
+        if node.fingerprint is not None:
+            self.result_store.set(node.fingerprint, run.output)
+        
+        self._store_output(node, run.output)
+        
+        node.status = NodeStatus.COMPLETED
+        node.started_at = run.started_at
+        node.duration_ns = run.duration_ns
+        node.completed_at = run.started_at + timedelta(microseconds=run.duration_ns // 1000)
+        self.tracer.record(node.name, "node", run.start_ns, run.duration_ns, run.thread_id)
+        
+        duration_ms = run.duration_ns / 1e6
+        logger.info("   ✅ %s completed in %.3fms", node.name, duration_ms)
+        self.context.log_execution(node.name, "completed", f"Duration: {duration_ms:.3f}ms")
+    
+    def _store_output(self, node: DAGNode, output: Any):
+        """Store output in context, or stream it to the page sink and release it"""
+        if self._streams_output(node):
+            self.page_sink.write(PAGE_OUTPUTS[node.name], output)
+            return
+        
+        node.output = output
+        self.context.set(node.name, output)
+    
+    def _streams_output(self, node: DAGNode) -> bool:
+        """Pages go to the sink unless another node still needs them as input"""
+        return (
+            self.page_sink is not None
+            and node.name in PAGE_OUTPUTS
+            and not any(node.name in other.dependencies for other in self.nodes.values())
+        )
+    
+    def _fail_node(self, node: DAGNode, error: Exception):
+        """Mark a node as failed"""
+        node.status = NodeStatus.FAILED
+        node.error = str(error)
+        node.completed_at = datetime.now()
+        
+        logger.error("   ❌ %s failed: %s", node.name, error)
+        self.context.log_execution(node.name, "failed", str(error))
+    
+    def _skip_node(self, node: DAGNode):
+        """Mark a node as skipped because its dependencies did not complete"""
+        node.status = NodeStatus.SKIPPED
+        self.context.log_execution(node.name, "skipped", "Dependencies not met")
+    
+    def _prepare_node_input(self, node: DAGNode) -> Any:
+        """
+        Build the node's input from the context as declared by its input binding.
+        
+        The binding only sees the workflow input and the outputs of the node's
+        (transitive) dependencies: those are always complete when the node
+        starts, so its input and fingerprint do not depend on which other
+        branches a parallel run happened to finish first.
+        """
+        scope = self.context.input_keys | node.ancestors
+        return node.inputs.resolve(self.context, node.name, scope)
     
     def _generate_final_outputs(self) -> Dict[str, Any]:
         """Generate final JSON outputs from templates"""
         outputs = {}
         
         # Get template outputs
-        if self.context.has("faq_template"):
-            outputs["faq"] = self.context.get("faq_template")
-        
-        if self.context.has("product_template"):
-            outputs["product_page"] = self.context.get("product_template")
-        
-        if self.context.has("comparison_template"):
-            outputs["comparison_page"] = self.context.get("comparison_template")
+        for node_name, page in PAGE_OUTPUTS.items():
+            if self.context.has(node_name):
+                outputs[page] = self.context.get(node_name)
         
         # Add workflow metadata
         outputs["metadata"] = {
             "workflow_completed": True,
             "total_nodes": len(self.nodes),
             "successful_nodes": len([n for n in self.nodes.values() if n.status == NodeStatus.COMPLETED]),
+            "reused_nodes": [n.name for n in self.nodes.values() if n.reused],
+            "unchanged_pages": [
+                page for node_name, page in PAGE_OUTPUTS.items()
+                if node_name in self.nodes and self.nodes[node_name].reused
+            ],
+            "streamed_pages": [
+                page for node_name, page in PAGE_OUTPUTS.items()
+                if node_name in self.nodes and self.nodes[node_name].status == NodeStatus.COMPLETED
+                and self._streams_output(self.nodes[node_name])
+            ],
             "execution_summary": self.context.get_summary()
         }
         
@@ -0,0 +1,48 @@
+import hashlib
+import json
+from datetime import date, datetime
+from enum import Enum
+from types import MappingProxyType
+from typing import Any
+
+# Fields that change on every run without changing content (e.g. parse time)
+VOLATILE_FIELDS = frozenset({"timestamp"})
+
+def canonicalize(value: Any) -> Any:
+    """
+    Convert a node input into a JSON-compatible structure with stable ordering.
+
+    Handles plain containers, pydantic models and the slots-backed records
+    (anything exposing to_dict()/model_dump()). Volatile fields are dropped so
+    that re-parsing the same product yields the same fingerprint.
+
+    Raises:
+        TypeError: For values that have no stable representation
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (dict, MappingProxyType)):
+        return {
+            str(key): canonicalize(item)
+            for key, item in value.items()
+            if key not in VOLATILE_FIELDS
+        }
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return canonicalize(value.value)
+
+    to_dict = getattr(value, "to_dict", None) or getattr(value, "model_dump", None)
+    if callable(to_dict):
+        return {"__type__": type(value).__name__, **canonicalize(to_dict())}
+
+    raise TypeError(f"Cannot fingerprint value of type {type(value).__name__}")
+
+def fingerprint(*parts: Any) -> str:
+    """Stable SHA-256 hex digest of the canonical form of parts"""
+    payload = json.dumps(
+        canonicalize(list(parts)), sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
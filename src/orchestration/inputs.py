@@ -0,0 +1,193 @@
+from abc import ABC, abstractmethod
+from types import MappingProxyType
+from typing import AbstractSet, Any, Callable, Dict, Mapping, Optional, Tuple
+from .models import WorkflowContext
+
+class InputBinding(ABC):
+    """
+    Declares how a node's input is built from the workflow context.
+
+    ``sources`` are the context keys the binding reads; a binding is
+    available to a node once all of them are in its scope (the workflow
+    input and its dependencies' outputs) and in the context.
+    """
+
+    sources: Tuple[str, ...] = ()
+
+    def available(self, context: WorkflowContext, scope: AbstractSet[str]) -> bool:
+        for source in self.sources:
+            if source not in scope or not context.has(source):
+                return False
+        return True
+
+    @abstractmethod
+    def resolve(self, context: WorkflowContext, node_name: str, scope: AbstractSet[str]) -> Any:
+        """
+        Build the input for node ``node_name``.
+
+        Args:
+            context: The workflow context
+            node_name: Node the input is for (used in error messages)
+            scope: Context keys the node may read
+
+        Raises:
+            LookupError: A required context key is missing or out of scope
+        """
+        pass
+
+class ContextKey(InputBinding):
+    """The value stored under one context key (e.g. an upstream node's output), as is"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.sources = (key,)
+
+    def resolve(self, context: WorkflowContext, node_name: str, scope: AbstractSet[str]) -> Any:
+        if self.key not in scope or not context.has(self.key):
+            raise LookupError(f"'{self.key}' output not available for {node_name}")
+        return context.get(self.key)
+
+    def __repr__(self):
+        return f"ContextKey({self.key!r})"
+
+class ReadOnly(ContextKey):
+    """A mapping stored under one context key, as a read-only view"""
+
+    def resolve(self, context: WorkflowContext, node_name: str, scope: AbstractSet[str]) -> Any:
+        return MappingProxyType(super().resolve(context, node_name, scope))
+
+    def __repr__(self):
+        return f"ReadOnly({self.key!r})"
+
+class Projection(InputBinding):
+    """
+    A value derived from context keys. It is computed lazily the first time
+    any node asks for it and then shared by every consumer in the run, so
+    ``compute`` must return something immutable (tuples, read-only mappings).
+    """
+
+    def __init__(self, name: str, compute: Callable[[WorkflowContext], Any], sources: Tuple[str, ...]):
+        """
+        Args:
+            name: Unique name of the projection (its cache key within a run)
+            compute: Builds the value from the context
+            sources: Context keys compute reads
+        """
+        self.name = name
+        self.compute = compute
+        self.sources = tuple(sources)
+
+    def resolve(self, context: WorkflowContext, node_name: str, scope: AbstractSet[str]) -> Any:
+        for source in self.sources:
+            if source not in scope or not context.has(source):
+                raise LookupError(f"'{source}' output not available for {node_name} ({self.name})")
+        return context.derive(("projection", self.name), self.compute)
+
+    def __repr__(self):
+        return f"Projection({self.name!r})"
+
+class InputMapping(InputBinding):
+    """
+    A read-only mapping of named bindings. Fields whose sources are not in
+    the node's scope are left out unless listed in ``required``. The mapping
+    is built once per run (per set of available fields) and shared by every
+    node bound to the same InputMapping.
+    """
+
+    def __init__(self, name: str, fields: Dict[str, InputBinding], required: Tuple[str, ...] = ()):
+        """
+        Args:
+            name: Unique name (its cache key within a run)
+            fields: Mapping key → binding
+            required: Fields that must be available
+        """
+        self.name = name
+        self.fields = dict(fields)
+        self.required = tuple(required)
+        self.sources = tuple(dict.fromkeys(
+            source for field in self.required for source in self.fields[field].sources
+        ))
+        self._field_sources = tuple(dict.fromkeys(
+            source for binding in self.fields.values() for source in binding.sources
+        ))
+
+    def resolve(self, context: WorkflowContext, node_name: str, scope: AbstractSet[str]) -> Mapping[str, Any]:
+        # Which sources are available decides the fields, so it is the cache key
+        available = tuple(
+            source for source in self._field_sources if source in scope and context.has(source)
+        )
+        return context.derive(
+            ("mapping", self.name, available),
+            lambda context: self._build(context, node_name, frozenset(available))
+        )
+
+    def _build(self, context: WorkflowContext, node_name: str, scope: AbstractSet[str]) -> Mapping[str, Any]:
+        return MappingProxyType({
+            field: binding.resolve(context, node_name, scope)
+            for field, binding in self.fields.items()
+            if field in self.required or binding.available(context, scope)
+        })
+
+    def __repr__(self):
+        return f"InputMapping({self.name!r}, {list(self.fields)})"
+
+class ContextView(InputBinding):
+    """Every context key in the node's scope, read-only"""
+
+    def resolve(self, context: WorkflowContext, node_name: str, scope: AbstractSet[str]) -> Mapping[str, Any]:
+        return MappingProxyType({key: value for key, value in context.view().items() if key in scope})
+
+    def __repr__(self):
+        return "ContextView()"
+
+def _product_info(context: WorkflowContext) -> Mapping[str, Any]:
+    product = context.get("parser")  # ProductData or ProductRecord
+    return MappingProxyType({
+        "name": product.name,
+        "concentration": product.concentration,
+        "skin_type": product.skin_type,
+        "price": product.price
+    })
+
+def _dumped_questions(context: WorkflowContext) -> Tuple[Mapping[str, Any], ...]:
+    return tuple(MappingProxyType(q.model_dump()) for q in context.get("question_generator"))
+
+RAW_PRODUCT = ContextKey("initial_data")
+PRODUCT = ContextKey("parser")
+PRODUCT_INFO = Projection("product_info", _product_info, ("parser",))
+QUESTIONS = Projection("questions", _dumped_questions, ("question_generator",))
+
+# Input of the page templates. Product A of the comparison is the product
+# itself; since the mapping is read-only it is shared, not copied
+TEMPLATE_INPUT = InputMapping("template_data", {
+    "product_info": PRODUCT_INFO,
+    "product_a": PRODUCT_INFO,
+    "questions": QUESTIONS,
+    "content_blocks": ReadOnly("content_blocks")
+})
+
+# The FAQ page needs the generated questions; the other pages never read
+# them, so they share one mapping that does not wait for question_generator
+FAQ_INPUT = InputMapping("faq_data", TEMPLATE_INPUT.fields, required=("questions",))
+PAGE_INPUT = InputMapping("page_data", {
+    field: binding for field, binding in TEMPLATE_INPUT.fields.items() if field != "questions"
+})
+
+CONTEXT_VIEW = ContextView()
+
+# Bindings for the standard node names, used when add_node() is not given any
+DEFAULT_INPUTS: Dict[str, InputBinding] = {
+    "parser": RAW_PRODUCT,
+    "question_generator": PRODUCT,
+    "content_blocks": PRODUCT,
+    "faq_template": FAQ_INPUT,
+    "product_template": PAGE_INPUT,
+    "comparison_template": PAGE_INPUT
+}
+
+def default_inputs(node_name: str) -> InputBinding:
+    """Conventional binding for a node name: DEFAULT_INPUTS, any *template* node → TEMPLATE_INPUT, else the whole context"""
+    binding: Optional[InputBinding] = DEFAULT_INPUTS.get(node_name)
+    if binding is None:
+        binding = TEMPLATE_INPUT if "template" in node_name else CONTEXT_VIEW
+    return binding
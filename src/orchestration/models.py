@@ -1,5 +1,7 @@
+import threading
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Callable, FrozenSet, Hashable, List, Mapping, Optional
 from datetime import datetime
 
 class NodeStatus(Enum):
@@ -9,19 +11,37 @@ class NodeStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     SKIPPED = "skipped"
+    CANCELLED = "cancelled"
 
 class DAGNode:
     """Represents a node/agent in the workflow"""
     
-    def __init__(self, name: str, agent: Any, dependencies: List[str] = None):
+    def __init__(self, name: str, agent: Any, dependencies: List[str] = None, inputs: Any = None):
         self.name = name
         self.agent = agent
         self.dependencies = dependencies or []
+        self.inputs = inputs  # InputBinding, see orchestration.inputs
+        # Transitive dependencies, set by build_execution_order()
+        self.ancestors: FrozenSet[str] = frozenset()
         self.status = NodeStatus.PENDING
         self.output = None
         self.started_at: Optional[datetime] = None
         self.completed_at: Optional[datetime] = None
         self.error: Optional[str] = None
+        self.fingerprint: Optional[str] = None
+        self.reused = False
+        self.duration_ns: Optional[int] = None
+    
+    def reset(self):
+        """Clear run state so the node can be executed again"""
+        self.status = NodeStatus.PENDING
+        self.output = None
+        self.started_at = None
+        self.completed_at = None
+        self.error = None
+        self.fingerprint = None
+        self.reused = False
+        self.duration_ns = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert node to dictionary for monitoring"""
@@ -31,21 +51,63 @@ class DAGNode:
             "dependencies": self.dependencies,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "duration_ms": self.duration_ns / 1e6 if self.duration_ns is not None else None,
             "has_output": self.output is not None,
+            "reused": self.reused,
             "error": self.error
         }
 
 class WorkflowContext:
-    """Shared context/data passed between nodes"""
+    """
+    Shared context/data passed between nodes.
+    
+    Only the orchestrator writes to the context. Dependents get read-only
+    views (view()) or derived values that are computed once per workflow
+    and shared by every node asking for them (derive()), instead of their
+    own copies.
+    """
     
     def __init__(self, initial_data: Dict[str, Any] = None):
         self.data = initial_data or {}
+        # Keys of the workflow input, readable by every node
+        self.input_keys = frozenset(self.data)
         self.execution_log: List[Dict[str, Any]] = []
+        self._derived: Dict[Hashable, Any] = {}
+        self._derive_lock = threading.RLock()
     
     def set(self, key: str, value: Any):
         """Store data in context"""
+        if key in self.data:
+            # Derived values may have been computed from the old value
+            self._derived.clear()
         self.data[key] = value
     
+    def view(self) -> Mapping[str, Any]:
+        """Read-only live view of the context data"""
+        return MappingProxyType(self.data)
+    
+    def derive(self, key: Hashable, compute: Callable[["WorkflowContext"], Any]) -> Any:
+        """
+        Get a value computed from the context, computing it on first use.
+        
+        The result is cached for the rest of the workflow and handed to
+        every caller, so it must not be mutated: build it from tuples and
+        read-only mappings. The key should name the inputs it was computed
+        from (e.g. which node outputs were available).
+        
+        Args:
+            key: Cache key for the derived value
+            compute: Called with this context to build the value
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            pass
+        with self._derive_lock:
+            if key not in self._derived:
+                self._derived[key] = compute(self)
+            return self._derived[key]
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve data from context"""
         return self.data.get(key, default)
@@ -63,10 +125,18 @@ class WorkflowContext:
             "message": message
         })
     
-    def get_summary(self) -> Dict[str, Any]:
-        """Get workflow summary"""
+    def get_summary(self, max_log_entries: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get workflow summary.
+        
+        Args:
+            max_log_entries: Number of most recent log entries to include (None = all)
+        """
+        log = self.execution_log
+        if max_log_entries is not None:
+            log = log[max(len(log) - max_log_entries, 0):]
         return {
             "total_steps": len(self.execution_log),
             "data_keys": list(self.data.keys()),
-            "execution_log": self.execution_log[-5:]  # Last 5 steps
+            "execution_log": log
         }
\ No newline at end of file
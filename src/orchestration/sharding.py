@@ -0,0 +1,114 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Any, Optional, Iterable, Iterator
+from ..utils.serializers import get_serializer
+
+# Built once per worker process by _init_worker
+_worker_orchestrator = None
+
+def _init_worker(workflow_options: Dict[str, Any]):
+    """Worker start-up: build agents and the DAG once for the life of the process"""
+    global _worker_orchestrator
+    from .workflow import build_content_workflow
+    _worker_orchestrator = build_content_workflow(**workflow_options)
+
+def _run_shard(payload: bytes) -> bytes:
+    """Run one shard of raw products (JSON bytes in, JSON bytes out)"""
+    serializer = get_serializer()
+    raw_products = serializer.loads(payload)
+    results = list(_worker_orchestrator.execute_many(raw_products))
+    return serializer.dumps(results)
+
+class ShardedCatalogRunner:
+    """
+    Runs a product feed across a pool of worker processes.
+
+    The feed is cut into shards of ``shard_size`` products. Each shard is sent
+    to a worker as one JSON document and comes back as one JSON document, so
+    no pydantic objects are pickled across process boundaries. Every worker
+    builds its agents and DAG once at start-up. Results are yielded in feed
+    order, with at most ``max_pending`` shards in flight to keep memory flat.
+    """
+
+    def __init__(self, workers: Optional[int] = None, shard_size: int = 64,
+                 max_pending: Optional[int] = None, **workflow_options: Any):
+        """
+        Args:
+            workers: Number of worker processes (default: CPU count)
+            shard_size: Products per shard
+            max_pending: Shards in flight at once (default: 2 per worker)
+            **workflow_options: Passed to build_content_workflow in each worker;
+                must be picklable
+        """
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.max_pending = max_pending or self.workers * 2
+        self.workflow_options = workflow_options
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def run(self, raw_products: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Process a feed of raw product dicts.
+
+        Args:
+            raw_products: Iterable of JSON-serializable raw product dicts
+
+        Yields:
+            Workflow results per product, in input order
+        """
+        serializer = get_serializer()
+        for payload in self.run_serialized(raw_products):
+            yield from serializer.loads(payload)
+
+    def run_serialized(self, raw_products: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """Like run(), but yield each shard's results as the raw JSON array bytes"""
+        pool = self._get_pool()
+        serializer = get_serializer()
+        products = iter(raw_products)
+        pending: deque = deque()
+
+        def submit_next() -> bool:
+            shard = list(islice(products, self.shard_size))
+            if not shard:
+                return False
+            payload = serializer.dumps(shard)
+            pending.append(pool.submit(_run_shard, payload))
+            return True
+
+        try:
+            while len(pending) < self.max_pending and submit_next():
+                pass
+
+            while pending:
+                result = pending.popleft().result()
+                submit_next()
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.workflow_options,)
+            )
+        return self._pool
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
@@ -0,0 +1,50 @@
+from typing import Any, Optional, Type
+from .dag import DAGOrchestrator
+from .inputs import RAW_PRODUCT, PRODUCT, FAQ_INPUT, PAGE_INPUT
+
+
+def build_content_workflow(compact_records: bool = True, block_cache: Optional[Any] = None,
+                           orchestrator_class: Type[DAGOrchestrator] = DAGOrchestrator,
+                           template_fragments: bool = False,
+                           **orchestrator_options: Any) -> DAGOrchestrator:
+    """
+    Build the standard content generation DAG.
+
+    parser → (question_generator, content_blocks) → faq / product / comparison templates
+
+    Agents are created once here and reused for every execute() call, so a
+    batch run pays the setup cost once instead of once per product.
+
+    Args:
+        compact_records: Pass slots-backed ProductRecord/FAQRecord between
+            nodes instead of pydantic models (validation still runs in the parser)
+        block_cache: Optional ResultCache for ContentBlockManager
+        orchestrator_class: DAGOrchestrator or AsyncDAGOrchestrator
+        template_fragments: Templates emit their static parts as pre-encoded
+            Fragments; only for pages written through a Serializer (page_sink)
+        **orchestrator_options: Passed through to DAGOrchestrator
+            (e.g. parallel=True, max_workers=4, result_store=SQLiteCache(...))
+
+    Returns:
+        Orchestrator with all nodes registered and execution order built
+    """
+    from ..agents.parser_agent import ParserAgent
+    from ..agents.question_generator_agent import QuestionGeneratorAgent
+    from ..agents.template_agents import FAQTemplateAgent, ProductTemplateAgent, ComparisonTemplateAgent
+    from ..logic_blocks.manager import ContentBlockManager
+
+    orchestrator = orchestrator_class(**orchestrator_options)
+
+    orchestrator.add_node("parser", ParserAgent(compact=compact_records), inputs=RAW_PRODUCT)
+    orchestrator.add_node("question_generator", QuestionGeneratorAgent(compact=compact_records), ["parser"],
+                          inputs=PRODUCT)
+    orchestrator.add_node("content_blocks", ContentBlockManager(cache=block_cache), ["parser"], inputs=PRODUCT)
+    orchestrator.add_node("faq_template", FAQTemplateAgent(fragments=template_fragments),
+                          ["question_generator", "content_blocks"], inputs=FAQ_INPUT)
+    orchestrator.add_node("product_template", ProductTemplateAgent(fragments=template_fragments),
+                          ["content_blocks"], inputs=PAGE_INPUT)
+    orchestrator.add_node("comparison_template", ComparisonTemplateAgent(fragments=template_fragments),
+                          ["content_blocks"], inputs=PAGE_INPUT)
+
+    orchestrator.build_execution_order()
+    return orchestrator
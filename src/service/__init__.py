@@ -0,0 +1,18 @@
+from typing import TYPE_CHECKING
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .server import ContentService, ContentHTTPServer, make_server, parse_address, serve
+
+# Public name -> submodule defining it, imported on first attribute access
+_EXPORTS = {
+    "ContentService": ".server",
+    "ContentHTTPServer": ".server",
+    "make_server": ".server",
+    "parse_address": ".server",
+    "serve": ".server"
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,340 @@
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from http import HTTPStatus
+from importlib import import_module
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from pydantic import ValidationError
+from ..orchestration.workflow import build_content_workflow
+from ..utils.serializers import get_serializer
+from ..utils.tracing import Tracer, HistogramExporter
+
+logger = logging.getLogger(__name__)
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+# Span category of request latencies in the metrics histogram
+REQUEST_CATEGORY = "request"
+
+class RequestError(Exception):
+    """A request the service rejects; becomes an error response with ``status``"""
+
+    def __init__(self, status: HTTPStatus, message: str, details: Any = None):
+        super().__init__(message)
+        self.status = status
+        self.details = details
+
+class ContentService:
+    """
+    Long-lived content generation for the HTTP server.
+
+    The workflow and its agents (parser, question generator, logic blocks,
+    template manager) are built once and stay warm; every request runs on a
+    fork of the orchestrator, so concurrent requests never share node state.
+    Request latencies, and with ``trace_stages`` every node, block and
+    template, are collected into one histogram for /metrics.
+    """
+
+    def __init__(self, serializer: str = "auto", percentiles: Sequence[float] = (50, 90, 99),
+                 trace_stages: bool = False, **workflow_options: Any):
+        """
+        Args:
+            serializer: JSON backend for requests and responses
+            percentiles: Latency percentiles reported by metrics()
+            trace_stages: Also time every node, block and template (adds overhead)
+            **workflow_options: Passed to build_content_workflow
+        """
+        self.serializer = get_serializer(serializer)
+        self.histogram = HistogramExporter(percentiles)
+        self.tracer = Tracer(self.histogram)
+        # Spliced fragments only pay off with the stdlib encoder (see run_catalog_workflow)
+        workflow_options.setdefault("template_fragments", self.serializer.name == "stdlib")
+        if trace_stages:
+            workflow_options.setdefault("tracer", self.tracer)
+        self.orchestrator = build_content_workflow(**workflow_options)
+        # A long-lived process loads the models up front rather than on the
+        # first request that needs full validation
+        import_module("..models.product", __package__)
+        self.started_at = time.monotonic()
+        self.stats = {"requests": 0, "errors": 0, "products": 0}
+        self._stats_lock = threading.Lock()
+
+    def generate(self, product: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the workflow for one raw product.
+
+        Returns:
+            The pages (faq, product_page, comparison_page) and workflow metadata
+
+        Raises:
+            RequestError: The product failed validation (422)
+        """
+        workflow = self.orchestrator.fork()
+        try:
+            result = workflow.execute({"initial_data": product})
+        except ValidationError as e:
+            raise RequestError(HTTPStatus.UNPROCESSABLE_ENTITY, "validation_failed",
+                               e.errors(include_url=False, include_context=False)) from None
+        self._count(products=1)
+        return result
+
+    def generate_many(self, products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run the workflow for a batch of raw products on one fork.
+
+        Returns:
+            One result per product, in input order; a product that fails gets
+            an error result instead of failing the whole batch
+        """
+        results = list(self.orchestrator.fork().execute_many(products))
+        self._count(products=len(results))
+        return results
+
+    def record_request(self, route: str, start_ns: int, duration_ns: int, failed: bool):
+        self.tracer.record(route, REQUEST_CATEGORY, start_ns, duration_ns)
+        self._count(requests=1, errors=int(failed))
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "uptime_s": round(time.monotonic() - self.started_at, 3),
+            "serializer": self.serializer.name
+        }
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Counters and latency percentiles since startup.
+
+        Returns:
+            {"uptime_s", "requests", "errors", "products",
+             "latency": {route: {"count", "p50_ms", ...}},
+             "stages": {category: {name: {...}}}}  (stages only with trace_stages)
+        """
+        summary = self.histogram.summary()
+        with self._stats_lock:
+            metrics = dict(self.stats)
+        metrics["uptime_s"] = round(time.monotonic() - self.started_at, 3)
+        metrics["latency"] = summary.pop(REQUEST_CATEGORY, {})
+        if summary:
+            metrics["stages"] = summary
+        return metrics
+
+    def reset_metrics(self):
+        self.histogram.reset()
+        with self._stats_lock:
+            self.stats = dict.fromkeys(self.stats, 0)
+
+    def close(self):
+        self.orchestrator.shutdown()
+
+    def _count(self, **increments: int):
+        with self._stats_lock:
+            for key, value in increments.items():
+                self.stats[key] += value
+
+class ContentRequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+        POST /generate  a product object → its result; an array of products
+                        (request batching) → {"results": [...]}
+        GET  /metrics   request counters and latency percentiles
+        GET  /health    liveness
+
+    HTTP/1.1 with a Content-Length on every response, so clients keep the
+    connection open across requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "ContentService/1.0"
+    # Headers and body go out in separate writes; with Nagle on, the body
+    # would wait for the client's delayed ACK (~40 ms) on every response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._handle(self._get_route)
+
+    def do_POST(self):
+        self._handle(self._post_route)
+
+    def _get_route(self) -> Any:
+        service = self.server.service
+        if self.path == "/health":
+            self.route = "GET /health"
+            return service.health()
+        if self.path == "/metrics":
+            self.route = "GET /metrics"
+            return service.metrics()
+        if self.path == "/generate":
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST /generate")
+        raise RequestError(HTTPStatus.NOT_FOUND, f"No route for {self.path}")
+
+    def _post_route(self) -> Any:
+        if self.path != "/generate":
+            # The body is never read, so the connection cannot be reused
+            self.close_connection = True
+            raise RequestError(HTTPStatus.NOT_FOUND, f"No route for {self.path}")
+
+        service = self.server.service
+        self.route = "POST /generate"
+        payload = self._read_json()
+        if isinstance(payload, list):
+            self.route = "POST /generate (batch)"
+            if not all(isinstance(product, dict) for product in payload):
+                raise RequestError(HTTPStatus.BAD_REQUEST, "A batch must be an array of product objects")
+            return {"results": service.generate_many(payload)}
+        if isinstance(payload, dict):
+            return service.generate(payload)
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Expected a product object or an array of them")
+
+    def _read_json(self) -> Any:
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.LENGTH_REQUIRED, "Content-Length required")
+        try:
+            length = int(length)
+        except ValueError:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from None
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"Body exceeds {MAX_BODY_BYTES} bytes")
+
+        body = self.rfile.read(length)
+        try:
+            return self.server.service.serializer.loads(body)
+        except ValueError as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, "invalid_json", str(e)) from None
+
+    def _handle(self, route_handler):
+        start_ns = time.perf_counter_ns()
+        # Routes name themselves once matched; anything else shares one
+        # histogram entry however many distinct paths it comes in on
+        self.route = f"{self.command} (unmatched)"
+        try:
+            document = route_handler()
+            status = HTTPStatus.OK
+        except RequestError as e:
+            status = e.status
+            document = {"error": str(e)}
+            if e.details is not None:
+                document["details"] = e.details
+        except Exception as e:
+            logger.exception("Request %s %s failed", self.command, self.path)
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            document = {"error": str(e) or type(e).__name__}
+
+        body = self.server.service.serializer.dumps(document)
+        # Recorded before the response goes out, so a client that has its
+        # response always finds the request in /metrics
+        self.server.service.record_request(
+            self.route, start_ns, time.perf_counter_ns() - start_ns, failed=status != HTTPStatus.OK
+        )
+        self._send_json(status, body)
+
+    def _send_json(self, status: HTTPStatus, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket clients have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any):
+        logger.debug("%s %s", self.address_string(), format % args)
+
+class UnixContentRequestHandler(ContentRequestHandler):
+    # TCP_NODELAY does not exist for Unix sockets (and nor does Nagle)
+    disable_nagle_algorithm = False
+
+class ContentHTTPServer(ThreadingHTTPServer):
+    """Thread-per-connection HTTP server bound to a ContentService"""
+
+    daemon_threads = True
+    handler_class = ContentRequestHandler
+
+    def __init__(self, address: Tuple[str, int], service: ContentService):
+        self.service = service
+        super().__init__(address, self.handler_class)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+class UnixContentHTTPServer(ContentHTTPServer):
+    """ContentHTTPServer listening on a Unix domain socket"""
+
+    address_family = socket.AF_UNIX
+    handler_class = UnixContentRequestHandler
+
+    def __init__(self, path: str, service: ContentService):
+        # A socket file left by a previous run would make bind() fail
+        if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+        super().__init__(path, service)
+
+    @property
+    def url(self) -> str:
+        return f"unix:{self.server_address}"
+
+    def server_bind(self):
+        # HTTPServer.server_bind expects (host, port)
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+def parse_address(address: str) -> Union[str, Tuple[str, int]]:
+    """
+    Parse a listen address.
+
+    Args:
+        address: "host:port", ":port" / "port" (localhost), or "unix:/path/to.sock"
+
+    Returns:
+        (host, port) or a Unix socket path
+    """
+    if address.startswith("unix:"):
+        return address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+def make_server(address: Union[str, Tuple[str, int]], service: Optional[ContentService] = None,
+                **service_options: Any) -> ContentHTTPServer:
+    """
+    Create a server; call serve_forever() to run it.
+
+    Args:
+        address: (host, port) (port 0 picks a free one) or a Unix socket path
+        service: Service to expose (default: a new ContentService(**service_options))
+    """
+    service = service or ContentService(**service_options)
+    if isinstance(address, str):
+        return UnixContentHTTPServer(address, service)
+    return ContentHTTPServer(address, service)
+
+def serve(server: ContentHTTPServer):
+    """Run a server from make_server() until interrupted, then release it"""
+    logger.info("🌐 Content service listening on %s", server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
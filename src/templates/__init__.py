@@ -1,13 +1,24 @@
-from .base import Template
-from .faq_template import FAQTemplate
-from .product_template import ProductPageTemplate
-from .comparison_template import ComparisonTemplate
-from .manager import TemplateManager
-
-__all__ = [
-    "Template",
-    "FAQTemplate",
-    "ProductPageTemplate",
-    "ComparisonTemplate",
-    "TemplateManager"
-]
\ No newline at end of file
+from typing import TYPE_CHECKING
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import Template
+    from .faq_template import FAQTemplate
+    from .product_template import ProductPageTemplate
+    from .comparison_template import ComparisonTemplate
+    from .manager import TemplateManager, get_template_registry, get_template_manager
+
+# Public name -> submodule defining it, imported on first attribute access
+_EXPORTS = {
+    "Template": ".base",
+    "FAQTemplate": ".faq_template",
+    "ProductPageTemplate": ".product_template",
+    "ComparisonTemplate": ".comparison_template",
+    "TemplateManager": ".manager",
+    "get_template_registry": ".manager",
+    "get_template_manager": ".manager"
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
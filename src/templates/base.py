@@ -1,10 +1,46 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 import json
+import logging
 from datetime import datetime
+from ..utils.serializers import Fragment
+
+logger = logging.getLogger(__name__)
 
 class Template(ABC):
-    """Base class for all templates"""
+    """
+    Base class for all templates.
+    
+    Templates are compiled once per instance: compile() precomputes the
+    parts of the page that do not depend on the product, and render() only
+    fills the data-dependent slots. Static parts are shared between rendered
+    pages, so rendered pages must be treated as read-only.
+    
+    With ``fragments=True`` the static parts are pre-encoded Fragments that
+    a Serializer splices into the output bytes; such pages are meant to be
+    written out (e.g. to a page sink), not inspected.
+    """
+    
+    # Bump when render() output changes so stored pages are not reused
+    version: str = "1"
+    
+    def __init__(self, fragments: bool = False):
+        self.fragments = fragments
+        self._page_type = self.name
+        self._label = self._page_type.upper()
+        self.compile()
+    
+    def compile(self):
+        """Precompute the static parts of the page (called once from __init__)"""
+        pass
+    
+    def constant(self, value: Any) -> Any:
+        """A static subtree: a Fragment in fragment mode, the value itself otherwise"""
+        return Fragment(value) if self.fragments else value
+    
+    def constant_members(self, members: Dict[str, Any]) -> Dict[str, Any]:
+        """Static keys to spread (``**``) into a page dict; one Fragment pair in fragment mode"""
+        return Fragment(members, members=True).members() if self.fragments else members
     
     @abstractmethod
     def render(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -27,14 +63,14 @@ class Template(ABC):
         """Check if data has required fields"""
         missing = [field for field in required_fields if field not in data]
         if missing:
-            print(f"⚠️  Missing fields for {self.name}: {missing}")
+            logger.warning("⚠️  Missing fields for %s: %s", self.name, missing)
             return False
         return True
     
     def add_metadata(self, content: Dict[str, Any]) -> Dict[str, Any]:
         """Add metadata to rendered content"""
         return {
-            "page_type": self.name,
+            "page_type": self._page_type,
             "generated_at": datetime.now().isoformat(),
             "template_version": "1.0",
             "content": content
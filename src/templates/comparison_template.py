@@ -1,7 +1,9 @@
+import logging
 from typing import Dict, Any
-from datetime import datetime
 from .base import Template
 
+logger = logging.getLogger(__name__)
+
 class ComparisonTemplate(Template):
     """Template for product comparison page"""
     
@@ -13,55 +15,81 @@ class ComparisonTemplate(Template):
     def description(self):
         return "Product comparison page (Product A vs Product B)"
     
+    def compile(self):
+        # Product B is fictional and fixed, so everything about it is computed once
+        product_b = self._product_b = self._create_fictional_product()
+        self._product_b_row = self.constant(self._format_product(product_b, {}, "B"))
+        self._price_b = self._extract_price(product_b["price"])
+        self._ingredient_count_b = len(product_b["ingredients"])
+        self._ingredients_b = f"{self._ingredient_count_b} key ingredients"
+        self._title_suffix = f" vs {product_b['name']}"
+        self._best_for_difference_b = self.constant_members({
+            "product_b": "All skin types, especially sensitive",
+            "winner": "Depends on skin type"
+        })
+        self._recommendation_b = (
+            f"For sensitive skin or those wanting Vitamin E benefits, {product_b['name']} "
+            f"might be preferable despite higher cost."
+        )
+        self._pros_a = self.constant(
+            ["Higher Vitamin C concentration", "Multiple brightening benefits", "Competitive pricing"]
+        )
+        self._cons_a = self.constant(
+            ["May cause tingling for very sensitive skin", "Specific to oily/combination skin"]
+        )
+        self._disclaimer = self.constant_members({
+            "disclaimer": "Product B is fictional for demonstration. Always patch test new products."
+        })
+        self._required = ["product_a", "content_blocks"]
+    
     def render(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        print(f"🔧 [{self.name.upper()} Template] Rendering Comparison Page...")
+        logger.debug("🔧 [%s Template] Rendering Comparison Page...", self._label)
         
-        required = ["product_a", "content_blocks"]
-        if not self.validate_data(data, required):
+        if not self.validate_data(data, self._required):
             return {"error": "Missing required data for Comparison template"}
         
         product_a = data["product_a"]
         blocks = data["content_blocks"]
-        
-        # Create fictional Product B for comparison
-        product_b = self._create_fictional_product(product_a)
+        price = blocks.get("price", {})
+        display_price = price.get("display_price", "")
+        price_a = self._extract_price(price.get("display_price", "₹0"))
+        ingredient_count_a = len(blocks.get("ingredients", {}).get("ingredients", []))
         
         # Build comparison
         comparison_page = {
-            "title": f"Comparison: {product_a['name']} vs {product_b['name']}",
-            "summary": f"Comparing two popular vitamin C serums for different needs",
+            "title": f"Comparison: {product_a['name']}{self._title_suffix}",
+            "summary": "Comparing two popular vitamin C serums for different needs",
             "products": [
                 self._format_product(product_a, blocks, "A"),
-                self._format_product(product_b, {}, "B")
+                self._product_b_row
             ],
             "key_differences": [
                 {
                     "aspect": "Price",
-                    "product_a": blocks.get("price", {}).get("display_price", ""),
-                    "product_b": product_b["price"],
-                    "winner": "B" if self._extract_price(product_b["price"]) < self._extract_price(blocks.get("price", {}).get("display_price", "₹0")) else "A"
+                    "product_a": display_price,
+                    "product_b": self._product_b["price"],
+                    "winner": "B" if self._price_b < price_a else "A"
                 },
                 {
                     "aspect": "Key Ingredients",
-                    "product_a": f"{len(blocks.get('ingredients', {}).get('ingredients', []))} actives",
-                    "product_b": f"{len(product_b['ingredients'])} key ingredients",
-                    "winner": "A" if len(blocks.get('ingredients', {}).get('ingredients', [])) > len(product_b['ingredients']) else "B"
+                    "product_a": f"{ingredient_count_a} actives",
+                    "product_b": self._ingredients_b,
+                    "winner": "A" if ingredient_count_a > self._ingredient_count_b else "B"
                 },
                 {
                     "aspect": "Best For",
                     "product_a": ", ".join(product_a.get("skin_type", [])),
-                    "product_b": "All skin types, especially sensitive",
-                    "winner": "Depends on skin type"
+                    **self._best_for_difference_b
                 }
             ],
-            "recommendation": self._generate_recommendation(product_a, product_b, blocks),
-            "disclaimer": "Product B is fictional for demonstration. Always patch test new products."
+            "recommendation": self._generate_recommendation(product_a, price_a),
+            **self._disclaimer
         }
         
-        print(f"✅ [{self.name.upper()} Template] Comparison with fictional product generated")
+        logger.debug("✅ [%s Template] Comparison with fictional product generated", self._label)
         return self.add_metadata(comparison_page)
     
-    def _create_fictional_product(self, product_a: Dict) -> Dict[str, Any]:
+    def _create_fictional_product(self) -> Dict[str, Any]:
         """Create a fictional product for comparison"""
         return {
             "name": "DermaGlow Vitamin E Serum",
@@ -77,17 +105,18 @@ class ComparisonTemplate(Template):
         """Format product for comparison table"""
         if label == "A":
             # Real product with content blocks
+            price = blocks.get("price", {})
             return {
                 "name": product["name"],
                 "label": "Our Product",
-                "price": blocks.get("price", {}).get("display_price", ""),
+                "price": price.get("display_price", ""),
                 "key_ingredients": [ing["name"] for ing in blocks.get("ingredients", {}).get("ingredients", [])],
                 "benefits": blocks.get("benefits", {}).get("primary_benefits", []),
                 "best_for": product.get("skin_type", []),
                 "concentration": product.get("concentration", ""),
-                "value_rating": blocks.get("price", {}).get("value_rating", ""),
-                "pros": ["Higher Vitamin C concentration", "Multiple brightening benefits", "Competitive pricing"],
-                "cons": ["May cause tingling for very sensitive skin", "Specific to oily/combination skin"]
+                "value_rating": price.get("value_rating", ""),
+                "pros": self._pros_a,
+                "cons": self._cons_a
             }
         else:
             # Fictional product
@@ -111,12 +140,9 @@ class ComparisonTemplate(Template):
         except:
             return 0
     
-    def _generate_recommendation(self, product_a: Dict, product_b: Dict, blocks: Dict[str, Any]) -> str:
+    def _generate_recommendation(self, product_a: Dict, price_a: int) -> str:
         """Generate recommendation based on comparison"""
-        price_a = self._extract_price(blocks.get("price", {}).get("display_price", "₹0"))
-        price_b = self._extract_price(product_b["price"])
-        
-        if price_a < price_b:
+        if price_a < self._price_b:
             return f"For budget-conscious buyers looking for effective Vitamin C, {product_a['name']} offers better value."
         else:
-            return f"For sensitive skin or those wanting Vitamin E benefits, {product_b['name']} might be preferable despite higher cost."
\ No newline at end of file
+            return self._recommendation_b
@@ -1,7 +1,10 @@
+import logging
 from typing import Dict, Any
-from datetime import datetime
+from datetime import date
 from .base import Template
 
+logger = logging.getLogger(__name__)
+
 class FAQTemplate(Template):
     """Template for FAQ page with categorized questions"""
     
@@ -13,30 +16,48 @@ class FAQTemplate(Template):
     def description(self):
         return "Frequently Asked Questions page with categorized Q&A"
     
+    def compile(self):
+        self._required = ["product_info", "questions", "content_blocks"]
+        self._default_answer = "Information available from product specifications."
+    
     def render(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        print(f"🔧 [{self.name.upper()} Template] Rendering FAQ page...")
+        logger.debug("🔧 [%s Template] Rendering FAQ page...", self._label)
         
         # Validate required data
-        required = ["product_info", "questions", "content_blocks"]
-        if not self.validate_data(data, required):
+        if not self.validate_data(data, self._required):
             return {"error": "Missing required data for FAQ template"}
         
         product = data["product_info"]
         questions = data["questions"]
         blocks = data["content_blocks"]
         
+        # Answers depend only on the category (and, for informational
+        # questions, the question text), so each is built once per page
+        answers: Dict[str, str] = {}
+        informational_suffix = self._informational_suffix(blocks)
+        
         # Group questions by category
         categories = {}
         for q in questions:
             category = q["category"]
-            if category not in categories:
-                categories[category] = []
-            categories[category].append({
+            if category == "Informational":
+                answer = q["question"].replace("What is", "This is") + informational_suffix
+            else:
+                answer = answers.get(category)
+                if answer is None:
+                    answer = answers[category] = self._generate_answer(q, blocks)
+            
+            questions_list = categories.get(category)
+            if questions_list is None:
+                questions_list = categories[category] = []
+            questions_list.append({
                 "id": q["id"],
                 "question": q["question"],
-                "answer": self._generate_answer(q, blocks)
+                "answer": answer
             })
         
+        total_questions = len(questions)
+        
         # Build FAQ page structure
         faq_page = {
             "title": f"FAQ - {product['name']}",
@@ -49,25 +70,27 @@ class FAQTemplate(Template):
             "categories": [
                 {
                     "name": category,
-                    "count": len(questions),
+                    "count": total_questions,
                     "questions": questions_list
                 }
                 for category, questions_list in categories.items()
             ],
-            "total_questions": len(questions),
-            "last_updated": datetime.now().strftime("%Y-%m-%d")
+            "total_questions": total_questions,
+            "last_updated": date.today().isoformat()
         }
         
-        print(f"✅ [{self.name.upper()} Template] Generated FAQ with {len(questions)} questions")
+        logger.debug("✅ [%s Template] Generated FAQ with %d questions", self._label, total_questions)
         return self.add_metadata(faq_page)
     
+    def _informational_suffix(self, blocks: Dict[str, Any]) -> str:
+        return f". It contains {blocks.get('ingredients', {}).get('total_actives', 0)} active ingredients."
+    
     def _generate_answer(self, question: Dict, blocks: Dict[str, Any]) -> str:
         """Generate answer based on question category and content blocks"""
         category = question["category"]
         
         if category == "Informational":
-            return f"{question['question'].replace('What is', 'This is')}. " \
-                   f"It contains {blocks.get('ingredients', {}).get('total_actives', 0)} active ingredients."
+            return question["question"].replace("What is", "This is") + self._informational_suffix(blocks)
         
         elif category == "Safety":
             safety = blocks.get("safety", {})
@@ -91,4 +114,4 @@ class FAQTemplate(Template):
                    f"{', '.join(blocks.get('benefits', {}).get('primary_benefits', ['multiple benefits']))}. " \
                    f"Compare with similar products for your specific needs."
         
-        return "Information available from product specifications."
\ No newline at end of file
+        return self._default_answer
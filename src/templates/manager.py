@@ -1,15 +1,49 @@
-from typing import Dict, Any
+import logging
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Optional, Type
+from ..utils.tracing import get_tracer
+from .base import Template
 from .faq_template import FAQTemplate
 from .product_template import ProductPageTemplate
 from .comparison_template import ComparisonTemplate
 
+logger = logging.getLogger(__name__)
+
+TEMPLATE_CLASSES: Dict[str, Type[Template]] = {
+    "faq": FAQTemplate,
+    "product_page": ProductPageTemplate,
+    "comparison_page": ComparisonTemplate
+}
+
+@lru_cache(maxsize=None)
+def get_template_registry(fragments: bool = False) -> Dict[str, Template]:
+    """
+    The process-wide template instances, built on first use.
+
+    Templates hold no per-render state, so one instance of each is shared
+    by every manager and template agent. Treat the mapping as read-only.
+
+    Args:
+        fragments: Templates whose static parts are pre-encoded Fragments
+    """
+    return {name: template_class(fragments=fragments) for name, template_class in TEMPLATE_CLASSES.items()}
+
+@lru_cache(maxsize=None)
+def get_template_manager(fragments: bool = False) -> "TemplateManager":
+    """The process-wide TemplateManager used by the template agents"""
+    return TemplateManager(get_template_registry(fragments))
+
 class TemplateManager:
     """
     Manages all templates and renders pages.
     """
     
-    def __init__(self):
-        self.templates = self._register_templates()
+    def __init__(self, templates: Optional[Dict[str, Template]] = None):
+        """
+        Args:
+            templates: Template name → instance (default: the shared registry)
+        """
+        self.templates = dict(templates) if templates is not None else self._register_templates()
     
     def process(self, data):
         """
@@ -34,13 +68,9 @@ class TemplateManager:
             # Default: render all
             return self.render_all_templates(data)
 
-    def _register_templates(self) -> Dict[str, Any]:
-        """Register all available templates"""
-        return {
-            "faq": FAQTemplate(),
-            "product_page": ProductPageTemplate(),
-            "comparison_page": ComparisonTemplate()
-        }
+    def _register_templates(self) -> Dict[str, Template]:
+        """Register all available templates (copied from the shared registry)"""
+        return dict(get_template_registry())
     
     def render_template(self, template_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -54,28 +84,54 @@ class TemplateManager:
             Rendered content as dictionary
         """
         if template_name not in self.templates:
-            print(f"❌ Template '{template_name}' not found")
+            logger.error("❌ Template '%s' not found", template_name)
             return {"error": f"Template '{template_name}' not found"}
         
         template = self.templates[template_name]
         
         try:
-            # Different print based on which template
-            if template_name == "faq_template":
-                print("🎨 Rendering FAQ template...")
-            elif template_name == "product_template":
-                print("🎨 Rendering Product Page template...")
-            elif template_name == "comparison_template":
-                print("🎨 Rendering Comparison template...")
-            else:
-                print(f"🎨 Rendering {template.name} template...")
+            logger.debug("🎨 Rendering %s template...", template.name)
             
-            result = template.render(data)
+            with get_tracer().span(template.name, "template"):
+                result = template.render(data)
             return result
         except Exception as e:
-            print(f"❌ Failed to render {template.name}: {e}")
+            logger.error("❌ Failed to render %s: %s", template.name, e)
             return {"error": str(e)}
     
+    def render_many(self, template_name: str, data_list: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Render one template for many products in a single call.
+        
+        The template is looked up once; each item is rendered and traced as
+        render_template would, and a failing item yields an error dict
+        without stopping the rest.
+        
+        Args:
+            template_name: Name of template to render
+            data_list: One template data dict per product
+            
+        Returns:
+            Rendered pages, in input order
+        """
+        template = self.templates.get(template_name)
+        if template is None:
+            logger.error("❌ Template '%s' not found", template_name)
+            return [{"error": f"Template '{template_name}' not found"} for _ in data_list]
+        
+        tracer = get_tracer()
+        results = []
+        for data in data_list:
+            try:
+                with tracer.span(template.name, "template"):
+                    results.append(template.render(data))
+            except Exception as e:
+                logger.error("❌ Failed to render %s: %s", template.name, e)
+                results.append({"error": str(e)})
+        
+        logger.debug("✅ Rendered %d %s pages", len(results), template.name)
+        return results
+    
     def render_all_templates(self, data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
         Render all templates with the same data.
@@ -86,15 +142,15 @@ class TemplateManager:
         Returns:
             Dictionary with template_name: rendered_content
         """
-        print("🎨 Rendering all templates...")
+        logger.debug("🎨 Rendering all templates...")
         results = {}
         
         for template_name, template in self.templates.items():
-            print(f"  Processing {template_name}...")
+            logger.debug("  Processing %s...", template_name)
             result = template.render(data)
             results[template_name] = result
         
-        print(f"✅ Rendered {len(results)} templates")
+        logger.debug("✅ Rendered %d templates", len(results))
         return results
     
     def get_template_info(self) -> Dict[str, Any]:
@@ -1,6 +1,9 @@
+import logging
 from typing import Dict, Any
 from .base import Template
 
+logger = logging.getLogger(__name__)
+
 class ProductPageTemplate(Template):
     """Template for detailed product description page"""
     
@@ -12,75 +15,90 @@ class ProductPageTemplate(Template):
     def description(self):
         return "Complete product description page with specifications"
     
+    def compile(self):
+        self._required = ["product_info", "content_blocks"]
+        self._static_specifications = self.constant_members({
+            "texture": "Lightweight, fast-absorbing",
+            "fragrance": "Unscented",
+            "size": "30ml"
+        })
+        self._static_metadata = self.constant_members({
+            "category": "Face Serums",
+            "rating": "4.5/5",
+            "reviews_count": "150+"
+        })
+    
     def render(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        print(f"🔧 [{self.name.upper()} Template] Rendering Product Page...")
+        logger.debug("🔧 [%s Template] Rendering Product Page...", self._label)
         
-        required = ["product_info", "content_blocks"]
-        if not self.validate_data(data, required):
+        if not self.validate_data(data, self._required):
             return {"error": "Missing required data for Product template"}
         
         product = data["product_info"]
         blocks = data["content_blocks"]
+        name = product["name"]
+        concentration = product.get("concentration", "")
+        skin_types = product.get("skin_type", [])
+        skin_text = ", ".join(skin_types)
+        benefits = blocks.get("benefits", {})
+        ingredients = blocks.get("ingredients", {})
+        usage = blocks.get("usage", {})
+        safety = blocks.get("safety", {})
+        price = blocks.get("price", {})
         
         # Build product page
         product_page = {
             "header": {
-                "title": product["name"],
-                "tagline": f"Advanced {product.get('concentration', '')} Serum",
-                "short_description": f"A premium serum designed for {', '.join(product.get('skin_type', []))} skin"
+                "title": name,
+                "tagline": f"Advanced {concentration} Serum",
+                "short_description": f"A premium serum designed for {skin_text} skin"
             },
             "overview": {
-                "description": self._generate_description(product, blocks),
-                "key_benefits": blocks.get("benefits", {}).get("primary_benefits", []),
-                "ideal_for": product.get("skin_type", [])
+                "description": self._generate_description(name, concentration, skin_text, ingredients, benefits),
+                "key_benefits": benefits.get("primary_benefits", []),
+                "ideal_for": skin_types
             },
             "specifications": {
-                "concentration": product.get("concentration", ""),
+                "concentration": concentration,
                 "key_ingredients": [
                     {
                         "name": ing["name"],
                         "benefit": ing.get("benefit", ""),
                         "purpose": ing.get("purpose", "")
                     }
-                    for ing in blocks.get("ingredients", {}).get("ingredients", [])
+                    for ing in ingredients.get("ingredients", [])
                 ],
-                "texture": "Lightweight, fast-absorbing",
-                "fragrance": "Unscented",
-                "size": "30ml"
+                **self._static_specifications
             },
             "usage": {
-                "instructions": blocks.get("usage", {}).get("steps", []),
-                "frequency": blocks.get("usage", {}).get("frequency", "Daily"),
-                "best_time": blocks.get("usage", {}).get("best_time", "Morning")
+                "instructions": usage.get("steps", []),
+                "frequency": usage.get("frequency", "Daily"),
+                "best_time": usage.get("best_time", "Morning")
             },
             "safety": {
-                "warnings": blocks.get("safety", {}).get("warnings", []),
-                "recommendations": blocks.get("safety", {}).get("recommendations", []),
-                "patch_test": blocks.get("safety", {}).get("patch_test", True)
+                "warnings": safety.get("warnings", []),
+                "recommendations": safety.get("recommendations", []),
+                "patch_test": safety.get("patch_test", True)
             },
             "pricing": {
-                "price": blocks.get("price", {}).get("display_price", ""),
-                "value": blocks.get("price", {}).get("value_rating", ""),
-                "category": blocks.get("price", {}).get("price_category", "")
+                "price": price.get("display_price", ""),
+                "value": price.get("value_rating", ""),
+                "category": price.get("price_category", "")
             },
             "metadata": {
-                "sku": f"SKU-{product['name'].replace(' ', '-').upper()}",
-                "category": "Face Serums",
-                "rating": "4.5/5",
-                "reviews_count": "150+"
+                "sku": f"SKU-{name.replace(' ', '-').upper()}",
+                **self._static_metadata
             }
         }
         
-        print(f"✅ [{self.name.upper()} Template] Product page generated")
+        logger.debug("✅ [%s Template] Product page generated", self._label)
         return self.add_metadata(product_page)
     
-    def _generate_description(self, product: Dict, blocks: Dict[str, Any]) -> str:
+    def _generate_description(self, name: str, concentration: str, skin_text: str,
+                              ingredients: Dict[str, Any], benefits: Dict[str, Any]) -> str:
         """Generate product description"""
-        ingredients = blocks.get("ingredients", {})
-        benefits = blocks.get("benefits", {})
-        
-        return f"{product['name']} is a {product.get('concentration', '')} serum " \
+        return f"{name} is a {concentration} serum " \
                f"featuring {ingredients.get('total_actives', 0)} key active ingredients. " \
-               f"Formulated for {', '.join(product.get('skin_type', []))} skin types, " \
+               f"Formulated for {skin_text} skin types, " \
                f"it delivers {', '.join(benefits.get('primary_benefits', ['multiple benefits']))}. " \
-               f"Perfect for daily use in your morning skincare routine."
\ No newline at end of file
+               f"Perfect for daily use in your morning skincare routine."
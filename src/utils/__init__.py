@@ -1,3 +1,36 @@
-from .json_utils import JSONOutputFormatter
+from typing import TYPE_CHECKING
+from .lazy import lazy_exports
 
-__all__ = ["JSONOutputFormatter"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .json_utils import JSONOutputFormatter
+    from .cache import ResultCache, LRUCache, SQLiteCache, MISSING
+    from .output import PageStreamWriter, FileSink, BundleSink, atomic_write
+    from .serializers import Serializer, Fragment, get_serializer
+    from .tracing import Tracer, HistogramExporter, JSONLinesExporter, ChromeTraceExporter, get_tracer
+    from .logging_config import configure_logging
+
+# Public name -> submodule defining it, imported on first attribute access
+_EXPORTS = {
+    "JSONOutputFormatter": ".json_utils",
+    "ResultCache": ".cache",
+    "LRUCache": ".cache",
+    "SQLiteCache": ".cache",
+    "MISSING": ".cache",
+    "PageStreamWriter": ".output",
+    "FileSink": ".output",
+    "BundleSink": ".output",
+    "atomic_write": ".output",
+    "Serializer": ".serializers",
+    "Fragment": ".serializers",
+    "get_serializer": ".serializers",
+    "Tracer": ".tracing",
+    "HistogramExporter": ".tracing",
+    "JSONLinesExporter": ".tracing",
+    "ChromeTraceExporter": ".tracing",
+    "get_tracer": ".tracing",
+    "configure_logging": ".logging_config"
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
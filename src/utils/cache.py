@@ -0,0 +1,228 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+# Returned by ResultCache.get() when a key is not cached
+MISSING = object()
+
+class ResultCache(ABC):
+    """
+    Base class for pluggable result caches.
+
+    Keys are opaque strings (callers hash their inputs); values are any
+    picklable object. Cached values are shared between callers and must be
+    treated as read-only.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Lookups from several threads would lose increments without it
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or MISSING"""
+        value = self._get(key)
+        with self._stats_lock:
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        """Store a value"""
+        self._set(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring"""
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "backend": type(self).__name__,
+            "hits": hits,
+            "misses": misses,
+            "evictions": self.evictions,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": len(self)
+        }
+
+    @abstractmethod
+    def _get(self, key: str) -> Any:
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, value: Any):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Remove every entry"""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+class LRUCache(ResultCache):
+    """In-memory least-recently-used cache bounded by entry count"""
+
+    def __init__(self, max_entries: int = 10_000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            value = self._entries.get(key, MISSING)
+            if value is not MISSING:
+                self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class SQLiteCache(ResultCache):
+    """
+    On-disk cache in a single SQLite file, bounded by total value size.
+
+    Values are pickled. When the stored bytes exceed max_bytes the entries
+    written longest ago are evicted first. Hits are read-only (recording
+    use would turn every read into a write transaction), so an entry that is
+    still hit but old gets evicted, recomputed and written again. The file
+    persists between runs, which is what makes nightly re-runs over mostly
+    unchanged catalogs cheap. A hit costs one indexed SELECT plus unpickling
+    the value, so it only pays off for work that costs more than rebuilding
+    its result objects; within one process LRUCache is cheaper.
+
+    New values are buffered in memory and committed in one transaction every
+    batch_size stores, before evicting and on close(). Buffered values are
+    visible to get() right away; anything not yet committed when the process
+    exits without close() is lost, which for a cache only means recomputing
+    it.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, batch_size: int = 1000):
+        super().__init__()
+        self.path = path
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        # key -> (pickled value, write time) not yet committed
+        self._pending: Dict[str, Tuple[bytes, int]] = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Imported here so processes that never open a store don't load sqlite3
+        import sqlite3
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # Durable enough for a cache under WAL, and no fsync per commit
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # last_used holds the write time; the name predates read-only hits
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries(last_used)")
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                blob = pending[0]
+            else:
+                row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return MISSING
+                blob = row[0]
+        import pickle
+        return pickle.loads(blob)
+
+    def _set(self, key: str, value: Any):
+        import pickle
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                old_size = len(pending[0])
+            else:
+                row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                old_size = row[0] if row else 0
+            self._pending[key] = (blob, time.time_ns())
+            self._total_bytes += len(blob) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            elif len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def _flush(self):
+        """Commit buffered values in one transaction (lock held)"""
+        if not self._pending:
+            return
+        self._conn.execute("BEGIN")
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+            [(key, blob, len(blob), written) for key, (blob, written) in self._pending.items()]
+        )
+        self._conn.execute("COMMIT")
+        self._pending.clear()
+
+    def _evict(self):
+        """Drop the oldest-written entries until back under max_bytes (lock held)"""
+        self._flush()
+        evicted = []
+        for key, size in self._conn.execute("SELECT key, size FROM entries ORDER BY last_used"):
+            if self._total_bytes <= self.max_bytes:
+                break
+            evicted.append((key,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._total_bytes = 0
+
+    def flush(self):
+        """Commit buffered writes now"""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["bytes"] = self._total_bytes
+        return stats
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -1,35 +1,39 @@
 import json
+import logging
+import os
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+from .serializers import Serializer, get_serializer
+from .output import atomic_write
+
+logger = logging.getLogger(__name__)
 
 class JSONOutputFormatter:
     """Utility for formatting and saving JSON outputs"""
     
     @staticmethod
-    def save_json(data: Dict[str, Any], filepath: str, indent: int = 2):
+    def save_json(data: Dict[str, Any], filepath: str, indent: Optional[int] = 2,
+                  serializer: Optional[Serializer] = None):
         """
-        Save data as formatted JSON file.
+        Save data as formatted JSON file (atomically: temp file, then rename).
         
         Args:
             data: Dictionary to save
             filepath: Output file path
-            indent: JSON indentation
+            indent: Any value pretty-prints (2-space indent); None writes compact JSON
+            serializer: Encoder backend (default: fastest installed, see get_serializer)
         """
         # Ensure directory exists
-        import os
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
         
-        # Convert datetime objects to strings
-        def datetime_serializer(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
+        serializer = serializer or get_serializer()
         
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, default=datetime_serializer, ensure_ascii=False)
+        # Write to file (datetimes and models are handled by the serializer)
+        atomic_write(filepath, serializer.dumps(data, pretty=indent is not None))
         
-        print(f"💾 Saved JSON to: {filepath}")
+        logger.info("💾 Saved JSON to: %s", filepath)
     
     @staticmethod
     def validate_json(filepath: str) -> bool:
@@ -47,7 +51,7 @@ class JSONOutputFormatter:
                 json.load(f)
             return True
         except json.JSONDecodeError as e:
-            print(f"❌ Invalid JSON in {filepath}: {e}")
+            logger.error("❌ Invalid JSON in %s: %s", filepath, e)
             return False
     
     @staticmethod
@@ -0,0 +1,34 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+def lazy_exports(module_name: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module-level __getattr__ and __dir__ (PEP 562) for a package whose
+    public names are imported from their submodules on first access, so
+    importing the package itself stays cheap.
+
+    Usage in a package __init__:
+        __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+    Args:
+        module_name: The package's __name__
+        exports: Public name -> relative submodule defining it (e.g. ".cache")
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package namespace
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], module_name), name)
+        # Later lookups find the attribute directly and skip this hook
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__
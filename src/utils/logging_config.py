@@ -0,0 +1,47 @@
+import logging
+import sys
+from typing import Optional, TextIO, Union
+
+# Parent of every module logger in the package (logging.getLogger(__name__))
+PACKAGE_LOGGER = "src"
+
+# quiet: warnings and errors only, nothing per product
+# normal: workflow and node progress
+# verbose: every agent, block and template step
+VERBOSITY_LEVELS = {
+    "quiet": logging.WARNING,
+    "normal": logging.INFO,
+    "verbose": logging.DEBUG
+}
+
+def configure_logging(verbosity: Union[str, int] = "normal", stream: Optional[TextIO] = None,
+                      fmt: str = "%(message)s") -> logging.Logger:
+    """
+    Send the package's log records to the console at the given verbosity.
+
+    Calling it again replaces the handler installed by the previous call, so
+    the verbosity can be changed between runs.
+
+    Args:
+        verbosity: "quiet", "normal", "verbose" or a logging level
+        stream: Output stream (default: stdout, matching the CLI's own output)
+        fmt: Log record format
+
+    Returns:
+        The package logger
+    """
+    level = VERBOSITY_LEVELS[verbosity] if isinstance(verbosity, str) else verbosity
+
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in list(logger.handlers):
+        if getattr(handler, "_configured_by_package", False):
+            logger.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter(fmt))
+    handler._configured_by_package = True
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    # Our handler prints the records; don't print them again through the root logger
+    logger.propagate = False
+    return logger
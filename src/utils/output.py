@@ -0,0 +1,369 @@
+import os
+import re
+import threading
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from .serializers import Serializer, get_serializer
+
+PAGE_LAYOUTS = ("jsonl", "sharded")
+
+# "file": fsync every file as it is written; "batch": once per flush()/close();
+# "none": leave it to the OS
+FSYNC_POLICIES = ("file", "batch", "none")
+
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# Names of the numbered files a sink owns in each page directory
+_BUNDLE_FILE = re.compile(r"bundle-\d{5,}\.jsonl(\.gz|\.zst)?")
+_PART_FILE = re.compile(r"part-\d{5,}\.jsonl")
+
+def atomic_write(path: str, data: bytes, fsync: bool = False):
+    """
+    Write a file so readers see either the old content or the new, never a mix.
+
+    The data goes to a temporary file in the same directory, which is then
+    renamed over the target.
+
+    Args:
+        path: Target file
+        data: Complete file content
+        fsync: Flush the file and its directory entry to disk before returning
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = _create_temp(directory, os.path.basename(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    if fsync:
+        _fsync_directory(directory)
+
+def _create_temp(directory: str, name: str) -> Tuple[int, str]:
+    """Create a new temporary file for ``name`` in directory; returns (fd, path)"""
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            # 0666 like open(), so the current umask decides the final mode
+            # (mkstemp would create it 0600)
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0), 0o666)
+        except FileExistsError:
+            continue
+        return fd, tmp_path
+
+def _remove_stale(directory: str, pattern: "re.Pattern[str]"):
+    """
+    Delete the numbered files a previous run left in a page directory.
+
+    Numbering restarts at 0 on every run, so a shorter run would otherwise
+    leave the old run's higher-numbered files next to its own.
+    """
+    for name in os.listdir(directory):
+        if pattern.fullmatch(name):
+            os.unlink(os.path.join(directory, name))
+
+def _fsync_directory(directory: str):
+    """Persist renames in a directory (POSIX only; a no-op elsewhere)"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _fsync_paths(paths: List[str]):
+    """fsync already-written files, then each of their directories once"""
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    for directory in {os.path.dirname(path) or "." for path in paths}:
+        _fsync_directory(directory)
+
+def _compress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression is None:
+        return data
+    if compression == "gzip":
+        import gzip
+        # mtime=0 keeps the output reproducible
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    import zstandard
+    return zstandard.ZstdCompressor().compress(data)
+
+def _decompress(data: bytes, path: str) -> bytes:
+    if path.endswith(".gz"):
+        import gzip
+        return gzip.decompress(data)
+    if path.endswith(".zst"):
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+def _check_options(fsync: str, compression: Optional[str]):
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy '{fsync}', expected one of {FSYNC_POLICIES}")
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression '{compression}', expected gzip, zstd or None")
+    if compression == "zstd":
+        # Fail at construction rather than on the first full bundle
+        import zstandard  # noqa: F401
+
+def read_jsonl(path: str, serializer: Optional[Serializer] = None) -> Iterator[Any]:
+    """
+    Read the documents of a JSON Lines file written by a page sink.
+
+    Handles plain, .gz and .zst files.
+    """
+    serializer = serializer or get_serializer()
+    with open(path, "rb") as f:
+        data = _decompress(f.read(), path)
+    for line in data.splitlines():
+        if line:
+            yield serializer.loads(line)
+
+class PageStreamWriter:
+    """
+    Streams generated pages to disk as JSON Lines, one document per line.
+
+    Layouts:
+        jsonl:   <output_dir>/<page>.jsonl
+        sharded: <output_dir>/<page>/part-00000.jsonl, part-00001.jsonl, ...
+                 with at most ``shard_size`` documents per file; parts left
+                 by a previous run are deleted when the first one is opened
+
+    Each document is serialized and written the moment it arrives, so the
+    writer holds no pages in memory. Lines are in completion order; every
+    page carries its product name in ``content``.
+    """
+
+    def __init__(self, output_dir: str, layout: str = "jsonl", shard_size: int = 10_000,
+                 serializer: Optional[Serializer] = None):
+        """
+        Args:
+            output_dir: Directory for the page files (created if missing)
+            layout: "jsonl" or "sharded"
+            shard_size: Documents per file in the sharded layout
+            serializer: Encoder backend (default: fastest installed)
+        """
+        if layout not in PAGE_LAYOUTS:
+            raise ValueError(f"Unknown layout '{layout}', expected one of {PAGE_LAYOUTS}")
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+
+        self.output_dir = output_dir
+        self.layout = layout
+        self.shard_size = shard_size
+        self.serializer = serializer or get_serializer()
+        self.counts: Dict[str, int] = {}
+        self._files: Dict[str, BinaryIO] = {}
+        self._lock = threading.Lock()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write(self, page: str, document: Any):
+        """
+        Serialize one page document and append it to the page's stream.
+
+        Args:
+            page: Page type, e.g. "faq" or "product_page"
+            document: JSON-serializable page document
+        """
+        line = self.serializer.dumps(document) + b"\n"
+        with self._lock:
+            count = self.counts.get(page, 0)
+            stream = self._get_stream(page, count)
+            stream.write(line)
+            self.counts[page] = count + 1
+
+    def _get_stream(self, page: str, count: int) -> BinaryIO:
+        """Open (or rotate to) the file the next document of this page goes to (lock held)"""
+        stream = self._files.get(page)
+        if self.layout == "sharded" and count % self.shard_size == 0:
+            if stream is not None:
+                stream.close()
+            page_dir = os.path.join(self.output_dir, page)
+            os.makedirs(page_dir, exist_ok=True)
+            if count == 0:
+                _remove_stale(page_dir, _PART_FILE)
+            stream = None
+            path = os.path.join(page_dir, f"part-{count // self.shard_size:05d}.jsonl")
+        else:
+            path = os.path.join(self.output_dir, f"{page}.jsonl")
+
+        if stream is None:
+            stream = self._files[page] = open(path, "wb")
+        return stream
+
+    def close(self):
+        """Flush and close every page file"""
+        with self._lock:
+            for stream in self._files.values():
+                stream.close()
+            self._files.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class FileSink:
+    """
+    Writes one JSON document per file, atomically.
+
+    Every file is written to a temporary name and renamed into place, so a
+    crash never leaves a half-written page behind. Used for the single
+    product outputs (faq.json, product_page.json, ...).
+    """
+
+    def __init__(self, output_dir: str, fsync: str = "batch", compression: Optional[str] = None,
+                 pretty: bool = True, serializer: Optional[Serializer] = None):
+        """
+        Args:
+            output_dir: Directory for the files (created if missing)
+            fsync: "file", "batch" (on flush/close) or "none"
+            compression: None, "gzip" or "zstd" (zstd needs the zstandard package)
+            pretty: Indent documents (compact otherwise)
+            serializer: Encoder backend (default: fastest installed)
+        """
+        _check_options(fsync, compression)
+        self.output_dir = output_dir
+        self.fsync = fsync
+        self.compression = compression
+        self.pretty = pretty
+        self.serializer = serializer or get_serializer()
+        self.counts: Dict[str, int] = {}
+        self._unsynced: List[str] = []
+        self._lock = threading.Lock()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def path_for(self, name: str) -> str:
+        """File a document named ``name`` is written to"""
+        return os.path.join(self.output_dir, f"{name}.json{COMPRESSION_SUFFIXES[self.compression]}")
+
+    def write(self, name: str, document: Any) -> str:
+        """
+        Serialize a document and atomically replace ``<name>.json``.
+
+        Returns:
+            Path of the written file
+        """
+        data = _compress(self.serializer.dumps(document, pretty=self.pretty), self.compression)
+        path = self.path_for(name)
+        atomic_write(path, data, fsync=self.fsync == "file")
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+            if self.fsync == "batch":
+                self._unsynced.append(path)
+        return path
+
+    def flush(self):
+        """Sync files written since the last flush (batch policy)"""
+        with self._lock:
+            paths, self._unsynced = self._unsynced, []
+        if paths:
+            _fsync_paths(paths)
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+class BundleSink:
+    """
+    Groups page documents into bundle files instead of one file per page.
+
+    Documents are buffered per page type and written as JSON Lines bundles of
+    ``bundle_size`` documents: <output_dir>/<page>/bundle-00000.jsonl[.gz|.zst].
+    Each bundle is one atomic write, which turns millions of small writes
+    into a few large ones. Bundles from a previous run in the same directory
+    are deleted when the page's first bundle is written. Memory is bounded by bundle_size per page type.
+    Has the same write(page, document) interface as PageStreamWriter, so it
+    can be used as an orchestrator page_sink.
+    """
+
+    def __init__(self, output_dir: str, bundle_size: int = 1000, fsync: str = "batch",
+                 compression: Optional[str] = None, serializer: Optional[Serializer] = None):
+        """
+        Args:
+            output_dir: Directory for the bundles (created if missing)
+            bundle_size: Documents per bundle file
+            fsync: "file" (every bundle), "batch" (on flush/close) or "none"
+            compression: None, "gzip" or "zstd" (zstd needs the zstandard package)
+            serializer: Encoder backend (default: fastest installed)
+        """
+        if bundle_size < 1:
+            raise ValueError("bundle_size must be at least 1")
+        _check_options(fsync, compression)
+
+        self.output_dir = output_dir
+        self.bundle_size = bundle_size
+        self.fsync = fsync
+        self.compression = compression
+        self.serializer = serializer or get_serializer()
+        self.counts: Dict[str, int] = {}
+        self._buffers: Dict[str, List[bytes]] = {}
+        self._bundles: Dict[str, int] = {}
+        self._unsynced: List[str] = []
+        self._lock = threading.Lock()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write(self, page: str, document: Any):
+        """Buffer one document; a full bundle is written out immediately"""
+        line = self.serializer.dumps(document) + b"\n"
+        with self._lock:
+            buffer = self._buffers.setdefault(page, [])
+            buffer.append(line)
+            self.counts[page] = self.counts.get(page, 0) + 1
+            if len(buffer) >= self.bundle_size:
+                self._write_bundle(page)
+
+    def flush(self):
+        """Write partially filled bundles and sync everything written so far (batch policy)"""
+        with self._lock:
+            for page, buffer in self._buffers.items():
+                if buffer:
+                    self._write_bundle(page)
+            paths, self._unsynced = self._unsynced, []
+        if paths:
+            _fsync_paths(paths)
+
+    def close(self):
+        self.flush()
+
+    def _write_bundle(self, page: str):
+        """Write the page's buffered documents as the next bundle (lock held)"""
+        page_dir = os.path.join(self.output_dir, page)
+        os.makedirs(page_dir, exist_ok=True)
+
+        number = self._bundles.get(page, 0)
+        if number == 0:
+            _remove_stale(page_dir, _BUNDLE_FILE)
+        self._bundles[page] = number + 1
+        path = os.path.join(
+            page_dir, f"bundle-{number:05d}.jsonl{COMPRESSION_SUFFIXES[self.compression]}"
+        )
+
+        data = _compress(b"".join(self._buffers[page]), self.compression)
+        self._buffers[page] = []
+        atomic_write(path, data, fsync=self.fsync == "file")
+        if self.fsync == "batch":
+            self._unsynced.append(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
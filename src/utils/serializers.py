@@ -0,0 +1,266 @@
+import hashlib
+import json
+import re
+import secrets
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, BinaryIO, Callable, Dict, List, Tuple, Type
+
+def _to_builtin(obj: Any) -> Any:
+    """Fallback conversion for types the encoders do not handle natively"""
+    model_dump = getattr(obj, "model_dump", None)
+    if callable(model_dump):
+        return model_dump()
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+class Fragment:
+    """
+    A constant JSON subtree that is encoded once and spliced into documents.
+
+    A value fragment stands anywhere a JSON value can. A members fragment
+    holds a dict whose key/value pairs are spliced into the enclosing
+    object; place it with ``{**fragment.members()}`` (or
+    ``{**dynamic, **fragment.members()}``).
+
+    Serializer.dumps encodes each fragment once per backend and replaces
+    a short placeholder in the output with the cached bytes, so the
+    subtree is neither rebuilt nor re-encoded per document. Documents
+    holding fragments must be encoded through a Serializer; other encoders
+    reject them.
+    """
+
+    __slots__ = ("value", "is_members", "key", "id", "_encoded")
+
+    def __init__(self, value: Any, members: bool = False):
+        """
+        Args:
+            value: JSON-serializable constant; treat it as immutable
+            members: Splice the pairs of a (non-empty) dict into the enclosing object
+        """
+        if members and not (isinstance(value, dict) and value):
+            raise ValueError("A members fragment needs a non-empty dict")
+        self.value = value
+        self.is_members = members
+        # Content-derived, so pickled fragments keep a key that is unique in any process
+        digest = hashlib.blake2b(
+            json.dumps([members, value], ensure_ascii=False, default=str).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        self.key = f"\x00fragment:{digest}\x00"
+        self.id = digest.encode("ascii")
+        self._encoded: Dict[Tuple[str, bool], bytes] = {}
+
+    def members(self) -> Dict[str, "Fragment"]:
+        """The single placeholder pair to spread into the enclosing dict"""
+        return {self.key: self}
+
+    def __repr__(self):
+        return f"Fragment({self.value!r}, members={self.is_members})"
+
+    def _encode(self, serializer: "Serializer", pretty: bool) -> bytes:
+        """Cached encoding; members fragments drop the braces (and one indent level)"""
+        cache_key = (serializer.name, pretty)
+        data = self._encoded.get(cache_key)
+        if data is None:
+            data = serializer.dumps(self.value, pretty=pretty)
+            if self.is_members:
+                data = data[1:-1]
+                if pretty:
+                    data = b"\n".join(line[2:] for line in data.strip(b"\n").split(b"\n"))
+            self._encoded[cache_key] = data
+        return data
+
+class Serializer(ABC):
+    """
+    JSON encoder backend.
+
+    All backends emit UTF-8 bytes without ASCII-escaping and handle
+    datetimes (ISO 8601), enums, pydantic models and the slots-backed
+    records. Compact mode uses no whitespace; pretty mode indents by 2.
+    Fragment subtrees are spliced in from their cached encoding.
+    """
+
+    name: str = ""
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """Encode obj to JSON bytes"""
+        fragments: List[Fragment] = []
+        fallback = self._fallback
+        # Placeholders carry a per-call nonce, so strings in the document
+        # that merely look like placeholders are never spliced
+        nonce = secrets.token_hex(8)
+
+        def default(value: Any) -> Any:
+            if type(value) is Fragment:
+                fragments.append(value)
+                return f"\x00fragment:{nonce}:{len(fragments) - 1}\x00"
+            return fallback(value)
+
+        data = self._encode(obj, pretty, default)
+        if fragments:
+            data = self._splice(data, fragments, nonce.encode("ascii"), pretty)
+        return data
+
+    @abstractmethod
+    def _encode(self, obj: Any, pretty: bool, default: Callable[[Any], Any]) -> bytes:
+        """Backend encoding; ``default`` converts unsupported objects"""
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes"""
+        pass
+
+    def dump(self, obj: Any, fp: BinaryIO, pretty: bool = False):
+        """Encode obj into a binary file"""
+        fp.write(self.dumps(obj, pretty=pretty))
+
+    _fallback = staticmethod(_to_builtin)
+
+    def _splice(self, data: bytes, fragments: List[Fragment], nonce: bytes, pretty: bool) -> bytes:
+        """Replace this call's fragment placeholders with the fragments' cached encoding (one pass)"""
+        parts = _PLACEHOLDER.split(data)
+        # parts: text, placeholder, members key id, nonce, index, text, ..., text
+        for index in range(1, len(parts), 5):
+            placeholder, key_id, call_nonce, position = parts[index:index + 4]
+            parts[index + 1:index + 4] = b"", b"", b""
+            if call_nonce != nonce:
+                # Document text, not a placeholder from this call
+                continue
+            fragment = fragments[int(position)]
+            encoded = fragment._encode(self, pretty)
+            if fragment.is_members:
+                if key_id != fragment.id:
+                    raise ValueError(f"{fragment!r} must be spread into a dict with members()")
+            elif key_id is not None:
+                # A value fragment under a key that looks like a members key; keep the key
+                encoded = placeholder[:placeholder.rindex(b'"', 0, -1)] + encoded
+            if pretty and b"\n" in encoded:
+                # Continuation lines take the indent of the placeholder's line
+                text = parts[index - 1]
+                line = text[text.rfind(b"\n") + 1:]
+                encoded = encoded.replace(b"\n", b"\n" + line[:len(line) - len(line.lstrip(b" "))])
+            parts[index] = encoded
+        return b"".join(parts)
+
+# How a placeholder from Serializer.dumps appears in encoder output, either
+# as a value or as the value of a members pair ("Fragment.key":"placeholder",
+# with a space in pretty mode)
+_PLACEHOLDER = re.compile(
+    rb'((?:"\\u0000fragment:([0-9a-f]{16})\\u0000": ?)?"\\u0000fragment:([0-9a-f]{16}):([0-9]+)\\u0000")'
+)
+
+class StdlibSerializer(Serializer):
+    """Standard library json; always available"""
+
+    name = "stdlib"
+
+    def _encode(self, obj: Any, pretty: bool, default: Callable[[Any], Any]) -> bytes:
+        if pretty:
+            text = json.dumps(obj, indent=2, ensure_ascii=False, default=default)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=default)
+        return text.encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    @staticmethod
+    def _fallback(obj: Any) -> Any:
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        if isinstance(obj, Enum):
+            return obj.value
+        return _to_builtin(obj)
+
+class OrjsonSerializer(Serializer):
+    """orjson (Rust); datetimes and enums are encoded natively"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def _encode(self, obj: Any, pretty: bool, default: Callable[[Any], Any]) -> bytes:
+        option = self._orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= self._orjson.OPT_INDENT_2
+        return self._orjson.dumps(obj, default=default, option=option)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+class MsgspecSerializer(Serializer):
+    """msgspec; datetimes and enums are encoded natively"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+
+    def _encode(self, obj: Any, pretty: bool, default: Callable[[Any], Any]) -> bytes:
+        data = self._msgspec.json.encode(obj, enc_hook=default)
+        if pretty:
+            data = self._msgspec.json.format(data, indent=2)
+        return data
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+# Backends in order of preference for "auto"
+SERIALIZERS: Dict[str, Type[Serializer]] = {
+    "orjson": OrjsonSerializer,
+    "msgspec": MsgspecSerializer,
+    "stdlib": StdlibSerializer
+}
+
+_instances: Dict[str, Serializer] = {}
+
+def get_serializer(name: str = "auto") -> Serializer:
+    """
+    Return a (shared) serializer backend.
+
+    Args:
+        name: "orjson", "msgspec", "stdlib", or "auto" for the fastest
+            installed backend
+
+    Raises:
+        ValueError: Unknown backend name
+        ImportError: The requested backend is not installed
+    """
+    if name == "auto":
+        for candidate in SERIALIZERS:
+            try:
+                return get_serializer(candidate)
+            except ImportError:
+                continue
+
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer '{name}', expected 'auto' or one of {tuple(SERIALIZERS)}")
+
+    serializer = _instances.get(name)
+    if serializer is None:
+        serializer = _instances[name] = SERIALIZERS[name]()
+    return serializer
+
+def available_serializers() -> Dict[str, bool]:
+    """Backend name → whether it can be used in this environment"""
+    available = {}
+    for name in SERIALIZERS:
+        try:
+            get_serializer(name)
+            available[name] = True
+        except ImportError:
+            available[name] = False
+    return available
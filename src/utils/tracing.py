@@ -0,0 +1,223 @@
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+class Span(NamedTuple):
+    """One timed operation (times from time.perf_counter_ns)"""
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    attrs: Dict[str, Any]
+
+class SpanExporter(ABC):
+    """Receives every finished span; subclasses decide where it goes"""
+
+    @abstractmethod
+    def export(self, span: Span):
+        pass
+
+    def close(self):
+        """Flush any buffered output"""
+        pass
+
+class HistogramExporter(SpanExporter):
+    """
+    Keeps span durations in memory, grouped by (category, name), and
+    aggregates them into percentiles. Durations are stored as packed
+    64-bit integers, so a 100k-product run costs a few MB.
+    """
+
+    def __init__(self, percentiles: Sequence[float] = (50, 90, 99)):
+        self.percentiles = tuple(percentiles)
+        self._durations: Dict[Tuple[str, str], array] = {}
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        key = (span.category, span.name)
+        with self._lock:
+            durations = self._durations.get(key)
+            if durations is None:
+                durations = self._durations[key] = array("q")
+            durations.append(span.duration_ns)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Aggregate statistics per category and name, in milliseconds.
+
+        Returns:
+            {category: {name: {"count", "total_ms", "mean_ms", "max_ms", "p50_ms", ...}}}
+        """
+        with self._lock:
+            groups = {key: sorted(durations) for key, durations in self._durations.items()}
+
+        summary: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (category, name), durations in sorted(groups.items()):
+            count = len(durations)
+            total = sum(durations)
+            stats = {
+                "count": count,
+                "total_ms": total / 1e6,
+                "mean_ms": total / count / 1e6,
+                "max_ms": durations[-1] / 1e6
+            }
+            for percentile in self.percentiles:
+                # Nearest-rank percentile
+                rank = max(1, -(-percentile * count // 100))
+                stats[f"p{percentile:g}_ms"] = durations[int(rank) - 1] / 1e6
+            summary.setdefault(category, {})[name] = stats
+        return summary
+
+    def reset(self):
+        with self._lock:
+            self._durations.clear()
+
+class JSONLinesExporter(SpanExporter):
+    """Appends one JSON object per span to a file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps({
+            "name": span.name,
+            "category": span.category,
+            "start_ns": span.start_ns,
+            "duration_ns": span.duration_ns,
+            "thread_id": span.thread_id,
+            **span.attrs
+        }, ensure_ascii=False, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+class ChromeTraceExporter(SpanExporter):
+    """
+    Writes the Chrome trace-event format (load it in chrome://tracing or
+    Perfetto). Events are streamed to the file as they finish; the JSON
+    document is completed by close().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._pid = os.getpid()
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write('{"traceEvents":[\n')
+        self._first = True
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        event = json.dumps({
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": span.duration_ns / 1000,
+            "pid": self._pid,
+            "tid": span.thread_id,
+            "args": span.attrs
+        }, ensure_ascii=False, default=str)
+        with self._lock:
+            if not self._first:
+                self._file.write(",\n")
+            self._first = False
+            self._file.write(event)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.write('\n],"displayTimeUnit":"ms"}\n')
+                self._file.close()
+
+class Tracer:
+    """
+    Collects timing spans and hands them to exporters.
+
+    The orchestrator activates its tracer for the duration of a run; blocks
+    and templates reach it through get_tracer(), so they need no extra
+    arguments. With no active tracer, spans cost a context-variable lookup.
+
+    Example:
+        histogram = HistogramExporter()
+        orchestrator = build_content_workflow(tracer=Tracer(histogram))
+        list(orchestrator.execute_many(products))
+        histogram.summary()["node"]["content_blocks"]["p99_ms"]
+    """
+
+    enabled = True
+
+    def __init__(self, *exporters: SpanExporter):
+        self.exporters: List[SpanExporter] = list(exporters)
+
+    @contextmanager
+    def span(self, name: str, category: str, **attrs: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time the enclosed block.
+
+        Yields:
+            The span's attrs dict; values added inside the block are exported
+        """
+        start_ns = time.perf_counter_ns()
+        try:
+            yield attrs
+        finally:
+            self.record(name, category, start_ns, time.perf_counter_ns() - start_ns, **attrs)
+
+    def record(self, name: str, category: str, start_ns: int, duration_ns: int,
+               thread_id: Optional[int] = None, **attrs: Any):
+        """Export a span that was timed elsewhere (e.g. in a worker)"""
+        span = Span(
+            name, category, start_ns, duration_ns,
+            threading.get_ident() if thread_id is None else thread_id, attrs
+        )
+        for exporter in self.exporters:
+            exporter.export(span)
+
+    @contextmanager
+    def activate(self) -> Iterator["Tracer"]:
+        """Make this the tracer returned by get_tracer() in the current context"""
+        token = _current_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _current_tracer.reset(token)
+
+    def close(self):
+        """Close every exporter"""
+        for exporter in self.exporters:
+            exporter.close()
+
+class NullTracer(Tracer):
+    """Tracer used when tracing is off; spans are not timed"""
+
+    enabled = False
+
+    def __init__(self):
+        super().__init__()
+
+    def span(self, name: str, category: str, **attrs: Any):
+        return nullcontext(attrs)
+
+    def record(self, name: str, category: str, start_ns: int, duration_ns: int,
+               thread_id: Optional[int] = None, **attrs: Any):
+        pass
+
+NULL_TRACER = NullTracer()
+
+_current_tracer: ContextVar[Tracer] = ContextVar("tracer", default=NULL_TRACER)
+
+def get_tracer() -> Tracer:
+    """The tracer active in the current context (NULL_TRACER if none)"""
+    return _current_tracer.get()
@@ -0,0 +1,109 @@
+import sys
+import os
+import asyncio
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.orchestration.async_dag import AsyncDAGOrchestrator
+from src.orchestration.models import NodeStatus
+from src.orchestration.workflow import build_content_workflow
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+
+class AsyncSleepAgent:
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    async def process(self, data):
+        await asyncio.sleep(self.seconds)
+        return self.seconds
+
+
+class AsyncMeetAgent:
+    """Signals that it is running, then waits on the loop until the other branch is too"""
+
+    def __init__(self, running, other_running):
+        self.running = running
+        self.other_running = other_running
+
+    async def process(self, data):
+        self.running.set()
+        for _ in range(500):
+            if self.other_running.is_set():
+                return True
+            await asyncio.sleep(0.01)
+        raise RuntimeError("The other branch never ran at the same time")
+
+
+class SyncMeetAgent:
+    """Signals that it is running, then blocks its worker thread until the other branch is too"""
+
+    def __init__(self, running, other_running):
+        self.running = running
+        self.other_running = other_running
+
+    def process(self, data):
+        self.running.set()
+        if not self.other_running.wait(timeout=5):
+            raise RuntimeError("The other branch never ran at the same time")
+        return True
+
+
+def test_async_orchestrator():
+    print("🧪 Testing async DAG orchestrator...")
+
+    async def scenario():
+        # Async and sync agents overlap on the loop: each branch only
+        # finishes once it has seen the other one running
+        async_running, sync_running = threading.Event(), threading.Event()
+        orchestrator = AsyncDAGOrchestrator(max_workers=2)
+        orchestrator.add_node("root", AsyncSleepAgent(0))
+        orchestrator.add_node("async_branch", AsyncMeetAgent(async_running, sync_running), ["root"])
+        orchestrator.add_node("sync_branch", SyncMeetAgent(sync_running, async_running), ["root"])
+        await orchestrator.execute_async({"initial_data": {}})
+        assert all(node.status == NodeStatus.COMPLETED for node in orchestrator.nodes.values())
+        orchestrator.shutdown()
+
+        # Per-node timeout fails the node and cancels its running sibling
+        orchestrator = AsyncDAGOrchestrator()
+        orchestrator.add_node("root", AsyncSleepAgent(0))
+        orchestrator.add_node("slow", AsyncSleepAgent(5), ["root"])
+        orchestrator.add_node("limited", AsyncSleepAgent(5), ["root"], timeout=0.1)
+        try:
+            await orchestrator.execute_async({"initial_data": {}})
+            assert False, "Expected TimeoutError"
+        except TimeoutError:
+            pass
+        assert orchestrator.nodes["limited"].status == NodeStatus.FAILED
+        assert orchestrator.nodes["slow"].status == NodeStatus.CANCELLED
+
+        # Many product workflows concurrently in one loop, results in order
+        orchestrator = build_content_workflow(orchestrator_class=AsyncDAGOrchestrator)
+        catalog = [dict(RAW_DATA, **{"Product Name": f"GlowBoost Variant {i}"}) for i in range(6)]
+        catalog[2] = {"Product Name": "Broken record"}
+        results = [result async for result in orchestrator.execute_many_async(catalog, concurrency=3)]
+        orchestrator.shutdown()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert len(results) == 6
+    assert "error" in results[2]
+    titles = [r["product_page"]["content"]["header"]["title"] for i, r in enumerate(results) if i != 2]
+    assert titles == [f"GlowBoost Variant {i}" for i in (0, 1, 3, 4, 5)]
+
+    print(f"✅ Async orchestrator overlapped branches and ran {len(results)} workflows")
+
+
+if __name__ == "__main__":
+    test_async_orchestrator()
@@ -4,6 +4,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.agents.parser_agent import ParserAgent
 from src.logic_blocks.manager import ContentBlockManager
+from src.logic_blocks.rules import KeywordRuleSet
 
 def test_content_blocks():
     print("🧪 Testing Content Logic Blocks...")
@@ -55,5 +56,28 @@ def test_content_blocks():
     print("\n✅ All content blocks working correctly!")
     return True
 
+def test_keyword_rules():
+    print("🧪 Testing keyword rule set...")
+
+    rules = KeywordRuleSet([
+        ("drop", "short"),
+        ("drops", "long"),
+        ("morning", "AM"),
+        ("night", "PM"),
+    ])
+
+    # Overlapping keywords that share a start position all match
+    assert rules.apply("Apply 2 DROPS in the morning") == ["short", "long", "AM"]
+    assert rules.apply("Nothing relevant") == []
+
+    # Rules added later apply right away
+    rules.add("sun", "SPF")
+    assert rules.apply("before sunscreen") == ["SPF"]
+    assert len(rules) == 5
+    assert KeywordRuleSet().apply("before sunscreen") == []
+
+    print("✅ Keyword rule tests passed!")
+
 if __name__ == "__main__":
-    test_content_blocks()
\ No newline at end of file
+    test_content_blocks()
+    test_keyword_rules()
\ No newline at end of file
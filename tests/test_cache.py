@@ -0,0 +1,100 @@
+import sys
+import os
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.parser_agent import ParserAgent
+from src.logic_blocks.manager import ContentBlockManager
+from src.utils.cache import LRUCache, SQLiteCache, MISSING
+
+def test_block_cache():
+    print("🧪 Testing content block cache...")
+    
+    raw_data = {
+        "Product Name": "GlowBoost Vitamin C Serum",
+        "Concentration": "10% Vitamin C", 
+        "Skin Type": "Oily, Combination",
+        "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+        "Benefits": "Brightening, Fades dark spots",
+        "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": "₹699"
+    }
+    parser = ParserAgent()
+    product = parser.process(raw_data)
+    repriced = parser.process(dict(raw_data, Price="₹1299"))
+    
+    uncached = ContentBlockManager().apply_blocks(product)
+    
+    # In-memory LRU: the first run misses the product entry and all 5 blocks,
+    # the unchanged re-run is a single product-level hit
+    manager = ContentBlockManager(cache=LRUCache(max_entries=100))
+    assert manager.apply_blocks(product) == uncached
+    assert manager.apply_blocks(product) == uncached
+    assert manager.cache_stats()["hits"] == 1
+    assert manager.cache_stats()["misses"] == 6
+    
+    # Only the block reading the changed field misses (besides the product entry)
+    manager.apply_blocks(repriced)
+    assert manager.cache_stats()["hits"] == 5
+    assert manager.cache_stats()["misses"] == 8
+    
+    # LRU eviction
+    lru = LRUCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        lru.set(key, key)
+    assert lru.get("a") is MISSING and lru.get("c") == "c"
+    assert lru.stats()["evictions"] == 1
+    
+    # Lookups from several threads are all counted
+    counted = LRUCache()
+    counted.set("a", 1)
+    threads = [
+        threading.Thread(target=lambda: [counted.get(key) for key in ("a", "b") * 1000])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counted.stats()["hits"] == counted.stats()["misses"] == 8000
+    
+    # On-disk SQLite persists across instances and evicts by size
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "blocks.sqlite")
+        disk = SQLiteCache(path)
+        ContentBlockManager(cache=disk).apply_blocks(product)
+        disk.close()
+        
+        reopened = SQLiteCache(path)
+        manager = ContentBlockManager(cache=reopened)
+        assert manager.apply_blocks(product) == uncached
+        assert manager.cache_stats()["hits"] == 1
+        reopened.close()
+        
+        small = SQLiteCache(os.path.join(tmp, "small.sqlite"), max_bytes=200)
+        for i in range(10):
+            small.set(f"key-{i}", "x" * 50)
+        assert small.stats()["bytes"] <= 200
+        assert small.get("key-9") == "x" * 50
+        assert small.get("key-0") is MISSING
+        small.close()
+        
+        # Hits never write; stores are buffered until flushed
+        batched = SQLiteCache(os.path.join(tmp, "batched.sqlite"), batch_size=3)
+        batched.set("key-0", "x")
+        assert batched.get("key-0") == "x"
+        before = batched._conn.total_changes
+        batched.set("key-1", "x")
+        assert batched.get("key-0") == "x" and batched._conn.total_changes == before
+        batched.set("key-2", "x")
+        assert batched._conn.total_changes == before + 3
+        batched.set("key-3", "x")
+        batched.close()
+        assert len(SQLiteCache(os.path.join(tmp, "batched.sqlite"))) == 4
+    
+    print("✅ Block cache hits on unchanged products and evicts correctly")
+
+if __name__ == "__main__":
+    test_block_cache()
@@ -0,0 +1,76 @@
+import sys
+import os
+import csv
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.feed_ingest_agent import FeedIngestAgent
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+def test_feed_ingest():
+    print("🧪 Testing streaming feed ingest...")
+    
+    agent = FeedIngestAgent()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # JSONL: two valid rows, one missing fields, one malformed line
+        jsonl_path = os.path.join(tmp, "feed.jsonl")
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(RAW_DATA, ensure_ascii=False) + "\n")
+            f.write(json.dumps({"Product Name": "Incomplete"}) + "\n")
+            f.write("{not json\n")
+            f.write("\n")
+            f.write(json.dumps(dict(RAW_DATA, **{"Product Name": "Second"}), ensure_ascii=False) + "\n")
+        
+        products = agent.iter_products(jsonl_path)
+        first = next(products)
+        assert first.skin_type == ["Oily", "Combination"]
+        names = [first.name] + [p.name for p in products]
+        
+        assert names == ["GlowBoost Vitamin C Serum", "Second"]
+        assert agent.stats == {"rows_read": 4, "rows_valid": 2, "rows_rejected": 2}
+        
+        with open(jsonl_path + ".errors.jsonl", encoding="utf-8") as f:
+            rejects = [json.loads(line) for line in f]
+        assert [r["line"] for r in rejects] == [2, 3]
+        assert [r["error"] for r in rejects] == ["validation_failed", "invalid_json"]
+        
+        # CSV: one valid row, one short row
+        csv_path = os.path.join(tmp, "feed.csv")
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(RAW_DATA.keys())
+            writer.writerow(RAW_DATA.values())
+            writer.writerow(["Short row", "5%"])
+        
+        error_path = os.path.join(tmp, "csv_rejects.jsonl")
+        products = list(agent.iter_products(csv_path, error_path=error_path))
+        
+        assert len(products) == 1
+        assert products[0].key_ingredients == ["Vitamin C", "Hyaluronic Acid"]
+        assert agent.stats["rows_rejected"] == 1
+        assert os.path.exists(error_path)
+        
+        # A clean re-run removes the previous run's rejects
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(RAW_DATA.keys())
+            writer.writerow(RAW_DATA.values())
+        assert len(list(agent.iter_products(csv_path, error_path=error_path))) == 1
+        assert not os.path.exists(error_path)
+    
+    print("✅ Feed ingest streamed valid rows and routed rejects to the error file")
+
+if __name__ == "__main__":
+    test_feed_ingest()
@@ -0,0 +1,93 @@
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.parser_agent import ParserAgent
+from src.logic_blocks.lexicon import Lexicon, LexiconIndex, load_lexicon, build_index
+from src.logic_blocks.manager import ContentBlockManager
+
+ENTRIES = {
+    "Vitamin C": {"aliases": ["Ascorbic Acid", "L-Ascorbic Acid"], "benefit": "Brightens"},
+    "Niacinamide": {"aliases": ["Vitamin B3"], "benefit": "Refines pores"}
+}
+
+def test_lexicon_lookup():
+    print("🧪 Testing lexicon lookup...")
+    
+    lexicon = Lexicon(ENTRIES)
+    
+    # Case, whitespace and aliases all resolve to the canonical entry
+    assert lexicon.canonical("vitamin  c") == "Vitamin C"
+    assert lexicon.canonical(" ASCORBIC ACID ") == "Vitamin C"
+    assert lexicon.get("vitamin b3") == {"benefit": "Refines pores"}
+    assert lexicon.get("Retinol") is None
+    assert "l-ascorbic acid" in lexicon
+    assert len(lexicon) == 2
+    
+    # An alias may not point at two entries
+    try:
+        Lexicon({"A": {"aliases": ["x"]}, "B": {"aliases": ["X"]}})
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("✅ Lexicon lookup tests passed!")
+
+def test_lexicon_index():
+    print("🧪 Testing binary lexicon index...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "ingredients.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(ENTRIES, f)
+        
+        index_path = build_index(json_path)
+        source = Lexicon.from_json(json_path)
+        
+        for use_mmap in (True, False):
+            with LexiconIndex(index_path, use_mmap=use_mmap) as index:
+                assert index.digest == source.digest
+                assert len(index) == 2
+                assert index.lookup("ascorbic acid") == ("Vitamin C", {"benefit": "Brightens"})
+                assert index.canonical("VITAMIN B3") == "Niacinamide"
+                assert index.get("Retinol") is None
+                assert "retinol" not in index
+        
+        # A JSON path picks up its up-to-date index
+        loaded = load_lexicon(json_path, use_mmap=False)
+        assert isinstance(loaded, LexiconIndex)
+        loaded.close()
+    
+    print("✅ Lexicon index tests passed!")
+
+def test_blocks_use_aliases():
+    print("🧪 Testing lexicon-backed blocks...")
+    
+    raw_data = {
+        "Product Name": "GlowBoost Vitamin C Serum",
+        "Concentration": "10% Vitamin C",
+        "Skin Type": "Oily, Combination",
+        "Key Ingredients": "Ascorbic Acid, sodium hyaluronate",
+        "Benefits": "brightening, Fades dark spots",
+        "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": "₹699"
+    }
+    product = ParserAgent().process(raw_data)
+    results = ContentBlockManager().apply_blocks(product, ["ingredients", "benefits"])
+    
+    ingredients = results["ingredients"]["ingredients"]
+    assert ingredients[0]["name"] == "Ascorbic Acid"
+    assert ingredients[0]["benefit"] == "Powerful antioxidant that brightens skin"
+    assert ingredients[1]["purpose"] == "Locks in moisture, plumps skin"
+    assert results["benefits"]["key_benefit"] == "Enhances skin radiance and glow"
+    assert results["benefits"]["total_benefits"] == 4
+    
+    print("✅ Lexicon-backed block tests passed!")
+
+if __name__ == "__main__":
+    test_lexicon_lookup()
+    test_lexicon_index()
+    test_blocks_use_aliases()
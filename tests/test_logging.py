@@ -0,0 +1,64 @@
+import sys
+import os
+import io
+import logging
+import contextlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.orchestration.workflow import build_content_workflow
+from src.utils.logging_config import configure_logging, PACKAGE_LOGGER
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+def run_batch(verbosity):
+    log_stream, stdout = io.StringIO(), io.StringIO()
+    configure_logging(verbosity, stream=log_stream)
+    catalog = [dict(RAW_DATA, **{"Product Name": f"GlowBoost Variant {i}"}) for i in range(3)]
+    with contextlib.redirect_stdout(stdout):
+        results = list(build_content_workflow().execute_many(catalog))
+    assert len(results) == 3
+    return log_stream.getvalue(), stdout.getvalue()
+
+def test_quiet_batch():
+    print("🧪 Testing logging verbosity...")
+    
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    saved = (list(logger.handlers), logger.level, logger.propagate)
+    try:
+        # Quiet: nothing at all per product
+        log, stdout = run_batch("quiet")
+        assert log == "" and stdout == ""
+        
+        # Normal: node progress only
+        log, stdout = run_batch("normal")
+        assert stdout == ""
+        assert log.count("✅ parser completed") == 3
+        assert "Applied:" not in log
+        
+        # Verbose: every block and template step
+        log, _ = run_batch("verbose")
+        assert log.count("Applied: format-price-block") == 3
+        assert "Rendering faq template" in log
+        
+        # Reconfiguring replaces the handler instead of stacking another one
+        configure_logging("quiet")
+        configure_logging("quiet")
+        assert sum(getattr(h, "_configured_by_package", False) for h in logger.handlers) == 1
+    finally:
+        logger.handlers[:] = saved[0]
+        logger.setLevel(saved[1])
+        logger.propagate = saved[2]
+    
+    print("✅ Logging verbosity tests passed!")
+
+if __name__ == "__main__":
+    test_quiet_batch()
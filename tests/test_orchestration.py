@@ -0,0 +1,308 @@
+import sys
+import os
+import threading
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.parser_agent import ParserAgent
+from src.agents.question_generator_agent import QuestionGeneratorAgent
+from src.agents.template_agents import FAQTemplateAgent, ProductTemplateAgent, ComparisonTemplateAgent
+from src.logic_blocks.manager import ContentBlockManager
+from src.logic_blocks.lexicon import Lexicon
+from src.orchestration.dag import DAGOrchestrator
+from src.orchestration.models import NodeStatus
+from src.orchestration.inputs import ContextKey, Projection, InputMapping
+from src.orchestration.workflow import build_content_workflow
+from src.utils.cache import LRUCache
+from src.utils.output import PageStreamWriter
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+
+class BarrierAgent:
+    """Returns only once every node sharing its barrier is running at the same time"""
+
+    def __init__(self, barrier=None):
+        self.barrier = barrier
+
+    def process(self, data):
+        if self.barrier is not None:
+            # Raises BrokenBarrierError after the timeout if the others never start
+            self.barrier.wait()
+        return True
+
+
+def build_orchestrator(**kwargs):
+    orchestrator = DAGOrchestrator(**kwargs)
+    orchestrator.add_node("parser", ParserAgent())
+    orchestrator.add_node("question_generator", QuestionGeneratorAgent(), ["parser"])
+    orchestrator.add_node("content_blocks", ContentBlockManager(), ["parser"])
+    orchestrator.add_node("faq_template", FAQTemplateAgent(), ["question_generator", "content_blocks"])
+    orchestrator.add_node("product_template", ProductTemplateAgent(), ["content_blocks"])
+    orchestrator.add_node("comparison_template", ComparisonTemplateAgent(), ["content_blocks"])
+    return orchestrator
+
+
+def strip_timestamps(page):
+    content = dict(page["content"])
+    content.pop("last_updated", None)
+    return {key: value for key, value in page.items() if key != "generated_at"} | {"content": content}
+
+
+def test_parallel_execution():
+    print("🧪 Testing parallel DAG execution...")
+
+    sequential = build_orchestrator().execute({"initial_data": RAW_DATA})
+
+    for executor in ("thread", "process"):
+        with build_orchestrator(parallel=True, max_workers=2, executor=executor) as orchestrator:
+            results = orchestrator.execute({"initial_data": RAW_DATA})
+
+            for page in ("faq", "product_page", "comparison_page"):
+                assert strip_timestamps(results[page]) == strip_timestamps(sequential[page])
+
+            assert all(node.status == NodeStatus.COMPLETED for node in orchestrator.nodes.values())
+            assert all(node.completed_at >= node.started_at for node in orchestrator.nodes.values())
+            completed = [entry["node"] for entry in orchestrator.context.execution_log if entry["status"] == "completed"]
+            assert sorted(completed) == sorted(orchestrator.nodes)
+            # The workflow report carries the whole log, not just the last entries
+            summary = results["metadata"]["execution_summary"]
+            assert summary["execution_log"] == orchestrator.context.execution_log
+            assert summary["total_steps"] == len(summary["execution_log"]) > 5
+
+    # Independent branches overlap: each waits for the other to be running,
+    # which only completes if both run at once
+    branches = threading.Barrier(2, timeout=5)
+    with DAGOrchestrator(parallel=True, max_workers=2) as orchestrator:
+        orchestrator.add_node("root", BarrierAgent())
+        orchestrator.add_node("left", BarrierAgent(branches), ["root"])
+        orchestrator.add_node("right", BarrierAgent(branches), ["root"])
+        orchestrator.add_node("join", BarrierAgent(), ["left", "right"])
+
+        orchestrator.execute({"initial_data": {}})
+
+        assert not branches.broken
+        assert all(node.status == NodeStatus.COMPLETED for node in orchestrator.nodes.values())
+
+    print("✅ Parallel workflow matches sequential output and runs independent branches concurrently")
+
+
+def test_batch_execution():
+    print("🧪 Testing batch execution...")
+
+    catalog = [dict(RAW_DATA, **{"Product Name": f"GlowBoost Variant {i}"}) for i in range(3)]
+    catalog.insert(1, {"Product Name": "Broken record"})
+
+    orchestrator = build_content_workflow()
+    parser_agent = orchestrator.nodes["parser"].agent
+
+    results = list(orchestrator.execute_many(catalog))
+
+    assert len(results) == 4
+    assert "error" in results[1] and results[1]["metadata"]["batch_index"] == 1
+    titles = [r["product_page"]["content"]["header"]["title"] for i, r in enumerate(results) if i != 1]
+    assert titles == ["GlowBoost Variant 0", "GlowBoost Variant 1", "GlowBoost Variant 2"]
+    assert orchestrator.nodes["parser"].agent is parser_agent
+
+    print(f"✅ Batch of {len(results)} products processed with one DAG")
+
+
+def test_incremental_execution():
+    print("🧪 Testing incremental execution...")
+
+    orchestrator = build_content_workflow(result_store=LRUCache())
+
+    first = orchestrator.execute({"initial_data": RAW_DATA})
+    assert first["metadata"]["reused_nodes"] == []
+
+    # Same inputs: every node is reused and the pages are identical objects
+    second = orchestrator.execute({"initial_data": RAW_DATA})
+    assert sorted(second["metadata"]["reused_nodes"]) == sorted(orchestrator.nodes)
+    assert second["metadata"]["unchanged_pages"] == ["faq", "product_page", "comparison_page"]
+    assert second["product_page"] is first["product_page"]
+
+    # Price-only change: the pages quoting the price are rebuilt
+    repriced = orchestrator.execute({"initial_data": dict(RAW_DATA, Price="₹1299")})
+    assert "product_page" not in repriced["metadata"]["unchanged_pages"]
+    assert "comparison_page" not in repriced["metadata"]["unchanged_pages"]
+    assert repriced["product_page"]["content"]["pricing"]["price"] == "₹1299"
+    assert orchestrator.nodes["product_template"].status == NodeStatus.COMPLETED
+
+    print(f"✅ Reused {len(second['metadata']['reused_nodes'])} nodes on an unchanged re-run")
+
+
+def test_incremental_agent_config_change():
+    print("🧪 Testing incremental execution after an agent config change...")
+
+    orchestrator = build_orchestrator(result_store=LRUCache())
+    orchestrator.execute({"initial_data": RAW_DATA})
+
+    # Same inputs, but agents configured differently: their stored outputs are stale
+    lexicon = Lexicon({"Brightening": {"statements": ["Visibly brighter skin"]}})
+    orchestrator.nodes["content_blocks"].agent = ContentBlockManager(benefit_lexicon=lexicon)
+    question_gen = QuestionGeneratorAgent()
+    question_gen.question_templates["Usage"] = ["Is {name} a morning product?"]
+    question_gen.compile()
+    orchestrator.nodes["question_generator"].agent = question_gen
+    orchestrator.nodes["product_template"].agent = ProductTemplateAgent(fragments=True)
+
+    results = orchestrator.execute({"initial_data": RAW_DATA})
+    reused = results["metadata"]["reused_nodes"]
+    assert "content_blocks" not in reused
+    assert "question_generator" not in reused
+    assert "product_template" not in reused
+    assert "parser" in reused
+    assert orchestrator.context.get("content_blocks")["benefits"]["primary_benefits"][0] == "Visibly brighter skin"
+    questions = orchestrator.context.get("question_generator")
+    assert "Is GlowBoost Vitamin C Serum a morning product?" in [q.question for q in questions]
+
+    print("✅ Reconfigured agents are re-run instead of reused")
+
+
+
+def test_streaming_pages():
+    print("🧪 Testing streamed page output...")
+
+    catalog = [dict(RAW_DATA, **{"Product Name": f"GlowBoost Variant {i}"}) for i in range(5)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with PageStreamWriter(tmp) as writer:
+            orchestrator = build_content_workflow(page_sink=writer)
+            results = list(orchestrator.execute_many(catalog))
+
+        # Pages were written out and released, not returned
+        assert all("product_page" not in result for result in results)
+        assert results[0]["metadata"]["streamed_pages"] == ["faq", "product_page", "comparison_page"]
+        assert not orchestrator.context.has("product_template")
+        assert orchestrator.nodes["product_template"].output is None
+        assert writer.counts == {"faq": 5, "product_page": 5, "comparison_page": 5}
+
+        with open(os.path.join(tmp, "product_page.jsonl"), encoding="utf-8") as f:
+            titles = [json.loads(line)["content"]["header"]["title"] for line in f]
+        assert titles == [f"GlowBoost Variant {i}" for i in range(5)]
+
+        # Sharded layout rotates files every shard_size documents
+        sharded_dir = os.path.join(tmp, "sharded")
+        with PageStreamWriter(sharded_dir, layout="sharded", shard_size=2) as writer:
+            list(build_content_workflow(page_sink=writer).execute_many(catalog))
+        assert sorted(os.listdir(os.path.join(sharded_dir, "faq"))) == [
+            "part-00000.jsonl", "part-00001.jsonl", "part-00002.jsonl"
+        ]
+
+        # A shorter re-run does not leave the old higher-numbered parts behind
+        with PageStreamWriter(sharded_dir, layout="sharded", shard_size=5) as writer:
+            list(build_content_workflow(page_sink=writer).execute_many(catalog))
+        assert os.listdir(os.path.join(sharded_dir, "faq")) == ["part-00000.jsonl"]
+
+    print(f"✅ Streamed {sum(writer.counts.values())} pages without keeping them in memory")
+
+
+def test_shared_template_inputs():
+    print("🧪 Testing shared read-only template inputs...")
+
+    orchestrator = build_content_workflow()
+    orchestrator.execute({"initial_data": RAW_DATA})
+    inputs = [orchestrator._prepare_node_input(orchestrator.nodes[name])
+              for name in ("faq_template", "product_template", "comparison_template")]
+
+    # Derived once per workflow and shared instead of copied per template
+    assert inputs[1] is inputs[2]
+    assert inputs[0]["product_info"] is inputs[1]["product_info"]
+    assert inputs[0]["content_blocks"] == inputs[1]["content_blocks"]
+    assert inputs[0]["product_a"] is inputs[0]["product_info"]
+    assert inputs[0]["product_info"]["name"] == "GlowBoost Vitamin C Serum"
+    assert isinstance(inputs[0]["questions"], tuple)
+    # Only the FAQ depends on question_generator, so only it sees the questions
+    assert "questions" not in inputs[1]
+
+    # Dependents cannot modify what other nodes read
+    for mapping in (inputs[0], inputs[0]["product_info"], inputs[0]["questions"][0], orchestrator.context.view()):
+        try:
+            mapping["name"] = "changed"
+            assert False, "read-only view was modified"
+        except TypeError:
+            pass
+
+    # A new run starts with a new context
+    orchestrator.execute({"initial_data": dict(RAW_DATA, **{"Product Name": "GlowBoost Night Serum"})})
+    fresh = orchestrator._prepare_node_input(orchestrator.nodes["faq_template"])
+    assert fresh is not inputs[0]
+    assert fresh["product_info"]["name"] == "GlowBoost Night Serum"
+
+    print("✅ Template nodes share one read-only input per workflow")
+
+
+def test_declared_inputs():
+    print("🧪 Testing declarative node inputs...")
+
+    class EchoAgent:
+        def process(self, data):
+            return data
+
+    calls = []
+
+    def upper_name(context):
+        calls.append(1)
+        return context.get("source")["name"].upper()
+
+    shout = Projection("shout", upper_name, ("source",))
+    page_input = InputMapping("page", {"shout": shout, "missing": ContextKey("nowhere")}, required=("shout",))
+
+    orchestrator = DAGOrchestrator()
+    orchestrator.add_node("source", EchoAgent(), inputs=ContextKey("initial_data"))
+    orchestrator.add_node("a", EchoAgent(), ["source"], inputs=shout)
+    orchestrator.add_node("b", EchoAgent(), ["source"], inputs=page_input)
+    orchestrator.add_node("c", EchoAgent(), ["source"], inputs=page_input)
+    orchestrator.execute({"initial_data": {"name": "glowboost"}})
+
+    # The projection is computed once and shared by every consumer
+    assert calls == [1]
+    assert orchestrator.nodes["a"].output == "GLOWBOOST"
+    assert dict(orchestrator.nodes["b"].output) == {"shout": "GLOWBOOST"}
+    assert orchestrator.nodes["b"].output is orchestrator.nodes["c"].output
+
+    # A required input that is not in the context fails the node
+    orchestrator = DAGOrchestrator()
+    orchestrator.add_node("lonely", EchoAgent(), inputs=ContextKey("parser"))
+    try:
+        orchestrator.execute({"initial_data": {}})
+        assert False, "missing input was not reported"
+    except LookupError as e:
+        assert "'parser' output not available for lonely" in str(e)
+    assert orchestrator.nodes["lonely"].status == NodeStatus.FAILED
+
+    # Outputs of nodes that are not dependencies are never read, even when
+    # they happen to be in the context already, so inputs (and fingerprints)
+    # do not depend on scheduling
+    orchestrator = DAGOrchestrator()
+    orchestrator.add_node("source", EchoAgent(), inputs=ContextKey("initial_data"))
+    orchestrator.add_node("side", EchoAgent(), inputs=ContextKey("initial_data"))
+    orchestrator.add_node("page", EchoAgent(), ["source"], inputs=page_input)
+    orchestrator.add_node("everything", EchoAgent(), ["source"])
+    orchestrator.execute({"initial_data": {"name": "glowboost"}})
+    orchestrator.context.set("nowhere", "late")
+    page = orchestrator.nodes["page"]
+    assert dict(orchestrator._prepare_node_input(page)) == {"shout": "GLOWBOOST"}
+    assert set(orchestrator.nodes["everything"].output) == {"initial_data", "source"}
+
+    print("✅ Declared inputs resolved once per run")
+
+
+if __name__ == "__main__":
+    test_parallel_execution()
+    test_batch_execution()
+    test_incremental_execution()
+    test_incremental_agent_config_change()
+    test_streaming_pages()
+    test_shared_template_inputs()
+    test_declared_inputs()
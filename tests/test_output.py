@@ -0,0 +1,96 @@
+import sys
+import os
+import json
+import stat
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.orchestration.workflow import build_content_workflow
+from src.utils.output import atomic_write, read_jsonl, FileSink, BundleSink
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+class Unserializable:
+    pass
+
+def test_atomic_write():
+    print("🧪 Testing atomic writes...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "page.json")
+        atomic_write(path, b'{"version": 1}', fsync=True)
+        atomic_write(path, b'{"version": 2}')
+        with open(path, "rb") as f:
+            assert f.read() == b'{"version": 2}'
+        
+        # The file gets the mode open() would give it under the current umask
+        umask = os.umask(0o027)
+        try:
+            atomic_write(path, b'{"version": 2}')
+        finally:
+            os.umask(umask)
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+        
+        # A failed write leaves the previous file and no temp files behind
+        sink = FileSink(tmp, fsync="file")
+        sink.write("page", {"version": 3})
+        try:
+            sink.write("page", {"version": Unserializable()})
+            assert False, "Expected TypeError"
+        except TypeError:
+            pass
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == {"version": 3}
+        assert os.listdir(tmp) == ["page.json"]
+    
+    print("✅ Atomic write tests passed!")
+
+def test_bundle_sink():
+    print("🧪 Testing bundle sink...")
+    
+    catalog = [dict(RAW_DATA, **{"Product Name": f"GlowBoost Variant {i}"}) for i in range(5)]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for compression, suffix in ((None, ".jsonl"), ("gzip", ".jsonl.gz")):
+            bundle_dir = os.path.join(tmp, compression or "plain")
+            with BundleSink(bundle_dir, bundle_size=2, fsync="batch", compression=compression) as sink:
+                list(build_content_workflow(page_sink=sink).execute_many(catalog))
+            
+            # 5 pages in bundles of 2; the partial bundle is written on close
+            files = sorted(os.listdir(os.path.join(bundle_dir, "product_page")))
+            assert files == [f"bundle-0000{i}{suffix}" for i in range(3)]
+            
+            titles = [
+                page["content"]["header"]["title"]
+                for name in files
+                for page in read_jsonl(os.path.join(bundle_dir, "product_page", name))
+            ]
+            assert titles == [f"GlowBoost Variant {i}" for i in range(5)]
+            assert sink.counts == {"faq": 5, "product_page": 5, "comparison_page": 5}
+        
+        # A shorter re-run replaces the old bundles instead of leaving extras
+        bundle_dir = os.path.join(tmp, "plain")
+        with BundleSink(bundle_dir, bundle_size=5, compression="gzip") as sink:
+            list(build_content_workflow(page_sink=sink).execute_many(catalog))
+        assert os.listdir(os.path.join(bundle_dir, "product_page")) == ["bundle-00000.jsonl.gz"]
+        
+        try:
+            BundleSink(tmp, fsync="sometimes")
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+    
+    print("✅ Bundle sink tests passed!")
+
+if __name__ == "__main__":
+    test_atomic_write()
+    test_bundle_sink()
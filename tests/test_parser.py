@@ -1,8 +1,11 @@
 import sys
 import os
+import subprocess
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from pydantic import ValidationError
 from src.agents.parser_agent import ParserAgent
+from src.models.records import ProductRecord
 
 def test_parser_agent():
     raw_data = {
@@ -27,6 +30,84 @@ def test_parser_agent():
     assert "699" in product.price
     
     print("✅ ParserAgent test passed!")
+
+def test_columnar_parser():
+    raw_data = {
+        "Product Name": "GlowBoost Vitamin C Serum",
+        "Concentration": "10% Vitamin C", 
+        "Skin Type": "Oily, Combination",
+        "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+        "Benefits": "Brightening, Fades dark spots",
+        "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": "₹699"
+    }
+    rows = [
+        raw_data,
+        dict(raw_data, **{"Product Name": "Second", "Benefits": ["Hydration", "Glow"]}),
+        dict(raw_data, **{"Skin Type": " Dry ,Sensitive "})
+    ]
+    
+    parser = ParserAgent()
+    batch = parser.process_batch(rows)
+    
+    assert [p.model_dump(exclude={"timestamp"}) for p in batch] == \
+           [parser.validate(row).model_dump(exclude={"timestamp"}) for row in rows]
+    assert batch[2].skin_type == ["Dry", "Sensitive"]
+    assert batch[0].model_fields_set == parser.validate(raw_data).model_fields_set
+    # Rows with the same list cell still get their own list
+    assert batch[0].skin_type is not batch[1].skin_type
+    
+    # Bad rows surface the same validation error as the per-row path
+    try:
+        parser.process_batch([raw_data, {"Product Name": "Missing fields"}])
+        assert False, "Expected ValidationError"
+    except ValidationError:
+        pass
+    
+    print("✅ Columnar parser matches per-row parsing!")
+
+def test_compact_parse_skips_pydantic():
+    raw_data = {
+        "Product Name": "GlowBoost Vitamin C Serum",
+        "Concentration": "10% Vitamin C", 
+        "Skin Type": "Oily, Combination",
+        "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+        "Benefits": "Brightening, Fades dark spots",
+        "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": "₹699"
+    }
+    parser = ParserAgent(compact=True)
+    
+    # Well-typed rows and rows pydantic has to coerce give the same record
+    for row in (raw_data, dict(raw_data, Benefits=("Brightening", "Fades dark spots"))):
+        record = parser.process(row)
+        assert isinstance(record, ProductRecord)
+        assert record.to_model().model_dump(exclude={"timestamp"}) == \
+               ParserAgent().validate(row).model_dump(exclude={"timestamp"})
+    
+    try:
+        parser.process(dict(raw_data, Price=699))
+        assert False, "Expected ValidationError"
+    except ValidationError:
+        pass
+    
+    # A fresh interpreter running the whole compact workflow never loads pydantic
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = (
+        "import sys, main\n"
+        "from src.orchestration import build_content_workflow\n"
+        f"build_content_workflow().execute({{'initial_data': {raw_data!r}}})\n"
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in ('pydantic', 'asyncio', 'multiprocessing')))"
+    )
+    loaded = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True,
+                            text=True, check=True).stdout.strip()
+    assert loaded == "[]", loaded
+    
+    print("✅ Compact parsing skips pydantic for well-typed rows!")
     
 if __name__ == "__main__":
-    test_parser_agent()
\ No newline at end of file
+    test_parser_agent()
+    test_columnar_parser()
+    test_compact_parse_skips_pydantic()
\ No newline at end of file
@@ -4,6 +4,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.agents.parser_agent import ParserAgent
 from src.agents.question_generator_agent import QuestionGeneratorAgent
+from src.models.records import ProductRecord, FAQRecord
 
 def test_question_generator():
     raw_data = {
@@ -38,5 +39,81 @@ def test_question_generator():
     
     return True
 
+def test_compact_records():
+    raw_data = {
+        "Product Name": "GlowBoost Vitamin C Serum",
+        "Concentration": "10% Vitamin C", 
+        "Skin Type": "Oily, Combination",
+        "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+        "Benefits": "Brightening, Fades dark spots",
+        "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": "₹699"
+    }
+    
+    product = ParserAgent().process(raw_data)
+    record = ParserAgent(compact=True).process(raw_data)
+    
+    assert isinstance(record, ProductRecord)
+    assert not hasattr(record, "__dict__")
+    assert record.to_model().model_dump(exclude={"timestamp"}) == product.model_dump(exclude={"timestamp"})
+    # Unhashable, like the pydantic models it mirrors
+    for value in (record, product):
+        try:
+            hash(value)
+            assert False, f"{type(value).__name__} should not be hashable"
+        except TypeError:
+            pass
+    
+    questions = QuestionGeneratorAgent().process(product)
+    compact_questions = QuestionGeneratorAgent(compact=True).process(record)
+    
+    assert all(isinstance(q, FAQRecord) for q in compact_questions)
+    assert [q.model_dump() for q in compact_questions] == [q.model_dump() for q in questions]
+    assert compact_questions[0].to_model() == questions[0]
+    
+    print("✅ Compact records match pydantic models")
+
+def test_process_many():
+    raw_data = {
+        "Product Name": "GlowBoost Vitamin C Serum",
+        "Concentration": "10% Vitamin C", 
+        "Skin Type": "Oily, Combination",
+        "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+        "Benefits": "Brightening, Fades dark spots",
+        "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+        "Side Effects": "Mild tingling for sensitive skin",
+        "Price": "₹699"
+    }
+    
+    parser = ParserAgent()
+    products = [parser.process(dict(raw_data, **{"Product Name": f"Serum {i}"})) for i in range(3)]
+    
+    question_gen = QuestionGeneratorAgent()
+    batch = question_gen.process_many(products)
+    
+    assert len(batch) == 3
+    for product, questions in zip(products, batch):
+        assert [q.model_dump() for q in questions] == [q.model_dump() for q in question_gen.process(product)]
+        
+        # Compiled plan renders exactly what str.format would
+        expected = [
+            template.format(name=product.name, concentration=product.concentration,
+                            skin_types=", ".join(product.skin_type))
+            for templates in question_gen.question_templates.values()
+            for template in templates[:3]
+        ]
+        assert [q.question for q in questions] == expected
+    
+    # Templates using other placeholders go through the format fallback
+    question_gen.question_templates["Usage"][0] = "Is {name} right for {skin_types} skin?"
+    question_gen.compile()
+    usage = [q for q in question_gen.process(products[0]) if q.category == "Usage"]
+    assert usage[0].question == "Is Serum 0 right for Oily, Combination skin?"
+    
+    print("✅ process_many matches per-product generation")
+
 if __name__ == "__main__":
-    test_question_generator()
\ No newline at end of file
+    test_question_generator()
+    test_compact_records()
+    test_process_many()
\ No newline at end of file
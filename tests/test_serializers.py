@@ -0,0 +1,148 @@
+import sys
+import os
+import io
+import json
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.parser_agent import ParserAgent
+from src.orchestration.models import NodeStatus
+from src.utils.json_utils import JSONOutputFormatter
+from src.utils.serializers import get_serializer, available_serializers, StdlibSerializer, Fragment
+from src.templates.manager import get_template_registry
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+def test_serializer_backends():
+    print("🧪 Testing serializer backends...")
+    
+    document = {
+        "name": "GlowBoost",
+        "price": "₹699",
+        "generated_at": datetime(2025, 1, 2, 3, 4, 5, 6),
+        "status": NodeStatus.COMPLETED,
+        "product": ParserAgent(compact=True).process(RAW_DATA),
+        "tags": ["a", "b"]
+    }
+    expected = json.loads(StdlibSerializer().dumps(document))
+    assert expected["generated_at"] == "2025-01-02T03:04:05.000006"
+    assert expected["status"] == NodeStatus.COMPLETED.value
+    assert expected["product"]["name"] == "GlowBoost Vitamin C Serum"
+    
+    backends = [name for name, available in available_serializers().items() if available]
+    assert "stdlib" in backends
+    
+    for name in backends:
+        serializer = get_serializer(name)
+        compact = serializer.dumps(document)
+        pretty = serializer.dumps(document, pretty=True)
+        
+        # Same data from every backend; compact has no whitespace, pretty is indented
+        assert json.loads(compact) == expected
+        assert json.loads(pretty) == expected
+        assert b"\n" not in compact and b'\n  "name"' in pretty
+        assert "₹699".encode("utf-8") in compact
+        assert serializer.loads(compact) == expected
+        fp = io.BytesIO()
+        serializer.dump(document, fp)
+        assert fp.getvalue() == compact
+        print(f"   ✅ {name}")
+    
+    assert get_serializer("auto").name == backends[0]
+    try:
+        get_serializer("yaml")
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    
+    print("✅ Serializer backend tests passed!")
+
+def test_save_json():
+    print("🧪 Testing JSONOutputFormatter.save_json...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "nested", "page.json")
+        JSONOutputFormatter.save_json({"when": datetime(2025, 1, 1)}, path, serializer=get_serializer("stdlib"))
+        with open(path, encoding="utf-8") as f:
+            assert f.read() == '{\n  "when": "2025-01-01T00:00:00"\n}'
+        assert JSONOutputFormatter.validate_json(path)
+    
+    print("✅ save_json tests passed!")
+
+def test_fragments_spliced():
+    print("🧪 Testing pre-encoded fragments...")
+    
+    product_b = Fragment({"name": "DermaGlow", "pros": ["Gentle", "Unscented"], "size": {"ml": 30}})
+    static = Fragment({"texture": "Lightweight", "fragrance": "Unscented"}, members=True)
+    document = {
+        "products": [{"name": "GlowBoost"}, product_b],
+        "alternative": product_b,
+        "specifications": {"concentration": "10%", **static.members()},
+        "empty": Fragment([]),
+        "generated_at": datetime(2025, 1, 1)
+    }
+    expected = {
+        "products": [{"name": "GlowBoost"}, product_b.value],
+        "alternative": product_b.value,
+        "specifications": {"concentration": "10%", **static.value},
+        "empty": [],
+        "generated_at": datetime(2025, 1, 1)
+    }
+    
+    backends = [name for name, available in available_serializers().items() if available]
+    for name in backends:
+        serializer = get_serializer(name)
+        for pretty in (False, True):
+            assert serializer.dumps(document, pretty=pretty) == serializer.dumps(expected, pretty=pretty), name
+    
+    # Encoders that cannot splice reject fragments instead of writing placeholders
+    try:
+        json.dumps({"alternative": product_b})
+        assert False, "json.dumps accepted a Fragment"
+    except TypeError:
+        pass
+    
+    # Fragment-mode templates render the same bytes
+    data = {
+        "product_info": {"name": "GlowBoost Vitamin C Serum", "concentration": "10% Vitamin C",
+                         "skin_type": ["Oily"], "price": 699},
+        "product_a": {"name": "GlowBoost Vitamin C Serum", "skin_type": ["Oily"]},
+        "content_blocks": {"price": {"display_price": "₹699"}}
+    }
+    serializer = get_serializer("stdlib")
+    for name in ("product_page", "comparison_page"):
+        plain = get_template_registry()[name].render(data)
+        spliced = get_template_registry(fragments=True)[name].render(data)
+        spliced["generated_at"] = plain["generated_at"]
+        assert serializer.dumps(spliced) == serializer.dumps(plain)
+
+    # Input strings equal to a fragment key or a placeholder are written as plain strings
+    template = get_template_registry(fragments=True)["product_page"]
+    fragment_key = next(iter(template._static_specifications))
+    lookalikes = [fragment_key, "\x00fragment:0123456789abcdef:0\x00"]
+    for name in backends:
+        serializer = get_serializer(name)
+        for lookalike in lookalikes:
+            page = template.render(dict(data, product_info=dict(data["product_info"], name=lookalike)))
+            for pretty in (False, True):
+                assert serializer.loads(serializer.dumps(page, pretty=pretty))["content"]["header"]["title"] == lookalike, name
+        document = {fragment_key: product_b, "spread": {**static.members()}, "text": fragment_key}
+        assert serializer.loads(serializer.dumps(document)) == \
+               {fragment_key: product_b.value, "spread": static.value, "text": fragment_key}, name
+
+    print("✅ Fragment tests passed!")
+
+if __name__ == "__main__":
+    test_serializer_backends()
+    test_save_json()
+    test_fragments_spliced()
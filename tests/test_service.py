@@ -0,0 +1,130 @@
+import sys
+import os
+import json
+import socket
+import tempfile
+import threading
+from http.client import HTTPConnection
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.service.server import ContentService, make_server, parse_address
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+
+class UnixHTTPConnection(HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+def start(address, **service_options):
+    server = make_server(address, **service_options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def stop(server):
+    server.shutdown()
+    server.server_close()
+    server.service.close()
+
+def request(conn, method, path, payload=None):
+    body = None if payload is None else json.dumps(payload).encode("utf-8")
+    headers = {} if body is None else {"Content-Type": "application/json"}
+    conn.request(method, path, body=body, headers=headers)
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+def test_generate_single_and_batch():
+    server = start(("127.0.0.1", 0))
+    try:
+        conn = HTTPConnection(*server.server_address)
+
+        status, result = request(conn, "POST", "/generate", RAW_DATA)
+        assert status == 200
+        assert set(result) >= {"faq", "product_page", "comparison_page", "metadata"}
+        assert result["product_page"]["content"]["header"]["title"] == "GlowBoost Vitamin C Serum"
+
+        # Keep-alive: later requests reuse the same connection
+        sock = conn.sock
+        invalid = {"Product Name": "Missing fields"}
+        status, batch = request(conn, "POST", "/generate", [RAW_DATA, invalid, RAW_DATA])
+        assert status == 200 and conn.sock is sock
+        results = batch["results"]
+        assert len(results) == 3 and "error" in results[1]
+        assert results[2]["faq"]["content"] == result["faq"]["content"]
+
+        status, error = request(conn, "POST", "/generate", invalid)
+        assert status == 422 and error["error"] == "validation_failed"
+        assert {tuple(detail["loc"]) for detail in error["details"]} >= {("price",), ("benefits",)}
+
+        status, _ = request(conn, "GET", "/missing")
+        assert status == 404 and conn.sock is sock
+        conn.close()
+    finally:
+        stop(server)
+
+    print("✅ Service generates single and batched products over keep-alive!")
+
+def test_metrics_and_health():
+    server = start(("127.0.0.1", 0), serializer="stdlib", trace_stages=True)
+    try:
+        conn = HTTPConnection(*server.server_address)
+        for _ in range(3):
+            request(conn, "POST", "/generate", RAW_DATA)
+        request(conn, "POST", "/generate", [RAW_DATA, RAW_DATA])
+
+        status, health = request(conn, "GET", "/health")
+        assert status == 200 and health["status"] == "ok" and health["serializer"] == "stdlib"
+
+        status, metrics = request(conn, "GET", "/metrics")
+        assert status == 200
+        assert metrics["requests"] == 5 and metrics["errors"] == 0 and metrics["products"] == 5
+        single = metrics["latency"]["POST /generate"]
+        assert single["count"] == 3 and 0 < single["p50_ms"] <= single["p99_ms"]
+        assert metrics["latency"]["POST /generate (batch)"]["count"] == 1
+        assert metrics["stages"]["node"]["parser"]["count"] == 5
+        conn.close()
+    finally:
+        stop(server)
+
+    print("✅ Service reports request latency percentiles!")
+
+def test_unix_socket():
+    assert parse_address("unix:/tmp/content.sock") == "/tmp/content.sock"
+    assert parse_address(":8080") == ("127.0.0.1", 8080)
+    assert parse_address("0.0.0.0:80") == ("0.0.0.0", 80)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "content.sock")
+        server = start(path, service=ContentService())
+        try:
+            conn = UnixHTTPConnection(path)
+            status, result = request(conn, "POST", "/generate", RAW_DATA)
+            assert status == 200 and "faq" in result
+            status, health = request(conn, "GET", "/health")
+            assert status == 200 and health["status"] == "ok"
+            conn.close()
+        finally:
+            stop(server)
+        assert not os.path.exists(path)
+
+    print("✅ Service runs on a Unix socket!")
+
+if __name__ == "__main__":
+    test_generate_single_and_batch()
+    test_metrics_and_health()
+    test_unix_socket()
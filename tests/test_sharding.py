@@ -0,0 +1,36 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.orchestration.sharding import ShardedCatalogRunner
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+def test_sharded_runner():
+    print("🧪 Testing process-pool sharded catalog runner...")
+    
+    catalog = [dict(RAW_DATA, **{"Product Name": f"GlowBoost Variant {i}"}) for i in range(7)]
+    catalog[4] = {"Product Name": "Broken record"}
+    
+    with ShardedCatalogRunner(workers=2, shard_size=2) as runner:
+        results = list(runner.run(iter(catalog)))
+    
+    assert len(results) == 7
+    assert "error" in results[4]
+    titles = [r["product_page"]["content"]["header"]["title"] for i, r in enumerate(results) if i != 4]
+    assert titles == [f"GlowBoost Variant {i}" for i in (0, 1, 2, 3, 5, 6)]
+    assert results[0]["faq"]["content"]["total_questions"] == 15
+    
+    print(f"✅ {len(results)} products processed in order across worker processes")
+
+if __name__ == "__main__":
+    test_sharded_runner()
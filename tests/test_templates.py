@@ -5,7 +5,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.agents.parser_agent import ParserAgent
 from src.agents.question_generator_agent import QuestionGeneratorAgent
 from src.logic_blocks.manager import ContentBlockManager
-from src.templates.manager import TemplateManager
+from src.templates.manager import TemplateManager, get_template_registry
+from src.agents.template_agents import FAQTemplateAgent, ProductTemplateAgent
 
 def test_template_engine():
     print("🧪 Testing Template Engine...")
@@ -98,7 +99,86 @@ def test_template_engine():
     
     return all_results
 
+def test_render_many_and_shared_templates():
+    print("🧪 Testing shared templates and render_many...")
+    
+    parser = ParserAgent()
+    block_manager = ContentBlockManager()
+    data_list = []
+    for price in ("₹499", "₹699", "₹1299"):
+        product = parser.process({
+            "Product Name": "GlowBoost Vitamin C Serum",
+            "Concentration": "10% Vitamin C",
+            "Skin Type": "Oily, Combination",
+            "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+            "Benefits": "Brightening, Fades dark spots",
+            "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+            "Side Effects": "Mild tingling for sensitive skin",
+            "Price": price
+        })
+        data_list.append({
+            "product_info": {"name": product.name, "concentration": product.concentration,
+                             "skin_type": product.skin_type, "price": product.price},
+            "content_blocks": block_manager.apply_blocks(product)
+        })
+    
+    # Managers and agents reuse the same template instances
+    assert TemplateManager().templates["faq"] is get_template_registry()["faq"]
+    assert FAQTemplateAgent().manager is ProductTemplateAgent().manager
+    
+    pages = ProductTemplateAgent().process_many(data_list)
+    assert [page["page_type"] for page in pages] == ["product_page"] * 3
+    prices = [page["content"]["pricing"]["price"] for page in pages]
+    assert prices == [data["content_blocks"]["price"]["display_price"] for data in data_list]
+    assert len(set(prices)) == 3
+    
+    # A bad item yields an error entry without stopping the batch
+    pages = TemplateManager().render_many("faq", [data_list[0], {}])
+    assert "error" in pages[1] and len(pages) == 2
+    assert TemplateManager().render_many("missing", data_list)[0]["error"]
+    print("   ✅ render_many rendered each product in order")
+
+def test_compiled_static_parts():
+    print("🧪 Testing compiled template parts...")
+    
+    template_manager = TemplateManager()
+    comparison = template_manager.templates["comparison_page"]
+    faq = template_manager.templates["faq"]
+    data = {
+        "product_info": {"name": "GlowBoost Vitamin C Serum", "concentration": "10% Vitamin C",
+                         "skin_type": ["Oily"], "price": 699},
+        "product_a": {"name": "GlowBoost Vitamin C Serum", "skin_type": ["Oily"]},
+        "questions": [
+            {"id": "q1", "category": "Informational", "question": "What is GlowBoost?"},
+            {"id": "q2", "category": "Safety", "question": "Is it safe?"},
+            {"id": "q3", "category": "Safety", "question": "Any side effects?"}
+        ],
+        "content_blocks": {
+            "price": {"display_price": "₹699"},
+            "ingredients": {"ingredients": [{"name": "Vitamin C"}], "total_actives": 1},
+            "safety": {"side_effects": "Mild tingling", "recommendations": ["Patch test"]}
+        }
+    }
+    
+    # The fictional product B is built once and shared by every page
+    first = comparison.render(data)["content"]
+    second = comparison.render(data)["content"]
+    assert first["products"][1] is second["products"][1]
+    assert first["products"][1]["name"] == "DermaGlow Vitamin E Serum"
+    assert first["key_differences"][0]["winner"] == "A"
+    assert first["title"] == "Comparison: GlowBoost Vitamin C Serum vs DermaGlow Vitamin E Serum"
+    
+    # Answers match the per-question generator
+    page = faq.render(data)["content"]
+    answers = {q["id"]: q["answer"] for category in page["categories"] for q in category["questions"]}
+    for question in data["questions"]:
+        assert answers[question["id"]] == faq._generate_answer(question, data["content_blocks"])
+    assert answers["q1"] == "This is GlowBoost?. It contains 1 active ingredients."
+    print("   ✅ Static parts shared, dynamic slots filled")
+
 if __name__ == "__main__":
+    test_compiled_static_parts()
+    test_render_many_and_shared_templates()
     results = test_template_engine()
     
     # Save sample output to file
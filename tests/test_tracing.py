@@ -0,0 +1,82 @@
+import sys
+import os
+import json
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.orchestration.workflow import build_content_workflow
+from src.utils.tracing import (
+    Tracer, HistogramExporter, JSONLinesExporter, ChromeTraceExporter, get_tracer, NULL_TRACER
+)
+
+RAW_DATA = {
+    "Product Name": "GlowBoost Vitamin C Serum",
+    "Concentration": "10% Vitamin C",
+    "Skin Type": "Oily, Combination",
+    "Key Ingredients": "Vitamin C, Hyaluronic Acid",
+    "Benefits": "Brightening, Fades dark spots",
+    "How to Use": "Apply 2–3 drops in the morning before sunscreen",
+    "Side Effects": "Mild tingling for sensitive skin",
+    "Price": "₹699"
+}
+
+def test_histogram_percentiles():
+    print("🧪 Testing histogram percentiles...")
+    
+    histogram = HistogramExporter()
+    tracer = Tracer(histogram)
+    for duration_ms in range(1, 101):
+        tracer.record("stage", "node", 0, duration_ms * 1_000_000)
+    
+    stats = histogram.summary()["node"]["stage"]
+    assert stats["count"] == 100
+    assert stats["p50_ms"] == 50 and stats["p90_ms"] == 90 and stats["p99_ms"] == 99
+    assert stats["max_ms"] == 100 and stats["mean_ms"] == 50.5
+    
+    # Nothing is active outside a run
+    assert get_tracer() is NULL_TRACER
+    with tracer.activate():
+        assert get_tracer() is tracer
+    assert get_tracer() is NULL_TRACER
+    
+    print("✅ Histogram tests passed!")
+
+def test_workflow_tracing():
+    print("🧪 Testing workflow tracing...")
+    
+    catalog = [dict(RAW_DATA, **{"Product Name": f"GlowBoost Variant {i}"}) for i in range(3)]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        chrome_path = os.path.join(tmp, "trace.json")
+        jsonl_path = os.path.join(tmp, "trace.jsonl")
+        
+        for parallel in (False, True):
+            histogram = HistogramExporter()
+            tracer = Tracer(histogram, ChromeTraceExporter(chrome_path), JSONLinesExporter(jsonl_path))
+            with build_content_workflow(tracer=tracer, parallel=parallel, max_workers=2) as orchestrator:
+                list(orchestrator.execute_many(catalog))
+            tracer.close()
+            
+            # Nodes, blocks and templates are all timed, blocks/templates even inside pool threads
+            summary = histogram.summary()
+            assert set(summary) == {"workflow", "node", "block", "template"}
+            assert summary["node"]["content_blocks"]["count"] == 3
+            assert summary["block"]["format-price-block"]["count"] == 3
+            assert summary["template"]["faq"]["count"] == 3
+            assert orchestrator.nodes["parser"].duration_ns > 0
+            assert orchestrator.nodes["parser"].to_dict()["duration_ms"] > 0
+        
+        with open(chrome_path, encoding="utf-8") as f:
+            events = json.load(f)["traceEvents"]
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+        
+        with open(jsonl_path, encoding="utf-8") as f:
+            spans = [json.loads(line) for line in f]
+        # Both runs appended to the JSONL file
+        assert len(spans) == 2 * len(events)
+    
+    print(f"✅ Traced {len(events)} spans per run")
+
+if __name__ == "__main__":
+    test_histogram_percentiles()
+    test_workflow_tracing()